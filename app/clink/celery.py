@@ -2,11 +2,67 @@ import os
 
 from celery import Celery
 from django.conf import settings
+from kombu import Queue
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "clink.settings")
 
+EMAIL_QUEUE = "email"
+EMAIL_RETRY_QUEUE = "email_retry"
+RECOMPUTE_QUEUE = "recompute"
+MAINTENANCE_QUEUE = "maintenance"
+
+TASK_QUEUE_OPTIONS = {
+    EMAIL_QUEUE: {
+        "acks_late": True,
+        "reject_on_worker_lost": True,
+        "soft_time_limit": 55 * 60,
+        "time_limit": 60 * 60,
+    },
+    EMAIL_RETRY_QUEUE: {
+        "acks_late": True,
+        "reject_on_worker_lost": True,
+        "soft_time_limit": 60,
+        "time_limit": 90,
+    },
+    RECOMPUTE_QUEUE: {
+        "acks_late": True,
+        "reject_on_worker_lost": True,
+        "soft_time_limit": 10 * 60,
+        "time_limit": 11 * 60,
+    },
+    MAINTENANCE_QUEUE: {
+        "acks_late": True,
+        "reject_on_worker_lost": True,
+        "soft_time_limit": 3 * 60 * 60,
+        "time_limit": 4 * 60 * 60,
+    },
+}
+
+TASK_QUEUES = {
+    "finance.tasks.email_tasks.send_email_batch": EMAIL_QUEUE,
+    "finance.tasks.email_tasks.aggregate_email_batches": EMAIL_QUEUE,
+    "finance.tasks.email_tasks.send_weekly_reminders": EMAIL_QUEUE,
+    "finance.tasks.email_tasks.send_weekly_summaries": EMAIL_QUEUE,
+    "finance.tasks.email_tasks.send_monthly_summaries": EMAIL_QUEUE,
+    "finance.tasks.email_tasks.send_yearly_summaries": EMAIL_QUEUE,
+    "finance.tasks.email_retry_tasks.retry_failed_email": EMAIL_RETRY_QUEUE,
+    "finance.tasks.carry_over_tasks.process_carry_over_for_user": RECOMPUTE_QUEUE,
+    "finance.tasks.carry_over_tasks.process_month_end_carry_overs": MAINTENANCE_QUEUE,
+    "finance.tasks.import_tasks.import_transactions_file": MAINTENANCE_QUEUE,
+}
+
 app = Celery("clink")
 
 app.config_from_object("django.conf:settings", namespace="CELERY")
 
+app.conf.task_queues = [Queue(queue_name) for queue_name in TASK_QUEUE_OPTIONS]
+app.conf.task_default_queue = MAINTENANCE_QUEUE
+app.conf.task_routes = {
+    task_name: {"queue": queue_name} for task_name, queue_name in TASK_QUEUES.items()
+}
+app.conf.task_annotations = {
+    task_name: TASK_QUEUE_OPTIONS[queue_name]
+    for task_name, queue_name in TASK_QUEUES.items()
+}
+
 app.autodiscover_tasks(lambda: settings.INSTALLED_APPS)
@@ -13,6 +13,8 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 import os
 from pathlib import Path
 
+from celery.schedules import crontab
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -143,6 +145,8 @@ USE_TZ = True
 STATIC_URL = "static/"
 STATIC_ROOT = BASE_DIR / "staticfiles"
 
+MEDIA_ROOT = Path(os.environ.get("MEDIA_ROOT", BASE_DIR / "media"))
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
@@ -162,6 +166,66 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_ENABLE_UTC = USE_TZ
+CELERY_BEAT_SCHEDULE = {
+    "process-month-end-carry-overs": {
+        "task": "finance.tasks.carry_over_tasks.process_month_end_carry_overs",
+        "schedule": crontab(minute=5, hour=0, day_of_month=1),
+    },
+    "send-weekly-reminders": {
+        "task": "finance.tasks.email_tasks.send_weekly_reminders",
+        "schedule": crontab(minute=0, hour=18, day_of_week="sun"),
+    },
+    "send-weekly-summaries": {
+        "task": "finance.tasks.email_tasks.send_weekly_summaries",
+        "schedule": crontab(minute=0, hour=8, day_of_week="mon"),
+    },
+    "send-monthly-summaries": {
+        "task": "finance.tasks.email_tasks.send_monthly_summaries",
+        "schedule": crontab(minute=0, hour=18, day_of_month="28-31"),
+        "kwargs": {"last_day_only": True},
+    },
+    "send-yearly-summaries": {
+        "task": "finance.tasks.email_tasks.send_yearly_summaries",
+        "schedule": crontab(minute=0, hour=18, day_of_month=31, month_of_year=12),
+    },
+}
+
+CACHE_REDIS_URL = os.environ.get("CACHE_REDIS_URL", "")
+
+if CACHE_REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": CACHE_REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get("DASHBOARD_CACHE_TIMEOUT", "3600"))
+TRANSACTION_PAGE_SIZE = int(os.environ.get("TRANSACTION_PAGE_SIZE", "50"))
+TRANSACTION_IMPORT_CHUNK_SIZE = int(
+    os.environ.get("TRANSACTION_IMPORT_CHUNK_SIZE", "500")
+)
+TRANSACTION_IMPORT_ASYNC_BYTES = int(
+    os.environ.get("TRANSACTION_IMPORT_ASYNC_BYTES", str(256 * 1024))
+)
+TRANSACTION_IMPORT_MAX_ERRORS = int(
+    os.environ.get("TRANSACTION_IMPORT_MAX_ERRORS", "100")
+)
+BATCH_MUTATION_MAX_OPERATIONS = int(
+    os.environ.get("BATCH_MUTATION_MAX_OPERATIONS", "500")
+)
+TRANSACTION_EXPORT_CHUNK_SIZE = int(
+    os.environ.get("TRANSACTION_EXPORT_CHUNK_SIZE", "2000")
+)
+TRANSACTION_EXPORT_BLOCK_BYTES = int(
+    os.environ.get("TRANSACTION_EXPORT_BLOCK_BYTES", str(64 * 1024))
+)
 
 
 EMAIL_BACKEND = os.environ.get(
@@ -173,3 +237,36 @@ EMAIL_USE_TLS = os.environ.get("EMAIL_USE_TLS", "True").lower() in ("true", "1",
 EMAIL_HOST_USER = os.environ.get("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = os.environ.get("EMAIL_HOST_PASSWORD", "")
 DEFAULT_FROM_EMAIL = os.environ.get("DEFAULT_FROM_EMAIL", "noreply@clink.com")
+
+EMAIL_BATCH_SIZE = int(os.environ.get("EMAIL_BATCH_SIZE", "500"))
+EMAIL_BATCH_CONCURRENCY = int(os.environ.get("EMAIL_BATCH_CONCURRENCY", "4"))
+EMAIL_SEND_CONCURRENCY = int(os.environ.get("EMAIL_SEND_CONCURRENCY", "1"))
+EMAIL_SMTP_POOL_SIZE = int(os.environ.get("EMAIL_SMTP_POOL_SIZE", "4"))
+EMAIL_LOG_BATCH_SIZE = int(os.environ.get("EMAIL_LOG_BATCH_SIZE", "500"))
+EMAIL_LOG_STORE_CONTENT = os.environ.get("EMAIL_LOG_STORE_CONTENT", "True").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+EMAIL_LOG_RETENTION_DAYS = int(os.environ.get("EMAIL_LOG_RETENTION_DAYS", "180"))
+EMAIL_DELIVERY_WINDOW_MINUTES = int(
+    os.environ.get("EMAIL_DELIVERY_WINDOW_MINUTES", "120")
+)
+
+EMAIL_RATE_LIMIT_REDIS_URL = os.environ.get("EMAIL_RATE_LIMIT_REDIS_URL", "")
+EMAIL_RATE_LIMITS = {
+    "default": {
+        "rate": float(os.environ.get("EMAIL_RATE_LIMIT_PER_SECOND", "0")),
+        "burst": int(os.environ.get("EMAIL_RATE_LIMIT_BURST", "20")),
+    },
+}
+
+EMAIL_RETRY_MAX_ATTEMPTS = int(os.environ.get("EMAIL_RETRY_MAX_ATTEMPTS", "5"))
+EMAIL_RETRY_BACKOFF_SECONDS = int(os.environ.get("EMAIL_RETRY_BACKOFF_SECONDS", "60"))
+EMAIL_RETRY_BACKOFF_MAX_SECONDS = int(
+    os.environ.get("EMAIL_RETRY_BACKOFF_MAX_SECONDS", "3600")
+)
+
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    "visibility_timeout": (EMAIL_DELIVERY_WINDOW_MINUTES + 60) * 60,
+}
@@ -1,6 +1,13 @@
 from django.contrib import admin
 
-from finance.models import UserSettings, EmailLog
+from finance.models import (
+    UserSettings,
+    EmailLog,
+    EmailRun,
+    EmailDeadLetter,
+    TransactionImport,
+)
+from finance.utils.email_dead_letters import replay_dead_letters
 
 
 @admin.register(UserSettings)
@@ -25,7 +32,7 @@ class UserSettingsAdmin(admin.ModelAdmin):
 
 @admin.register(EmailLog)
 class EmailLogAdmin(admin.ModelAdmin):
-    list_display = ["user", "email_type", "success", "sent_at"]
+    list_display = ["user", "email_type", "period_key", "success", "sent_at"]
     list_filter = ["email_type", "success", "sent_at"]
     search_fields = ["user__username", "user__email", "error_message"]
     readonly_fields = [
@@ -35,6 +42,8 @@ class EmailLogAdmin(admin.ModelAdmin):
         "success",
         "error_message",
         "email_data",
+        "period_key",
+        "run",
     ]
 
     def has_add_permission(self, request):
@@ -42,3 +51,102 @@ class EmailLogAdmin(admin.ModelAdmin):
 
     def has_change_permission(self, request, obj=None):
         return False
+
+
+@admin.register(EmailRun)
+class EmailRunAdmin(admin.ModelAdmin):
+    list_display = [
+        "email_type",
+        "period_key",
+        "status",
+        "completed_batches",
+        "batch_count",
+        "sent_count",
+        "failed_count",
+        "started_at",
+    ]
+    list_filter = ["email_type", "status"]
+    readonly_fields = [
+        "run_id",
+        "email_type",
+        "period_key",
+        "status",
+        "user_count",
+        "batch_count",
+        "completed_batches",
+        "sent_count",
+        "failed_count",
+        "dispatch_generation",
+        "started_at",
+        "checkpointed_at",
+        "completed_at",
+    ]
+
+    def has_add_permission(self, request):
+        return False
+
+
+@admin.register(EmailDeadLetter)
+class EmailDeadLetterAdmin(admin.ModelAdmin):
+    list_display = [
+        "user",
+        "email_type",
+        "period_key",
+        "attempts",
+        "created_at",
+        "replayed_at",
+    ]
+    list_filter = ["email_type", "replayed_at"]
+    search_fields = ["user__username", "user__email", "last_error"]
+    readonly_fields = [
+        "user",
+        "email_type",
+        "period_key",
+        "run",
+        "email_data",
+        "attempts",
+        "last_error",
+        "created_at",
+        "replayed_at",
+    ]
+    actions = ["replay"]
+
+    def has_add_permission(self, request):
+        return False
+
+    @admin.action(description="Replay selected dead letters")
+    def replay(self, request, queryset):
+        replayed = replay_dead_letters(queryset.filter(replayed_at__isnull=True))
+        self.message_user(request, f"Queued {replayed} emails for retry.")
+
+
+@admin.register(TransactionImport)
+class TransactionImportAdmin(admin.ModelAdmin):
+    list_display = [
+        "user",
+        "file_name",
+        "file_format",
+        "status",
+        "imported_rows",
+        "failed_rows",
+        "created_at",
+    ]
+    list_filter = ["status", "file_format"]
+    search_fields = ["user__username", "file_name"]
+    readonly_fields = [
+        "import_id",
+        "user",
+        "file_format",
+        "file_name",
+        "source",
+        "status",
+        "processed_rows",
+        "imported_rows",
+        "failed_rows",
+        "errors",
+        "created_at",
+        "completed_at",
+    ]
+
+    def has_add_permission(self, request):
+        return False
@@ -2,5 +2,8 @@ from django.apps import AppConfig
 
 
 class FinanceConfig(AppConfig):
-    default_auto_field = 'django.db.models.BigAutoField'
-    name = 'finance'
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "finance"
+
+    def ready(self) -> None:
+        import finance.signals
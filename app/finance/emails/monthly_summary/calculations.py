@@ -2,8 +2,8 @@ from django.contrib.auth.models import User
 from django.db.models import Sum
 from django.utils import timezone
 from typing import TypedDict
-from finance.models.transaction import Transaction
 from finance.enums import TransactionType
+from finance.utils.category_rollup import get_rollups_for_month, get_rollups_for_users
 
 
 class TypeTotal(TypedDict):
@@ -25,19 +25,38 @@ class MonthlySummaryData(TypedDict):
 def calculate_monthly_totals(user: User) -> MonthlySummaryData:
     current_date = timezone.now()
 
-    transactions = Transaction.objects.filter(
-        user=user,
-        date_of_expense__year=current_date.year,
-        date_of_expense__month=current_date.month,
-    )
+    rollups = get_rollups_for_month(user, current_date.year, current_date.month)
 
     type_totals = (
-        transactions.values("type")
-        .annotate(total_cents=Sum("amount_in_cents"))
-        .order_by("-total_cents")
+        rollups.values("type")
+        .annotate(type_total_cents=Sum("total_cents"))
+        .order_by("-type_total_cents")
     )
 
-    totals_dict = {tt["type"]: tt["total_cents"] / 100 for tt in type_totals}
+    return build_monthly_summary(list(type_totals))
+
+
+def calculate_monthly_totals_for_users(
+    user_ids: list[int],
+) -> dict[int, MonthlySummaryData]:
+    current_date = timezone.now()
+
+    type_totals = {user_id: [] for user_id in user_ids}
+    for row in (
+        get_rollups_for_users(user_ids, current_date.year, current_date.month)
+        .values("user_id", "type")
+        .annotate(type_total_cents=Sum("total_cents"))
+        .order_by("-type_total_cents")
+    ):
+        type_totals[row["user_id"]].append(row)
+
+    return {
+        user_id: build_monthly_summary(type_totals[user_id]) for user_id in user_ids
+    }
+
+
+def build_monthly_summary(type_totals: list[dict]) -> MonthlySummaryData:
+    totals_dict = {tt["type"]: tt["type_total_cents"] / 100 for tt in type_totals}
 
     income = totals_dict.get(TransactionType.INCOME.name, 0.0)
     savings = totals_dict.get(TransactionType.SAVINGS.name, 0.0)
@@ -0,0 +1,47 @@
+from functools import lru_cache
+from typing import Any, Iterable, TypedDict
+
+from django.template import Context
+from django.template.backends.django import Template
+from django.template.loader import get_template
+
+
+class RenderedEmail(TypedDict):
+    text: str
+    html: str
+
+
+@lru_cache(maxsize=None)
+def get_email_templates(template_name: str) -> tuple[Template, Template]:
+    return (
+        get_template(f"emails/{template_name}.txt"),
+        get_template(f"emails/{template_name}.html"),
+    )
+
+
+def render_emails(
+    template_name: str, contexts: Iterable[dict[str, Any]]
+) -> list[RenderedEmail]:
+    text_template, html_template = get_email_templates(template_name)
+    context = Context()
+    rendered = []
+
+    for values in contexts:
+        with context.push(values):
+            rendered.append(
+                {
+                    "text": text_template.template.render(context),
+                    "html": html_template.template.render(context),
+                }
+            )
+
+    return rendered
+
+
+def render_email(template_name: str, context: dict[str, Any]) -> RenderedEmail:
+    return render_emails(template_name, [context])[0]
+
+
+def render_email_text(template_name: str, context: dict[str, Any]) -> str:
+    text_template, _ = get_email_templates(template_name)
+    return text_template.render(context)
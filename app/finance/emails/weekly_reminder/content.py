@@ -1,23 +1,19 @@
 from django.contrib.auth.models import User
 
+from finance.emails.rendering import render_email_text
 
-def build_reminder_email_subject() -> str:
-    return "Reminder: Log Your Expenses This Week"
-
-
-def build_reminder_email_content(user: User) -> str:
-    return f"""Hello {user.first_name or user.username},
+WEEKLY_REMINDER_TEMPLATE = "weekly_reminder"
 
-We noticed you haven't logged any expenses in the past 7 days.
 
-Keeping track of your spending helps you stay on top of your financial goals. Take a moment to add any recent expenses you may have forgotten.
+def build_reminder_email_subject() -> str:
+    return "Reminder: Log Your Expenses This Week"
 
-If you've already logged everything, great job staying organized!
 
-Best regards,
-Clink Finance Team
+def build_reminder_email_context(user: User) -> dict:
+    return {"user_name": user.first_name or user.username}
 
----
 
-To manage your email preferences, log in to your account and visit your settings page.
-"""
+def build_reminder_email_content(user: User) -> str:
+    return render_email_text(
+        WEEKLY_REMINDER_TEMPLATE, build_reminder_email_context(user)
+    )
@@ -1,21 +1,27 @@
 from django.contrib.auth.models import User
-from django.db.models import QuerySet, Q, Max
+from django.db.models import Exists, OuterRef, QuerySet
 from django.utils import timezone
 from datetime import timedelta
 
+from finance.models import MonthlyUserActivity
+from finance.utils.email_service import EMAIL_RECIPIENT_FIELDS
+
 
 def get_users_needing_reminders() -> QuerySet[User]:
     seven_days_ago = timezone.now() - timedelta(days=7)
 
-    users_with_recent_transactions = User.objects.filter(
-        transaction__date_of_expense__gte=seven_days_ago.date()
-    ).values_list("id", flat=True)
+    has_recent_transactions = Exists(
+        MonthlyUserActivity.objects.filter(
+            user_id=OuterRef("pk"), last_transaction_date__gte=seven_days_ago.date()
+        )
+    )
 
     return (
         User.objects.filter(
-            email_settings__weekly_reminder_enabled=True, email__isnull=False
+            ~has_recent_transactions,
+            email_settings__weekly_reminder_enabled=True,
+            email__isnull=False,
         )
         .exclude(email="")
-        .exclude(id__in=users_with_recent_transactions)
-        .distinct()
+        .only(*EMAIL_RECIPIENT_FIELDS)
     )
@@ -5,6 +5,10 @@ from datetime import timedelta
 from typing import TypedDict
 from finance.models.transaction import Transaction
 from finance.models.budget import Budget
+from finance.utils.category_rollup import (
+    get_rollups_for_users,
+    get_spent_by_category_for_month,
+)
 
 
 class CategoryTotal(TypedDict):
@@ -38,6 +42,58 @@ def calculate_weekly_totals(user: User) -> WeeklySummaryData:
         .order_by("-total_cents")
     )
 
+    remaining_budgets = calculate_remaining_budgets(user, seven_days_ago)
+
+    return build_weekly_summary(list(category_totals), remaining_budgets)
+
+
+def calculate_weekly_totals_for_users(
+    user_ids: list[int],
+) -> dict[int, WeeklySummaryData]:
+    current_date = timezone.now()
+    seven_days_ago = current_date - timedelta(days=7)
+
+    category_totals = {user_id: [] for user_id in user_ids}
+    for row in (
+        Transaction.objects.filter(
+            user_id__in=user_ids, date_of_expense__gte=seven_days_ago.date()
+        )
+        .values("user_id", "category")
+        .annotate(total_cents=Sum("amount_in_cents"))
+        .order_by("-total_cents")
+    ):
+        category_totals[row["user_id"]].append(row)
+
+    budgets = {user_id: [] for user_id in user_ids}
+    for budget in Budget.objects.filter(
+        user_id__in=user_ids,
+        budget_year=current_date.year,
+        budget_month=current_date.month,
+    ):
+        budgets[budget.user_id].append(budget)
+
+    spent_by_category = {user_id: {} for user_id in user_ids}
+    for rollup in (
+        get_rollups_for_users(user_ids, current_date.year, current_date.month)
+        .order_by()
+        .values("user_id", "type", "category", "total_cents")
+    ):
+        spent_by_category[rollup["user_id"]][(rollup["type"], rollup["category"])] = (
+            rollup["total_cents"]
+        )
+
+    return {
+        user_id: build_weekly_summary(
+            category_totals[user_id],
+            build_remaining_budgets(budgets[user_id], spent_by_category[user_id]),
+        )
+        for user_id in user_ids
+    }
+
+
+def build_weekly_summary(
+    category_totals: list[dict], remaining_budgets: list[BudgetRemaining]
+) -> WeeklySummaryData:
     totals_by_category = [
         {"category": ct["category"], "total": ct["total_cents"] / 100}
         for ct in category_totals
@@ -45,8 +101,6 @@ def calculate_weekly_totals(user: User) -> WeeklySummaryData:
 
     grand_total = sum(ct["total"] for ct in totals_by_category)
 
-    remaining_budgets = calculate_remaining_budgets(user, seven_days_ago)
-
     return {
         "totals_by_category": totals_by_category,
         "remaining_budgets": remaining_budgets,
@@ -65,19 +119,20 @@ def calculate_remaining_budgets(
         budget_month=current_date.month,
     )
 
+    spent_by_category = get_spent_by_category_for_month(
+        user, current_date.year, current_date.month
+    )
+
+    return build_remaining_budgets(budgets, spent_by_category)
+
+
+def build_remaining_budgets(
+    budgets: list[Budget], spent_by_category: dict[tuple[str, str], int]
+) -> list[BudgetRemaining]:
     remaining_budgets = []
 
     for budget in budgets:
-        spent_cents = (
-            Transaction.objects.filter(
-                user=user,
-                category=budget.category,
-                type=budget.type,
-                date_of_expense__year=current_date.year,
-                date_of_expense__month=current_date.month,
-            ).aggregate(total=Sum("amount_in_cents"))["total"]
-            or 0
-        )
+        spent_cents = spent_by_category.get((budget.type, budget.category), 0)
 
         budget_amount = budget.amount_in_cents + budget.carried_over_amount_in_cents
         spent_amount = spent_cents / 100
@@ -2,7 +2,7 @@ from django.contrib.auth.models import User
 from django.db.models import Sum
 from django.utils import timezone
 from typing import TypedDict
-from finance.models.transaction import Transaction
+from finance.utils.category_rollup import get_rollups_for_year, get_rollups_for_users
 
 
 class CategoryTotal(TypedDict):
@@ -21,35 +21,62 @@ class YearlySummaryData(TypedDict):
 def calculate_yearly_totals(user: User) -> YearlySummaryData:
     current_date = timezone.now()
 
-    transactions = Transaction.objects.filter(
-        user=user,
-        date_of_expense__year=current_date.year,
-    )
+    rollups = get_rollups_for_year(user, current_date.year)
 
     category_totals = (
-        transactions.values("category", "type")
-        .annotate(total_cents=Sum("amount_in_cents"))
-        .order_by("-total_cents")
+        rollups.values("category", "type")
+        .annotate(category_total_cents=Sum("total_cents"))
+        .order_by("-category_total_cents")
     )
 
+    return build_yearly_summary(list(category_totals))
+
+
+def calculate_yearly_totals_for_users(
+    user_ids: list[int],
+) -> dict[int, YearlySummaryData]:
+    current_date = timezone.now()
+
+    category_totals = {user_id: [] for user_id in user_ids}
+    for row in (
+        get_rollups_for_users(user_ids, current_date.year)
+        .values("user_id", "category", "type")
+        .annotate(category_total_cents=Sum("total_cents"))
+        .order_by("-category_total_cents")
+    ):
+        category_totals[row["user_id"]].append(row)
+
+    return {
+        user_id: build_yearly_summary(category_totals[user_id]) for user_id in user_ids
+    }
+
+
+def build_yearly_summary(category_totals: list[dict]) -> YearlySummaryData:
     totals_by_category = [
         {
             "category": f"{ct['category']} ({ct['type']})",
-            "total": ct["total_cents"] / 100,
+            "total": ct["category_total_cents"] / 100,
         }
         for ct in category_totals
     ]
 
-    income_transactions = transactions.filter(type="INCOME")
-    expense_transactions = transactions.exclude(type="INCOME")
-
     total_income = (
-        income_transactions.aggregate(total=Sum("amount_in_cents"))["total"] or 0
-    ) / 100
+        sum(
+            ct["category_total_cents"]
+            for ct in category_totals
+            if ct["type"] == "INCOME"
+        )
+        / 100
+    )
 
     total_expenses = (
-        expense_transactions.aggregate(total=Sum("amount_in_cents"))["total"] or 0
-    ) / 100
+        sum(
+            ct["category_total_cents"]
+            for ct in category_totals
+            if ct["type"] != "INCOME"
+        )
+        / 100
+    )
 
     grand_total = total_income + total_expenses
     net_income = total_income - total_expenses
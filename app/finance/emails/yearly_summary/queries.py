@@ -1,21 +1,26 @@
 from django.contrib.auth.models import User
-from django.db.models import QuerySet
+from django.db.models import Exists, OuterRef, QuerySet
 from django.utils import timezone
 
+from finance.models import MonthlyUserActivity
+from finance.utils.email_service import EMAIL_RECIPIENT_FIELDS
+
 
 def get_users_needing_yearly_summary() -> QuerySet[User]:
     current_date = timezone.now()
 
-    users_with_transactions_this_year = User.objects.filter(
-        transaction__date_of_expense__year=current_date.year,
-    ).values_list("id", flat=True)
+    has_transactions_this_year = Exists(
+        MonthlyUserActivity.objects.filter(
+            user_id=OuterRef("pk"), year=current_date.year
+        )
+    )
 
     return (
         User.objects.filter(
+            has_transactions_this_year,
             email_settings__yearly_summary_enabled=True,
             email__isnull=False,
-            id__in=users_with_transactions_this_year,
         )
         .exclude(email="")
-        .distinct()
+        .only(*EMAIL_RECIPIENT_FIELDS)
     )
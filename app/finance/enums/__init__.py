@@ -1,4 +1,14 @@
 from finance.enums.transaction_enums import TransactionType
-from finance.enums.email_enums import EmailType
+from finance.enums.email_enums import EmailType, EmailRunStatus
+from finance.enums.import_enums import ImportFormat, ImportStatus
+from finance.enums.export_enums import ExportFormat, ExportStream
 
-__all__ = ["TransactionType", "EmailType"]
+__all__ = [
+    "TransactionType",
+    "EmailType",
+    "EmailRunStatus",
+    "ImportFormat",
+    "ImportStatus",
+    "ExportFormat",
+    "ExportStream",
+]
@@ -6,3 +6,8 @@ class EmailType(Enum):
     WEEKLY_SUMMARY = "Weekly Summary"
     MONTHLY_SUMMARY = "Monthly Summary"
     YEARLY_SUMMARY = "Yearly Summary"
+
+
+class EmailRunStatus(Enum):
+    RUNNING = "Running"
+    COMPLETED = "Completed"
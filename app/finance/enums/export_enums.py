@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class ExportFormat(Enum):
+    CSV = "CSV"
+    NDJSON = "NDJSON"
+
+
+class ExportStream(Enum):
+    TRANSACTIONS = "Transactions"
+    BUDGETS = "Budgets"
+    TRANSFERS = "Internal transfers"
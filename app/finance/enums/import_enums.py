@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class ImportFormat(Enum):
+    CSV = "CSV"
+    OFX = "OFX"
+
+
+class ImportStatus(Enum):
+    PENDING = "Pending"
+    RUNNING = "Running"
+    COMPLETED = "Completed"
+    FAILED = "Failed"
@@ -1,19 +1,31 @@
 from finance.forms.budget_forms import (
     BudgetItemForm,
+    BudgetPeriodItemForm,
     MultiBudgetForm,
     BudgetItemFormSet,
     InternalTransferForm,
+    BudgetCopyForm,
+    BudgetRangeForm,
+)
+from finance.forms.transaction_forms import (
+    TransactionForm,
+    TransactionImportForm,
+    TransactionExportForm,
 )
-from finance.forms.transaction_forms import TransactionForm
 from finance.forms.auth_forms import LoginForm, SignUpForm
 from finance.forms.user_settings_forms import UserSettingsForm
 
 __all__ = [
     "BudgetItemForm",
+    "BudgetPeriodItemForm",
     "MultiBudgetForm",
     "BudgetItemFormSet",
     "InternalTransferForm",
+    "BudgetCopyForm",
+    "BudgetRangeForm",
     "TransactionForm",
+    "TransactionImportForm",
+    "TransactionExportForm",
     "LoginForm",
     "SignUpForm",
     "UserSettingsForm",
@@ -8,6 +8,10 @@ from django.forms import formset_factory
 
 from finance.models import Budget
 from finance.enums import TransactionType
+from finance.utils.budget_upsert import upsert_budgets
+from finance.utils.date_utils import month_span
+
+MAX_BUDGET_RANGE_MONTHS = 24
 
 
 class BudgetItemData(TypedDict):
@@ -49,6 +53,11 @@ class BudgetItemForm(forms.Form):
         return type_value
 
 
+class BudgetPeriodItemForm(BudgetItemForm):
+    year = forms.IntegerField(min_value=1900, required=True)
+    month = forms.IntegerField(min_value=1, max_value=12, required=True)
+
+
 BudgetItemFormSet = formset_factory(
     BudgetItemForm, extra=0, min_num=1, validate_min=True
 )
@@ -114,25 +123,23 @@ class MultiBudgetForm(forms.Form):
 
         year: int = self.cleaned_data["year"]
         month: int = self.cleaned_data["month"]
-        created_budgets: list[Budget] = []
+        budgets: list[Budget] = []
 
         for form in self.formset:
             if form.cleaned_data and not form.cleaned_data.get("DELETE", False):
-                type_value: str = form.cleaned_data["type"]
-                category: str = form.cleaned_data["category"]
                 amount_dollars: Decimal = form.cleaned_data["amount"]
-
-                budget, created = Budget.objects.update_or_create(
-                    user=user,
-                    category=category,
-                    type=type_value,
-                    budget_year=year,
-                    budget_month=month,
-                    defaults={"amount_in_cents": int(float(amount_dollars) * 100)},
+                budgets.append(
+                    Budget(
+                        user=user,
+                        category=form.cleaned_data["category"],
+                        type=form.cleaned_data["type"],
+                        budget_year=year,
+                        budget_month=month,
+                        amount_in_cents=int(float(amount_dollars) * 100),
+                    )
                 )
-                created_budgets.append(budget)
 
-        return created_budgets
+        return upsert_budgets(budgets)
 
 
 class InternalTransferForm(forms.Form):
@@ -173,3 +180,40 @@ class InternalTransferForm(forms.Form):
                 )
 
         return cleaned_data
+
+
+class BudgetRangeForm(forms.Form):
+    start_year = forms.IntegerField(min_value=1900, required=True)
+    start_month = forms.IntegerField(min_value=1, max_value=12, required=True)
+    end_year = forms.IntegerField(min_value=1900, required=True)
+    end_month = forms.IntegerField(min_value=1, max_value=12, required=True)
+
+    def clean(self) -> Dict[str, Any]:
+        cleaned_data = super().clean()
+        start = (cleaned_data.get("start_year"), cleaned_data.get("start_month"))
+        end = (cleaned_data.get("end_year"), cleaned_data.get("end_month"))
+
+        if None not in start + end:
+            months = month_span(*start, *end)
+            if not months:
+                raise forms.ValidationError(
+                    "End month must be on or after the start month."
+                )
+            if len(months) > MAX_BUDGET_RANGE_MONTHS:
+                raise forms.ValidationError(
+                    f"A budget range can span at most {MAX_BUDGET_RANGE_MONTHS} months."
+                )
+            cleaned_data["months"] = months
+
+        return cleaned_data
+
+
+class BudgetCopyForm(BudgetRangeForm):
+    source_year = forms.IntegerField(min_value=1900, required=True)
+    source_month = forms.IntegerField(min_value=1, max_value=12, required=True)
+
+    def clean(self) -> Dict[str, Any]:
+        cleaned_data = super().clean()
+        if "months" in cleaned_data:
+            cleaned_data["target_months"] = cleaned_data["months"]
+        return cleaned_data
@@ -1,10 +1,12 @@
 from decimal import Decimal
+from typing import Any
 from datetime import date
 
 from django import forms
 
 from finance.models.transaction import Transaction
-from finance.enums import TransactionType
+from finance.enums import ExportFormat, ExportStream, ImportFormat, TransactionType
+from finance.utils.transaction_export import CSV_EXTRA_STREAMS_ERROR
 
 
 class TransactionForm(forms.ModelForm):
@@ -41,3 +43,57 @@ class TransactionForm(forms.ModelForm):
         if commit:
             instance.save()
         return instance
+
+
+class TransactionImportForm(forms.Form):
+    file = forms.FileField(required=True)
+    file_format = forms.ChoiceField(
+        choices=[("", "Detect from file name")]
+        + [(import_format.name, import_format.value) for import_format in ImportFormat],
+        required=False,
+    )
+    ofx_expense_type = forms.ChoiceField(
+        choices=[
+            (transaction_type.name, transaction_type.value)
+            for transaction_type in TransactionType
+            if transaction_type != TransactionType.INCOME
+        ],
+        initial=TransactionType.WANT.name,
+        required=False,
+    )
+
+
+class TransactionExportForm(forms.Form):
+    file_format = forms.ChoiceField(
+        choices=[
+            (export_format.name, export_format.value) for export_format in ExportFormat
+        ],
+        required=False,
+    )
+    start = forms.DateField(required=False)
+    end = forms.DateField(required=False)
+    include = forms.MultipleChoiceField(
+        choices=[
+            (stream.name, stream.value)
+            for stream in ExportStream
+            if stream != ExportStream.TRANSACTIONS
+        ],
+        required=False,
+    )
+    compress = forms.BooleanField(required=False)
+
+    def clean(self) -> dict[str, Any]:
+        cleaned_data = super().clean()
+        start = cleaned_data.get("start")
+        end = cleaned_data.get("end")
+
+        if start and end and start > end:
+            raise forms.ValidationError("Start date must be on or before end date.")
+
+        if cleaned_data.get("include") and cleaned_data.get("file_format") in (
+            "",
+            ExportFormat.CSV.name,
+        ):
+            raise forms.ValidationError(CSV_EXTRA_STREAMS_ERROR)
+
+        return cleaned_data
@@ -0,0 +1,60 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import F, Min
+from django.utils import timezone
+
+from finance.models import Budget
+from finance.utils.budget_calculator import process_carry_over_chain
+
+
+class Command(BaseCommand):
+    help = "Recompute the carried over amounts of every carry-over budget chain."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only backfill the given user. Can be repeated.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        current_date = timezone.now()
+
+        carry_over_budgets = Budget.objects.filter(allow_carry_over=True)
+        if options["user_ids"]:
+            carry_over_budgets = carry_over_budgets.filter(
+                user_id__in=options["user_ids"]
+            )
+
+        earliest_periods = list(
+            carry_over_budgets.order_by()
+            .values("user_id")
+            .annotate(
+                earliest_period=Min(F("budget_year") * 12 + F("budget_month") - 1)
+            )
+        )
+        users = User.objects.in_bulk(row["user_id"] for row in earliest_periods)
+
+        users_processed = 0
+        budgets_processed = 0
+
+        for row in earliest_periods:
+            year, month_index = divmod(row["earliest_period"], 12)
+            chain_results = process_carry_over_chain(
+                users[row["user_id"]],
+                year,
+                month_index + 1,
+                current_date.year,
+                current_date.month,
+            )
+            users_processed += 1
+            budgets_processed += sum(result["processed"] for result in chain_results)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backfilled carry-overs for {users_processed} users "
+                f"({budgets_processed} budget months processed)."
+            )
+        )
@@ -0,0 +1,154 @@
+import time
+from typing import Callable
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+from django.template import engines
+from django.template.loader import get_template
+
+from finance.emails.rendering import render_email, render_emails
+from finance.emails.weekly_reminder.content import (
+    WEEKLY_REMINDER_TEMPLATE,
+    build_reminder_email_context,
+)
+from finance.emails.weekly_summary.content import (
+    WEEKLY_SUMMARY_TEMPLATE,
+    build_weekly_summary_context,
+)
+from finance.emails.monthly_summary.content import (
+    MONTHLY_SUMMARY_TEMPLATE,
+    build_monthly_summary_context,
+)
+from finance.emails.yearly_summary.content import (
+    YEARLY_SUMMARY_TEMPLATE,
+    build_yearly_summary_context,
+)
+
+
+def sample_contexts(template_name: str, count: int) -> list[dict]:
+    users = [
+        User(username=f"user{index}", first_name=f"User {index}")
+        for index in range(count)
+    ]
+
+    if template_name == WEEKLY_REMINDER_TEMPLATE:
+        return [build_reminder_email_context(user) for user in users]
+
+    if template_name == WEEKLY_SUMMARY_TEMPLATE:
+        return [
+            build_weekly_summary_context(
+                user,
+                {
+                    "totals_by_category": [
+                        {"category": f"Category {n}", "total": 12.5 * n}
+                        for n in range(1, 6)
+                    ],
+                    "remaining_budgets": [
+                        {
+                            "category": f"Category {n}",
+                            "budget": 100.0,
+                            "spent": 30.0 * n,
+                            "remaining": 100.0 - 30.0 * n,
+                        }
+                        for n in range(1, 6)
+                    ],
+                    "grand_total": 187.5,
+                },
+            )
+            for user in users
+        ]
+
+    if template_name == MONTHLY_SUMMARY_TEMPLATE:
+        return [
+            build_monthly_summary_context(
+                user,
+                {
+                    "totals_by_type": [],
+                    "income": 5000.0,
+                    "savings": 1000.0,
+                    "investing": 750.0,
+                    "needs": 1800.0,
+                    "wants": 450.0,
+                    "debts": 300.0,
+                    "total_expenses": 2550.0,
+                },
+            )
+            for user in users
+        ]
+
+    return [
+        build_yearly_summary_context(
+            user,
+            {
+                "totals_by_category": [
+                    {"category": f"Category {n}", "total": 250.0 * n}
+                    for n in range(1, 9)
+                ],
+                "grand_total": 9000.0,
+                "total_income": 60000.0,
+                "total_expenses": 9000.0,
+                "net_income": 51000.0,
+            },
+        )
+        for user in users
+    ]
+
+
+def render_uncompiled(template_name: str, contexts: list[dict]) -> None:
+    engine = engines["django"]
+    sources = [
+        get_template(f"emails/{template_name}.{extension}").template.source
+        for extension in ("txt", "html")
+    ]
+
+    for context in contexts:
+        for source in sources:
+            engine.from_string(source).render(context)
+
+
+def time_per_email(render: Callable[[], object], count: int) -> float:
+    started = time.perf_counter()
+    render()
+    return (time.perf_counter() - started) / count * 1_000_000
+
+
+class Command(BaseCommand):
+    help = "Compare per-email render cost for the email templates."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=1000,
+            help="Number of emails to render per template and mode.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        count = options["count"]
+
+        for template_name in [
+            WEEKLY_REMINDER_TEMPLATE,
+            WEEKLY_SUMMARY_TEMPLATE,
+            MONTHLY_SUMMARY_TEMPLATE,
+            YEARLY_SUMMARY_TEMPLATE,
+        ]:
+            contexts = sample_contexts(template_name, count)
+            render_emails(template_name, contexts[:1])
+
+            uncompiled = time_per_email(
+                lambda: render_uncompiled(template_name, contexts), count
+            )
+            per_email = time_per_email(
+                lambda: [render_email(template_name, context) for context in contexts],
+                count,
+            )
+            batch = time_per_email(
+                lambda: render_emails(template_name, contexts), count
+            )
+
+            self.stdout.write(
+                f"{template_name}: compile per email {uncompiled:.1f}us, "
+                f"cached per email {per_email:.1f}us, "
+                f"cached batch {batch:.1f}us "
+                f"({uncompiled / batch:.1f}x faster)"
+            )
@@ -0,0 +1,79 @@
+import time
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.enums import EmailType
+from finance.utils.async_email_sender import send_messages_concurrently
+from finance.utils.email_service import build_email_message, send_message_with_reconnect
+from finance.utils.fake_smtp_server import FakeSMTPServer
+
+
+class Command(BaseCommand):
+    help = "Measure email send throughput against a local fake SMTP server."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--count",
+            type=int,
+            default=200,
+            help="Number of emails to send per concurrency level.",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            nargs="+",
+            default=[1, 2, 4, 8, 16],
+            help="Concurrency levels to benchmark.",
+        )
+        parser.add_argument(
+            "--pool-size",
+            type=int,
+            default=4,
+            help="Number of persistent SMTP sessions for concurrent sends.",
+        )
+        parser.add_argument(
+            "--latency-ms",
+            type=float,
+            default=5.0,
+            help="Simulated round-trip latency per SMTP reply.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        count = options["count"]
+        messages = [
+            build_email_message(
+                User(username=f"user{index}", email=f"user{index}@example.com"),
+                "Benchmark",
+                f"Hello user{index}",
+            )
+            for index in range(count)
+        ]
+
+        with FakeSMTPServer(latency=options["latency_ms"] / 1000) as server:
+            started = time.perf_counter()
+            connection = server.get_connection()
+            try:
+                for message in messages:
+                    send_message_with_reconnect(connection, message)
+            finally:
+                connection.close()
+            sequential = count / (time.perf_counter() - started)
+            self.stdout.write(f"sequential: {sequential:.0f} emails/s")
+
+            for concurrency in options["concurrency"]:
+                started = time.perf_counter()
+                errors = send_messages_concurrently(
+                    EmailType.WEEKLY_SUMMARY,
+                    messages,
+                    concurrency=concurrency,
+                    pool_size=options["pool_size"],
+                    connection_factory=server.get_connection,
+                )
+                throughput = count / (time.perf_counter() - started)
+                failed = sum(error is not None for error in errors)
+
+                self.stdout.write(
+                    f"concurrency {concurrency}: {throughput:.0f} emails/s "
+                    f"({throughput / sequential:.1f}x sequential, {failed} failed)"
+                )
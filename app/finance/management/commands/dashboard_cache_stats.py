@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.utils.dashboard_cache import (
+    get_dashboard_cache_stats,
+    reset_dashboard_cache_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Show the dashboard cache hit and miss counters."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        stats = get_dashboard_cache_stats()
+        lookups = stats["hits"] + stats["misses"]
+        hit_rate = stats["hits"] / lookups * 100 if lookups else 0.0
+
+        self.stdout.write(
+            f"Dashboard cache: {stats['hits']} hits, {stats['misses']} misses "
+            f"({hit_rate:.1f}% hit rate)."
+        )
+
+        if options["reset"]:
+            reset_dashboard_cache_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
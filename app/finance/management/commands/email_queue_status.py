@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from clink.celery import EMAIL_QUEUE, EMAIL_RETRY_QUEUE
+from finance.utils.email_queue import (
+    get_broker_queue_depths,
+    get_running_email_runs,
+    get_worker_task_counts,
+)
+
+
+class Command(BaseCommand):
+    help = "Show Celery queue depth and the progress of running email runs."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--queue",
+            action="append",
+            dest="queues",
+            help="Broker queue to inspect. Can be repeated.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            queue_names = options["queues"] or [EMAIL_QUEUE, EMAIL_RETRY_QUEUE]
+            for queue_name, depth in get_broker_queue_depths(queue_names).items():
+                self.stdout.write(f"Queue {queue_name}: {depth} waiting")
+
+            counts = get_worker_task_counts()
+            self.stdout.write(
+                f"Workers: {counts['active']} active, {counts['reserved']} reserved, "
+                f"{counts['scheduled']} scheduled (ETA)"
+            )
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f"Broker unavailable: {e}"))
+
+        runs = get_running_email_runs()
+        if not runs:
+            self.stdout.write("No email runs in progress.")
+
+        for run in runs:
+            self.stdout.write(
+                f"{run.email_type} {run.period_key}: "
+                f"{run.completed_batches}/{run.batch_count} batches, "
+                f"{run.sent_count} sent, {run.failed_count} failed"
+            )
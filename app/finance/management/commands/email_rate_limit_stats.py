@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.utils.email_rate_limit import (
+    get_rate_limit_stats,
+    reset_rate_limit_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Show how often outbound email was throttled by the rate limiter."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        for name, stats in get_rate_limit_stats().items():
+            throttled_rate = (
+                stats["throttled"] / stats["acquired"] * 100
+                if stats["acquired"]
+                else 0.0
+            )
+            average_wait = (
+                stats["wait_ms"] / stats["throttled"] if stats["throttled"] else 0.0
+            )
+
+            self.stdout.write(
+                f"Bucket {name}: {stats['acquired']} sends, {stats['throttled']} throttled "
+                f"({throttled_rate:.1f}%), {stats['wait_ms']}ms total wait "
+                f"({average_wait:.0f}ms average)."
+            )
+
+        if options["reset"]:
+            reset_rate_limit_stats()
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
@@ -0,0 +1,96 @@
+import sys
+from datetime import date
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.utils.dateparse import parse_date
+
+from finance.enums import ExportFormat, ExportStream
+from finance.utils.transaction_export import CSV_EXTRA_STREAMS_ERROR, stream_export
+
+
+def date_argument(value: str) -> date:
+    parsed = parse_date(value)
+    if parsed is None:
+        raise ValueError(value)
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "Stream a user's transaction history to a CSV or NDJSON file."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--username", required=True, help="User whose history is exported."
+        )
+        parser.add_argument(
+            "--format",
+            choices=[export_format.name for export_format in ExportFormat],
+            default=ExportFormat.CSV.name,
+            help="Output format.",
+        )
+        parser.add_argument(
+            "--start", type=date_argument, help="First date to export (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--end", type=date_argument, help="Last date to export (YYYY-MM-DD)."
+        )
+        parser.add_argument(
+            "--include",
+            action="append",
+            choices=[
+                stream.name
+                for stream in ExportStream
+                if stream != ExportStream.TRANSACTIONS
+            ],
+            default=[],
+            help=(
+                "Extra stream to append after the transactions. Repeatable; "
+                "NDJSON only."
+            ),
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Compress the output with gzip.",
+        )
+        parser.add_argument(
+            "--output",
+            type=Path,
+            help="File to write to. Defaults to standard output.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"User not found: {options['username']}")
+
+        start = options["start"]
+        end = options["end"]
+        if start and end and start > end:
+            raise CommandError("Start date must be on or before end date.")
+        if options["include"] and options["format"] == ExportFormat.CSV.name:
+            raise CommandError(CSV_EXTRA_STREAMS_ERROR)
+
+        chunks = stream_export(
+            user,
+            ExportFormat[options["format"]],
+            [ExportStream.TRANSACTIONS]
+            + [ExportStream[name] for name in options["include"]],
+            start,
+            end,
+            options["gzip"],
+        )
+
+        if options["output"]:
+            with options["output"].open("wb") as output:
+                for chunk in chunks:
+                    output.write(chunk)
+            self.stdout.write(self.style.SUCCESS(f"Exported to {options['output']}."))
+        elif options["gzip"]:
+            for chunk in chunks:
+                sys.stdout.buffer.write(chunk)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk.decode("utf-8"), ending="")
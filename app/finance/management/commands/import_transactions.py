@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from django.contrib.auth.models import User
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from finance.enums import ImportFormat, TransactionType
+from finance.models import TransactionImport
+from finance.tasks.import_tasks import import_transactions_file
+from finance.utils.transaction_import import (
+    ImportResult,
+    detect_import_format,
+    import_transactions,
+    open_import_stream,
+)
+
+
+class Command(BaseCommand):
+    help = "Import transactions for a user from a CSV or OFX file."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("path", type=Path, help="CSV or OFX file to import.")
+        parser.add_argument(
+            "--username", required=True, help="User the transactions belong to."
+        )
+        parser.add_argument(
+            "--format",
+            choices=[import_format.name for import_format in ImportFormat],
+            help="File format. Detected from the file extension by default.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            help="Number of rows validated and inserted per batch.",
+        )
+        parser.add_argument(
+            "--ofx-expense-type",
+            choices=[
+                transaction_type.name
+                for transaction_type in TransactionType
+                if transaction_type != TransactionType.INCOME
+            ],
+            default=TransactionType.WANT.name,
+            help="Transaction type for OFX debits.",
+        )
+        parser.add_argument(
+            "--async",
+            action="store_true",
+            dest="run_async",
+            help="Queue the import on Celery instead of running it here.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        path = options["path"]
+        if not path.is_file():
+            raise CommandError(f"File not found: {path}")
+
+        user = User.objects.filter(username=options["username"]).first()
+        if user is None:
+            raise CommandError(f"User not found: {options['username']}")
+
+        file_format = (
+            ImportFormat[options["format"]]
+            if options["format"]
+            else detect_import_format(path.name)
+        )
+
+        if options["run_async"]:
+            with path.open("rb") as source:
+                transaction_import = TransactionImport.objects.create(
+                    user=user,
+                    file_format=file_format.name,
+                    file_name=path.name,
+                    source=File(source, name=path.name),
+                )
+            import_transactions_file.delay(
+                str(transaction_import.import_id), options["ofx_expense_type"]
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"Queued import {transaction_import.import_id}.")
+            )
+            return
+
+        with path.open("rb") as source:
+            result = import_transactions(
+                user,
+                open_import_stream(source),
+                file_format,
+                options["chunk_size"],
+                self.write_progress,
+                TransactionType[options["ofx_expense_type"]],
+            )
+
+        for error in result["errors"]:
+            messages = "; ".join(
+                f"{field}: {' '.join(field_errors)}"
+                for field, field_errors in error["errors"].items()
+            )
+            self.stdout.write(self.style.WARNING(f"Row {error['row']}: {messages}"))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {result['imported']} of {result['processed']} rows, "
+                f"{result['failed']} failed."
+            )
+        )
+
+    def write_progress(self, result: ImportResult) -> None:
+        self.stdout.write(
+            f"Processed {result['processed']} rows: "
+            f"{result['imported']} imported, {result['failed']} failed."
+        )
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandParser
+from django.utils import timezone
+
+from finance.models import EmailLog
+
+
+class Command(BaseCommand):
+    help = "Delete email logs older than the retention period in small chunks."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.EMAIL_LOG_RETENTION_DAYS,
+            help="Delete logs sent more than this many days ago.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of rows deleted per statement.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many logs would be deleted.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        expired_logs = EmailLog.objects.filter(sent_at__lt=cutoff)
+
+        if options["dry_run"]:
+            self.stdout.write(
+                f"{expired_logs.count()} email logs older than {cutoff:%Y-%m-%d} "
+                "would be deleted."
+            )
+            return
+
+        deleted_count = 0
+        while True:
+            log_ids = list(
+                expired_logs.order_by("id").values_list("id", flat=True)[
+                    : options["chunk_size"]
+                ]
+            )
+            if not log_ids:
+                break
+
+            chunk_deleted, _ = EmailLog.objects.filter(id__in=log_ids).delete()
+            deleted_count += chunk_deleted
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deleted {deleted_count} email logs older than {cutoff:%Y-%m-%d}."
+            )
+        )
@@ -0,0 +1,67 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.utils.category_rollup import (
+    find_rollup_mismatches,
+    rebuild_rollups_for_user,
+)
+
+
+class Command(BaseCommand):
+    help = "Verify or rebuild the monthly category rollups from raw transactions."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only process the given user. Can be repeated.",
+        )
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Report mismatched rollups without rewriting them.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        users = User.objects.order_by("id")
+        if options["user_ids"]:
+            users = users.filter(id__in=options["user_ids"])
+
+        if options["verify"]:
+            self.verify(users)
+        else:
+            self.rebuild(users)
+
+    def verify(self, users) -> None:
+        mismatch_count = 0
+
+        for user in users.iterator():
+            for mismatch in find_rollup_mismatches(user):
+                mismatch_count += 1
+                _, year, month, type_name, category = mismatch["key"]
+                self.stdout.write(
+                    f"user={user.id} {year}-{month:02d} {type_name}/{category}: "
+                    f"expected {mismatch['expected']}, stored {mismatch['stored']}"
+                )
+
+        if mismatch_count:
+            self.stdout.write(self.style.ERROR(f"Found {mismatch_count} mismatches."))
+        else:
+            self.stdout.write(self.style.SUCCESS("All rollups match transactions."))
+
+    def rebuild(self, users) -> None:
+        users_processed = 0
+        rollups_created = 0
+
+        for user in users.iterator():
+            result = rebuild_rollups_for_user(user)
+            users_processed += 1
+            rollups_created += result["created"]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {rollups_created} rollups for {users_processed} users."
+            )
+        )
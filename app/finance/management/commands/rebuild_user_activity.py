@@ -0,0 +1,36 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.utils.user_activity import rebuild_activity_for_user
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly user activity records from raw transactions."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--user-id",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only process the given user. Can be repeated.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        users = User.objects.order_by("id")
+        if options["user_ids"]:
+            users = users.filter(id__in=options["user_ids"])
+
+        users_processed = 0
+        records_created = 0
+
+        for user in users.iterator():
+            result = rebuild_activity_for_user(user)
+            users_processed += 1
+            records_created += result["created"]
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt {records_created} activity records for {users_processed} users."
+            )
+        )
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from finance.enums import EmailType
+from finance.utils.email_dead_letters import (
+    get_pending_dead_letters,
+    replay_dead_letters,
+)
+
+
+class Command(BaseCommand):
+    help = "Queue permanently failed emails for another round of retries."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--email-type",
+            choices=[email_type.name for email_type in EmailType],
+            help="Only replay dead letters of this email type.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Replay at most this many dead letters, oldest first.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many dead letters would be replayed.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        email_type = options["email_type"]
+        dead_letters = get_pending_dead_letters(
+            EmailType[email_type] if email_type else None
+        ).order_by("created_at", "id")
+
+        if options["limit"]:
+            dead_letters = dead_letters.filter(
+                id__in=list(
+                    dead_letters.values_list("id", flat=True)[: options["limit"]]
+                )
+            )
+
+        if options["dry_run"]:
+            self.stdout.write(f"{dead_letters.count()} dead letters would be replayed.")
+            return
+
+        replayed = replay_dead_letters(dead_letters)
+        self.stdout.write(
+            self.style.SUCCESS(f"Queued {replayed} dead letters for retry.")
+        )
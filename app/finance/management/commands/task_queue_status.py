@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from clink.celery import TASK_QUEUE_OPTIONS
+from finance.utils.email_queue import get_broker_queue_depths
+from finance.utils.queue_metrics import (
+    get_queue_latency_stats,
+    reset_queue_latency_stats,
+)
+
+
+class Command(BaseCommand):
+    help = "Show depth and wait time for each Celery queue."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the latency counters after printing them.",
+        )
+
+    def handle(self, *args, **options) -> None:
+        queue_names = list(TASK_QUEUE_OPTIONS)
+
+        try:
+            depths = get_broker_queue_depths(queue_names)
+        except Exception as e:
+            self.stdout.write(self.style.WARNING(f"Broker unavailable: {e}"))
+            depths = {}
+
+        for queue_name, stats in get_queue_latency_stats(queue_names).items():
+            depth = depths.get(queue_name, "?")
+            average_wait = (
+                stats["wait_ms"] / stats["started"] if stats["started"] else 0.0
+            )
+
+            self.stdout.write(
+                f"Queue {queue_name}: {depth} waiting, {stats['started']} started, "
+                f"{average_wait:.0f}ms average wait, {stats['max_wait_ms']}ms max wait"
+            )
+
+        if options["reset"]:
+            reset_queue_latency_stats(queue_names)
+            self.stdout.write(self.style.SUCCESS("Counters reset."))
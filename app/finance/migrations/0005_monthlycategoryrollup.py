@@ -0,0 +1,97 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:05
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def populate_rollups(apps, schema_editor):
+    Transaction = apps.get_model("finance", "Transaction")
+    MonthlyCategoryRollup = apps.get_model("finance", "MonthlyCategoryRollup")
+
+    grouped_totals = (
+        Transaction.objects.annotate(
+            expense_year=ExtractYear("date_of_expense"),
+            expense_month=ExtractMonth("date_of_expense"),
+        )
+        .values("user_id", "expense_year", "expense_month", "type", "category")
+        .annotate(total_cents=Sum("amount_in_cents"), txn_count=Count("id"))
+        .order_by()
+    )
+
+    MonthlyCategoryRollup.objects.bulk_create(
+        [
+            MonthlyCategoryRollup(
+                user_id=row["user_id"],
+                year=row["expense_year"],
+                month=row["expense_month"],
+                type=row["type"],
+                category=row["category"],
+                total_cents=row["total_cents"],
+                txn_count=row["txn_count"],
+            )
+            for row in grouped_totals.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0004_usersettings_emaillog"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyCategoryRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveIntegerField()),
+                ("month", models.PositiveIntegerField()),
+                (
+                    "type",
+                    models.CharField(
+                        choices=[
+                            ("INCOME", "Income"),
+                            ("NEED", "Need"),
+                            ("WANT", "Want"),
+                            ("DEBTS", "Debts"),
+                            ("SAVINGS", "Savings"),
+                            ("INVESTING", "Investing"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("category", models.CharField(max_length=100)),
+                ("total_cents", models.BigIntegerField(default=0)),
+                ("txn_count", models.PositiveIntegerField(default=0)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Monthly Category Rollup",
+                "verbose_name_plural": "Monthly Category Rollups",
+                "ordering": ["-year", "-month", "type", "category"],
+                "unique_together": {("user", "year", "month", "type", "category")},
+            },
+        ),
+        migrations.RunPython(populate_rollups, migrations.RunPython.noop),
+    ]
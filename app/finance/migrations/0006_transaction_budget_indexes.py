@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0005_monthlycategoryrollup"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="budget",
+            index=models.Index(
+                fields=["user", "budget_year", "budget_month"],
+                name="finance_budget_user_month_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "date_of_expense"], name="finance_txn_user_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="transaction",
+            index=models.Index(
+                fields=["user", "type", "category", "date_of_expense"],
+                name="finance_txn_user_cat_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:21
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Max, Min
+from django.db.models.functions import ExtractMonth, ExtractYear
+
+
+def populate_activity(apps, schema_editor):
+    Transaction = apps.get_model("finance", "Transaction")
+    MonthlyUserActivity = apps.get_model("finance", "MonthlyUserActivity")
+
+    grouped_activity = (
+        Transaction.objects.annotate(
+            expense_year=ExtractYear("date_of_expense"),
+            expense_month=ExtractMonth("date_of_expense"),
+        )
+        .values("user_id", "expense_year", "expense_month")
+        .annotate(
+            first_date=Min("date_of_expense"),
+            last_date=Max("date_of_expense"),
+            txn_count=Count("id"),
+        )
+        .order_by()
+    )
+
+    MonthlyUserActivity.objects.bulk_create(
+        [
+            MonthlyUserActivity(
+                user_id=row["user_id"],
+                year=row["expense_year"],
+                month=row["expense_month"],
+                first_transaction_date=row["first_date"],
+                last_transaction_date=row["last_date"],
+                txn_count=row["txn_count"],
+            )
+            for row in grouped_activity.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0006_transaction_budget_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MonthlyUserActivity",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveIntegerField()),
+                ("month", models.PositiveIntegerField()),
+                ("first_transaction_date", models.DateField()),
+                ("last_transaction_date", models.DateField()),
+                ("txn_count", models.PositiveIntegerField(default=0)),
+                ("date_updated", models.DateTimeField(auto_now=True)),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="monthly_activity",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Monthly User Activity",
+                "verbose_name_plural": "Monthly User Activity",
+                "ordering": ["-year", "-month"],
+                "indexes": [
+                    models.Index(
+                        fields=["user", "last_transaction_date"],
+                        name="finance_activity_last_idx",
+                    )
+                ],
+                "unique_together": {("user", "year", "month")},
+            },
+        ),
+        migrations.RunPython(populate_activity, migrations.RunPython.noop),
+    ]
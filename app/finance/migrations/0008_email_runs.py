@@ -0,0 +1,99 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:22
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0007_monthlyuseractivity"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emaillog",
+            name="period_key",
+            field=models.CharField(blank=True, default="", max_length=10),
+        ),
+        migrations.CreateModel(
+            name="EmailRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "run_id",
+                    models.UUIDField(default=uuid.uuid4, editable=False, unique=True),
+                ),
+                (
+                    "email_type",
+                    models.CharField(
+                        choices=[
+                            ("WEEKLY_REMINDER", "Weekly Reminder"),
+                            ("WEEKLY_SUMMARY", "Weekly Summary"),
+                            ("MONTHLY_SUMMARY", "Monthly Summary"),
+                            ("YEARLY_SUMMARY", "Yearly Summary"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("period_key", models.CharField(max_length=10)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[("RUNNING", "Running"), ("COMPLETED", "Completed")],
+                        default="RUNNING",
+                        max_length=20,
+                    ),
+                ),
+                ("user_count", models.PositiveIntegerField(default=0)),
+                ("batch_count", models.PositiveIntegerField(default=0)),
+                ("completed_batches", models.PositiveIntegerField(default=0)),
+                ("sent_count", models.PositiveIntegerField(default=0)),
+                ("failed_count", models.PositiveIntegerField(default=0)),
+                ("started_at", models.DateTimeField(auto_now_add=True)),
+                ("checkpointed_at", models.DateTimeField(blank=True, null=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Email Run",
+                "verbose_name_plural": "Email Runs",
+                "ordering": ["-started_at"],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("email_type", "period_key"),
+                        name="finance_email_run_period_uniq",
+                    )
+                ],
+            },
+        ),
+        migrations.AddField(
+            model_name="emaillog",
+            name="run",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="logs",
+                to="finance.emailrun",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="emaillog",
+            index=models.Index(
+                condition=models.Q(("success", True)),
+                fields=["email_type", "period_key", "user"],
+                name="finance_emaillog_delivered_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,76 @@
+# Generated by Django 5.2.18 on 2026-10-17 06:31
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0008_email_runs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EmailDeadLetter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "email_type",
+                    models.CharField(
+                        choices=[
+                            ("WEEKLY_REMINDER", "Weekly Reminder"),
+                            ("WEEKLY_SUMMARY", "Weekly Summary"),
+                            ("MONTHLY_SUMMARY", "Monthly Summary"),
+                            ("YEARLY_SUMMARY", "Yearly Summary"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("period_key", models.CharField(blank=True, default="", max_length=10)),
+                ("email_data", models.JSONField()),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("replayed_at", models.DateTimeField(blank=True, null=True)),
+                (
+                    "run",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="dead_letters",
+                        to="finance.emailrun",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Email Dead Letter",
+                "verbose_name_plural": "Email Dead Letters",
+                "ordering": ["-created_at"],
+                "indexes": [
+                    models.Index(
+                        fields=["email_type", "replayed_at"],
+                        name="finance_ema_email_t_9c9715_idx",
+                    )
+                ],
+            },
+        ),
+    ]
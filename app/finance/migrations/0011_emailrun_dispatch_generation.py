@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-17 07:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("finance", "0010_transactionimport"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="emailrun",
+            name="dispatch_generation",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
@@ -4,6 +4,11 @@ from finance.models.budget import Budget
 from finance.models.internal_transfer import InternalTransfer
 from finance.models.user_settings import UserSettings
 from finance.models.email_log import EmailLog
+from finance.models.email_run import EmailRun
+from finance.models.email_dead_letter import EmailDeadLetter
+from finance.models.monthly_category_rollup import MonthlyCategoryRollup
+from finance.models.monthly_user_activity import MonthlyUserActivity
+from finance.models.transaction_import import TransactionImport
 from finance.enums import TransactionType
 
 __all__ = [
@@ -13,5 +18,10 @@ __all__ = [
     "InternalTransfer",
     "UserSettings",
     "EmailLog",
+    "EmailRun",
+    "EmailDeadLetter",
+    "MonthlyCategoryRollup",
+    "MonthlyUserActivity",
+    "TransactionImport",
     "TransactionType",
 ]
@@ -34,3 +34,9 @@ class Budget(BaseFinancialModel):
     class Meta:
         ordering = ["-budget_year", "-budget_month", "-date_created"]
         unique_together = [["user", "category", "type", "budget_year", "budget_month"]]
+        indexes = [
+            models.Index(
+                fields=["user", "budget_year", "budget_month"],
+                name="finance_budget_user_month_idx",
+            ),
+        ]
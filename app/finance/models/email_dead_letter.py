@@ -0,0 +1,48 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+from finance.models.email_log import EmailLog
+from finance.models.email_run import EmailRun
+
+
+class EmailDeadLetter(models.Model):
+    user: models.ForeignKey = models.ForeignKey(
+        User, on_delete=models.CASCADE, blank=False, null=False
+    )
+
+    email_type: models.CharField = models.CharField(
+        max_length=20, choices=EmailLog.EMAIL_TYPE_CHOICES, blank=False, null=False
+    )
+
+    period_key: models.CharField = models.CharField(
+        max_length=10, blank=True, default=""
+    )
+
+    run: models.ForeignKey = models.ForeignKey(
+        EmailRun,
+        on_delete=models.SET_NULL,
+        related_name="dead_letters",
+        blank=True,
+        null=True,
+    )
+
+    email_data: models.JSONField = models.JSONField(blank=False, null=False)
+
+    attempts: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+
+    last_error: models.TextField = models.TextField(blank=True, default="")
+
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+
+    replayed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Email Dead Letter"
+        verbose_name_plural = "Email Dead Letters"
+        indexes = [
+            models.Index(fields=["email_type", "replayed_at"]),
+        ]
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} - {self.email_type} - {self.attempts} attempts"
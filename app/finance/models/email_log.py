@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import User
 
 from finance.enums import EmailType
@@ -28,6 +29,18 @@ class EmailLog(models.Model):
 
     email_data: models.JSONField = models.JSONField(blank=True, null=True)
 
+    period_key: models.CharField = models.CharField(
+        max_length=10, blank=True, default=""
+    )
+
+    run: models.ForeignKey = models.ForeignKey(
+        "finance.EmailRun",
+        on_delete=models.SET_NULL,
+        related_name="logs",
+        blank=True,
+        null=True,
+    )
+
     class Meta:
         verbose_name = "Email Log"
         verbose_name_plural = "Email Logs"
@@ -35,6 +48,11 @@ class EmailLog(models.Model):
             models.Index(fields=["user"]),
             models.Index(fields=["email_type"]),
             models.Index(fields=["sent_at"]),
+            models.Index(
+                fields=["email_type", "period_key", "user"],
+                name="finance_emaillog_delivered_idx",
+                condition=Q(success=True),
+            ),
         ]
         ordering = ["-sent_at"]
 
@@ -0,0 +1,58 @@
+import uuid
+
+from django.db import models
+
+from finance.enums import EmailRunStatus
+from finance.models.email_log import EmailLog
+
+
+class EmailRun(models.Model):
+    STATUS_CHOICES: list[tuple[str, str]] = [
+        (EmailRunStatus.RUNNING.name, EmailRunStatus.RUNNING.value),
+        (EmailRunStatus.COMPLETED.name, EmailRunStatus.COMPLETED.value),
+    ]
+
+    run_id: models.UUIDField = models.UUIDField(
+        default=uuid.uuid4, unique=True, editable=False
+    )
+
+    email_type: models.CharField = models.CharField(
+        max_length=20, choices=EmailLog.EMAIL_TYPE_CHOICES, blank=False, null=False
+    )
+
+    period_key: models.CharField = models.CharField(
+        max_length=10, blank=False, null=False
+    )
+
+    status: models.CharField = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=EmailRunStatus.RUNNING.name
+    )
+
+    user_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    batch_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    completed_batches: models.PositiveIntegerField = models.PositiveIntegerField(
+        default=0
+    )
+    sent_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    failed_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    dispatch_generation: models.PositiveIntegerField = models.PositiveIntegerField(
+        default=0
+    )
+
+    started_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    checkpointed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+    completed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Email Run"
+        verbose_name_plural = "Email Runs"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["email_type", "period_key"],
+                name="finance_email_run_period_uniq",
+            ),
+        ]
+        ordering = ["-started_at"]
+
+    def __str__(self) -> str:
+        return f"{self.email_type} {self.period_key} - {self.status}"
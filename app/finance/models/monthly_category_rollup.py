@@ -0,0 +1,44 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+from finance.models.base_financial_model import BaseFinancialModel
+
+
+class MonthlyCategoryRollup(models.Model):
+    user: models.ForeignKey = models.ForeignKey(
+        User, on_delete=models.CASCADE, blank=False, null=False
+    )
+
+    year: models.PositiveIntegerField = models.PositiveIntegerField(
+        blank=False, null=False
+    )
+
+    month: models.PositiveIntegerField = models.PositiveIntegerField(
+        blank=False, null=False
+    )
+
+    type: models.CharField = models.CharField(
+        max_length=20,
+        choices=BaseFinancialModel.TYPE_CHOICES,
+        blank=False,
+        null=False,
+    )
+
+    category: models.CharField = models.CharField(
+        max_length=100, blank=False, null=False
+    )
+
+    total_cents: models.BigIntegerField = models.BigIntegerField(default=0)
+
+    txn_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+
+    date_updated: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Monthly Category Rollup"
+        verbose_name_plural = "Monthly Category Rollups"
+        unique_together = [["user", "year", "month", "type", "category"]]
+        ordering = ["-year", "-month", "type", "category"]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} - {self.year}/{self.month:02d} - {self.category} ({self.type})"
@@ -0,0 +1,43 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class MonthlyUserActivity(models.Model):
+    user: models.ForeignKey = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="monthly_activity",
+        blank=False,
+        null=False,
+    )
+
+    year: models.PositiveIntegerField = models.PositiveIntegerField(
+        blank=False, null=False
+    )
+
+    month: models.PositiveIntegerField = models.PositiveIntegerField(
+        blank=False, null=False
+    )
+
+    first_transaction_date: models.DateField = models.DateField(blank=False, null=False)
+
+    last_transaction_date: models.DateField = models.DateField(blank=False, null=False)
+
+    txn_count: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+
+    date_updated: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Monthly User Activity"
+        verbose_name_plural = "Monthly User Activity"
+        unique_together = [["user", "year", "month"]]
+        ordering = ["-year", "-month"]
+        indexes = [
+            models.Index(
+                fields=["user", "last_transaction_date"],
+                name="finance_activity_last_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} - {self.year}/{self.month:02d} ({self.txn_count} transactions)"
@@ -7,9 +7,31 @@ from typing import override
 class Transaction(BaseFinancialModel):
     date_of_expense: models.DateField = models.DateField(blank=False, null=False)
 
+    @classmethod
+    def from_db(cls, db, field_names, values) -> "Transaction":
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_values = dict(zip(field_names, values))
+        return instance
+
+    def save(self, *args, **kwargs) -> None:
+        super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+        }
+
     @override
     def __str__(self) -> str:
         return f"{self.category} - ${self.amount_dollars:.2f} ({self.date_of_expense})"
 
     class Meta:
         ordering = ["-date_of_expense"]
+        indexes = [
+            models.Index(
+                fields=["user", "date_of_expense"], name="finance_txn_user_date_idx"
+            ),
+            models.Index(
+                fields=["user", "type", "category", "date_of_expense"],
+                name="finance_txn_user_cat_date_idx",
+            ),
+        ]
@@ -0,0 +1,58 @@
+import uuid
+
+from django.db import models
+from django.contrib.auth.models import User
+
+from finance.enums import ImportFormat, ImportStatus
+
+
+class TransactionImport(models.Model):
+    FORMAT_CHOICES: list[tuple[str, str]] = [
+        (import_format.name, import_format.value) for import_format in ImportFormat
+    ]
+    STATUS_CHOICES: list[tuple[str, str]] = [
+        (status.name, status.value) for status in ImportStatus
+    ]
+
+    import_id: models.UUIDField = models.UUIDField(
+        default=uuid.uuid4, unique=True, editable=False
+    )
+
+    user: models.ForeignKey = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="transaction_imports",
+        blank=False,
+        null=False,
+    )
+
+    file_format: models.CharField = models.CharField(
+        max_length=10, choices=FORMAT_CHOICES, blank=False, null=False
+    )
+
+    file_name: models.CharField = models.CharField(max_length=255, blank=True)
+
+    source: models.FileField = models.FileField(
+        upload_to="transaction_imports/", blank=True
+    )
+
+    status: models.CharField = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default=ImportStatus.PENDING.name
+    )
+
+    processed_rows: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    imported_rows: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+    failed_rows: models.PositiveIntegerField = models.PositiveIntegerField(default=0)
+
+    errors: models.JSONField = models.JSONField(default=list, blank=True)
+
+    created_at: models.DateTimeField = models.DateTimeField(auto_now_add=True)
+    completed_at: models.DateTimeField = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Transaction Import"
+        verbose_name_plural = "Transaction Imports"
+        ordering = ["-created_at"]
+
+    def __str__(self) -> str:
+        return f"{self.user.username} - {self.file_name or self.file_format} - {self.status}"
@@ -0,0 +1,41 @@
+from finance.signals.carry_over_signals import (
+    schedule_carry_over_refresh,
+    refresh_carry_over_for_transaction,
+    refresh_carry_over_for_budget,
+    refresh_carry_over_for_transfer,
+)
+from finance.signals.dashboard_cache_signals import (
+    invalidate_dashboard_cache,
+    invalidate_dashboard_cache_for_instance,
+    reset_dashboard_cache_for_new_user,
+)
+from finance.signals.rollup_signals import (
+    load_original_rollup_values,
+    update_rollup_for_saved_transaction,
+    update_rollup_for_deleted_transaction,
+)
+from finance.signals.activity_signals import (
+    update_activity_for_saved_transaction,
+    update_activity_for_deleted_transaction,
+)
+from finance.signals.queue_metrics_signals import (
+    stamp_task_published_at,
+    record_task_queue_latency,
+)
+
+__all__ = [
+    "schedule_carry_over_refresh",
+    "refresh_carry_over_for_transaction",
+    "refresh_carry_over_for_budget",
+    "refresh_carry_over_for_transfer",
+    "invalidate_dashboard_cache",
+    "invalidate_dashboard_cache_for_instance",
+    "reset_dashboard_cache_for_new_user",
+    "load_original_rollup_values",
+    "update_rollup_for_saved_transaction",
+    "update_rollup_for_deleted_transaction",
+    "update_activity_for_saved_transaction",
+    "update_activity_for_deleted_transaction",
+    "stamp_task_published_at",
+    "record_task_queue_latency",
+]
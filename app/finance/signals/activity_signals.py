@@ -0,0 +1,46 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from finance.models import Transaction
+from finance.utils.deferred_refresh import dependent_refresh_deferred
+from finance.utils.user_activity import apply_transaction_activity_change
+
+ACTIVITY_FIELDS = ["user_id", "date_of_expense"]
+
+
+def activity_values(values: dict) -> dict | None:
+    if not set(ACTIVITY_FIELDS) <= values.keys():
+        return None
+    return {field: values[field] for field in ACTIVITY_FIELDS}
+
+
+def current_activity_values(instance: Transaction) -> dict:
+    return {field: getattr(instance, field) for field in ACTIVITY_FIELDS}
+
+
+@receiver(post_save, sender=Transaction)
+def update_activity_for_saved_transaction(
+    sender: type[Transaction], instance: Transaction, created: bool, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    original_values = (
+        None if created else activity_values(getattr(instance, "_loaded_values", {}))
+    )
+    apply_transaction_activity_change(
+        original_values, current_activity_values(instance)
+    )
+
+
+@receiver(post_delete, sender=Transaction)
+def update_activity_for_deleted_transaction(
+    sender: type[Transaction], instance: Transaction, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    original_values = activity_values(
+        getattr(instance, "_loaded_values", {})
+    ) or current_activity_values(instance)
+    apply_transaction_activity_change(original_values, None)
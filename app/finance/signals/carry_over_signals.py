@@ -0,0 +1,84 @@
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from finance.models import Budget, Transaction, InternalTransfer
+from finance.utils.budget_calculator import (
+    carry_over_chain_active,
+    carry_over_source_key,
+)
+from finance.utils.date_utils import to_date
+from finance.utils.deferred_refresh import dependent_refresh_deferred
+from finance.tasks.carry_over_tasks import process_carry_over_for_user
+
+
+def schedule_carry_over_refresh(user_id: int, year: int, month: int) -> bool:
+    if carry_over_chain_active.get():
+        return False
+
+    current_date = timezone.now()
+    if (year, month) >= (current_date.year, current_date.month):
+        return False
+
+    db_transaction.on_commit(
+        lambda: process_carry_over_for_user.delay(user_id, year, month)
+    )
+    return True
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+def refresh_carry_over_for_transaction(
+    sender: type[Transaction], instance: Transaction, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    affected_dates = [to_date(instance.date_of_expense)]
+    original_date = getattr(instance, "_loaded_values", {}).get("date_of_expense")
+    if original_date is not None:
+        affected_dates.append(to_date(original_date))
+
+    earliest_date = min(affected_dates)
+    schedule_carry_over_refresh(
+        instance.user_id, earliest_date.year, earliest_date.month
+    )
+
+
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+def refresh_carry_over_for_budget(
+    sender: type[Budget], instance: Budget, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    if kwargs.get("created"):
+        schedule_carry_over_refresh(*carry_over_source_key(instance))
+        return
+
+    schedule_carry_over_refresh(
+        instance.user_id, instance.budget_year, instance.budget_month
+    )
+
+
+@receiver(post_save, sender=InternalTransfer)
+@receiver(post_delete, sender=InternalTransfer)
+def refresh_carry_over_for_transfer(
+    sender: type[InternalTransfer], instance: InternalTransfer, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    budget_ids = [instance.source_budget_id, instance.destination_budget_id]
+    budget_months = set(
+        Budget.objects.filter(id__in=[bid for bid in budget_ids if bid])
+        .order_by()
+        .values_list("budget_year", "budget_month")
+    )
+    transfer_date = to_date(instance.transfer_date)
+    budget_months.add((transfer_date.year, transfer_date.month))
+
+    year, month = min(budget_months)
+    schedule_carry_over_refresh(instance.user_id, year, month)
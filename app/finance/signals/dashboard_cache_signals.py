@@ -0,0 +1,37 @@
+from django.contrib.auth.models import User
+from django.db import transaction as db_transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from finance.models import Budget, InternalTransfer, Transaction
+from finance.utils.deferred_refresh import dependent_refresh_deferred
+from finance.utils.dashboard_cache import (
+    bump_dashboard_version,
+    reset_dashboard_version,
+)
+
+
+def invalidate_dashboard_cache(user_id: int) -> None:
+    bump_dashboard_version(user_id)
+    db_transaction.on_commit(lambda: bump_dashboard_version(user_id))
+
+
+@receiver(post_save, sender=Transaction)
+@receiver(post_delete, sender=Transaction)
+@receiver(post_save, sender=Budget)
+@receiver(post_delete, sender=Budget)
+@receiver(post_save, sender=InternalTransfer)
+@receiver(post_delete, sender=InternalTransfer)
+def invalidate_dashboard_cache_for_instance(sender, instance, **kwargs) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    invalidate_dashboard_cache(instance.user_id)
+
+
+@receiver(post_save, sender=User)
+def reset_dashboard_cache_for_new_user(
+    sender: type[User], instance: User, created: bool, **kwargs
+) -> None:
+    if created:
+        reset_dashboard_version(instance.id)
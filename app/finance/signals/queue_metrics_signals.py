@@ -0,0 +1,33 @@
+import time
+from typing import Optional
+
+from celery import Task
+from celery.signals import before_task_publish, task_prerun
+
+from finance.utils.queue_metrics import (
+    PUBLISHED_AT_HEADER,
+    get_task_wait,
+    record_queue_latency,
+)
+
+
+@before_task_publish.connect
+def stamp_task_published_at(headers: Optional[dict] = None, **kwargs) -> None:
+    if headers is not None:
+        headers.setdefault(PUBLISHED_AT_HEADER, time.time())
+
+
+@task_prerun.connect
+def record_task_queue_latency(task: Optional[Task] = None, **kwargs) -> None:
+    if task is None:
+        return
+
+    published_at = getattr(task.request, PUBLISHED_AT_HEADER, None)
+    if published_at is None:
+        return
+
+    delivery_info = task.request.delivery_info or {}
+    record_queue_latency(
+        delivery_info.get("routing_key") or "unknown",
+        get_task_wait(published_at, task.request.eta, time.time()),
+    )
@@ -0,0 +1,58 @@
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from finance.models import Transaction
+from finance.utils.category_rollup import apply_transaction_change
+from finance.utils.deferred_refresh import dependent_refresh_deferred
+
+ROLLUP_FIELDS = ["user_id", "type", "category", "amount_in_cents", "date_of_expense"]
+
+
+def rollup_values(values: dict) -> dict:
+    return {field: values[field] for field in ROLLUP_FIELDS}
+
+
+def current_rollup_values(instance: Transaction) -> dict:
+    return {field: getattr(instance, field) for field in ROLLUP_FIELDS}
+
+
+@receiver(pre_save, sender=Transaction)
+def load_original_rollup_values(
+    sender: type[Transaction], instance: Transaction, **kwargs
+) -> None:
+    if instance._state.adding or hasattr(instance, "_loaded_values"):
+        return
+
+    instance._loaded_values = (
+        Transaction.objects.filter(pk=instance.pk).values(*ROLLUP_FIELDS).first() or {}
+    )
+
+
+@receiver(post_save, sender=Transaction)
+def update_rollup_for_saved_transaction(
+    sender: type[Transaction], instance: Transaction, created: bool, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    loaded_values = getattr(instance, "_loaded_values", {})
+    original_values = (
+        rollup_values(loaded_values)
+        if not created and set(ROLLUP_FIELDS) <= loaded_values.keys()
+        else None
+    )
+    apply_transaction_change(original_values, current_rollup_values(instance))
+
+
+@receiver(post_delete, sender=Transaction)
+def update_rollup_for_deleted_transaction(
+    sender: type[Transaction], instance: Transaction, **kwargs
+) -> None:
+    if dependent_refresh_deferred.get():
+        return
+
+    loaded_values = getattr(instance, "_loaded_values", {})
+    if set(ROLLUP_FIELDS) <= loaded_values.keys():
+        apply_transaction_change(rollup_values(loaded_values), None)
+    else:
+        apply_transaction_change(current_rollup_values(instance), None)
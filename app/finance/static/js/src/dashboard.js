@@ -448,6 +448,88 @@ document.addEventListener("DOMContentLoaded", function () {
     });
   }
 
+  const loadMoreTransactionsBtn = document.querySelector(
+    ".btn-load-more-transactions",
+  );
+  const transactionRows = document.getElementById("transaction-rows");
+  const transactionRowTemplate = document.getElementById(
+    "transaction-row-template",
+  );
+
+  function formatTransactionDate(isoDate) {
+    return new Date(`${isoDate}T00:00:00`).toLocaleDateString("en-US", {
+      month: "short",
+      day: "2-digit",
+      year: "numeric",
+    });
+  }
+
+  function buildTransactionRow(transaction) {
+    const row = transactionRowTemplate.content
+      .querySelector("tr")
+      .cloneNode(true);
+    const badge = row.querySelector(".badge");
+
+    row.querySelector(".transaction-date").textContent = formatTransactionDate(
+      transaction.date_of_expense,
+    );
+    row.querySelector(".category-name").textContent = transaction.category;
+    badge.className = `badge transaction-type-${transaction.type.toLowerCase()}`;
+    badge.textContent = transaction.type;
+    row.querySelector(".amount").textContent =
+      `$${transaction.amount.toFixed(2)}`;
+    row
+      .querySelectorAll("[data-transaction-id]")
+      .forEach((button) =>
+        button.setAttribute("data-transaction-id", transaction.id),
+      );
+
+    return row;
+  }
+
+  function loadMoreTransactions() {
+    const cursor = loadMoreTransactionsBtn.getAttribute("data-next-cursor");
+    if (!cursor || loadMoreTransactionsBtn.disabled) {
+      return;
+    }
+
+    loadMoreTransactionsBtn.disabled = true;
+    const url = loadMoreTransactionsBtn.getAttribute("data-url");
+
+    fetch(`${url}?cursor=${encodeURIComponent(cursor)}`)
+      .then((response) => response.json())
+      .then((data) => {
+        data.transactions.forEach((transaction) =>
+          transactionRows.appendChild(buildTransactionRow(transaction)),
+        );
+
+        if (data.next_cursor) {
+          loadMoreTransactionsBtn.setAttribute(
+            "data-next-cursor",
+            data.next_cursor,
+          );
+          loadMoreTransactionsBtn.disabled = false;
+        } else {
+          loadMoreTransactionsBtn.parentElement.remove();
+        }
+      })
+      .catch(() => {
+        loadMoreTransactionsBtn.disabled = false;
+      });
+  }
+
+  if (loadMoreTransactionsBtn) {
+    loadMoreTransactionsBtn.addEventListener("click", loadMoreTransactions);
+
+    if ("IntersectionObserver" in window) {
+      new IntersectionObserver((entries) => {
+        if (entries.some((entry) => entry.isIntersecting)) {
+          loadMoreTransactions();
+        }
+      }).observe(loadMoreTransactionsBtn);
+    }
+  }
+
   function loadTransferHistory(budgetId, categoryName) {
     const loadingElement = document.getElementById("transfer-history-loading");
     const contentElement = document.getElementById("transfer-history-content");
@@ -1,15 +1,31 @@
 from finance.tasks.test_task import test_celery_task
 from finance.tasks.email_tasks import (
+    dispatch_email_batches,
+    send_email_batch,
+    aggregate_email_batches,
     send_weekly_reminders,
     send_weekly_summaries,
     send_monthly_summaries,
     send_yearly_summaries,
 )
+from finance.tasks.email_retry_tasks import retry_failed_email
+from finance.tasks.import_tasks import import_transactions_file
+from finance.tasks.carry_over_tasks import (
+    process_carry_over_for_user,
+    process_month_end_carry_overs,
+)
 
 __all__ = [
     "test_celery_task",
+    "dispatch_email_batches",
+    "send_email_batch",
+    "aggregate_email_batches",
     "send_weekly_reminders",
     "send_weekly_summaries",
     "send_monthly_summaries",
     "send_yearly_summaries",
+    "retry_failed_email",
+    "import_transactions_file",
+    "process_carry_over_for_user",
+    "process_month_end_carry_overs",
 ]
@@ -0,0 +1,48 @@
+from celery import shared_task
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from finance.models import Budget
+from finance.utils.budget_calculator import process_carry_over_chain
+
+
+@shared_task
+def process_carry_over_for_user(user_id: int, year: int, month: int) -> dict[str, int]:
+    user = User.objects.filter(id=user_id).first()
+    if user is None:
+        return {"months_processed": 0, "budgets_processed": 0}
+
+    current_date = timezone.now()
+    chain_results = process_carry_over_chain(
+        user, year, month, current_date.year, current_date.month
+    )
+
+    return {
+        "months_processed": len(chain_results),
+        "budgets_processed": sum(result["processed"] for result in chain_results),
+    }
+
+
+@shared_task
+def process_month_end_carry_overs() -> dict[str, int]:
+    current_date = timezone.now()
+    if current_date.month == 1:
+        prev_year, prev_month = current_date.year - 1, 12
+    else:
+        prev_year, prev_month = current_date.year, current_date.month - 1
+
+    user_ids = (
+        Budget.objects.filter(
+            budget_year=prev_year, budget_month=prev_month, allow_carry_over=True
+        )
+        .order_by()
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+
+    queued_count = 0
+    for user_id in user_ids:
+        process_carry_over_for_user.delay(user_id, prev_year, prev_month)
+        queued_count += 1
+
+    return {"queued": queued_count}
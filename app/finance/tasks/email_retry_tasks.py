@@ -0,0 +1,51 @@
+from typing import Optional
+
+from celery import shared_task
+from django.conf import settings
+from django.contrib.auth.models import User
+
+from finance.models import EmailRun
+from finance.enums import EmailType
+from finance.utils.email_dead_letters import record_dead_letter
+from finance.utils.email_runs import get_delivered_user_ids
+from finance.utils.email_service import (
+    EMAIL_RECIPIENT_FIELDS,
+    schedule_email_retry,
+    send_stored_email,
+)
+
+
+@shared_task
+def retry_failed_email(
+    email_type_name: str,
+    user_id: int,
+    email_data: dict,
+    period_key: str = "",
+    run_id: Optional[str] = None,
+    attempt: int = 1,
+) -> str:
+    email_type = EmailType[email_type_name]
+    user = User.objects.only(*EMAIL_RECIPIENT_FIELDS).filter(id=user_id).first()
+    if user is None:
+        return "skipped"
+
+    if period_key and get_delivered_user_ids(email_type, period_key, [user_id]):
+        return "skipped"
+
+    run = EmailRun.objects.filter(run_id=run_id).first() if run_id else None
+
+    try:
+        send_stored_email(user, email_type, email_data, period_key, run)
+    except Exception as e:
+        if attempt >= settings.EMAIL_RETRY_MAX_ATTEMPTS:
+            record_dead_letter(
+                user_id, email_type, email_data, period_key, run, attempt, str(e)
+            )
+            return "dead_lettered"
+
+        schedule_email_retry(
+            user_id, email_type, email_data, period_key, run_id, attempt + 1
+        )
+        return "retrying"
+
+    return "sent"
@@ -1,130 +1,336 @@
-from celery import shared_task
+from itertools import batched
+from typing import Callable, Iterator, Optional
 
+from celery import chain, chord, group, shared_task
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from finance.emails.rendering import render_emails
 from finance.emails.weekly_reminder.queries import get_users_needing_reminders
 from finance.emails.weekly_reminder.content import (
+    WEEKLY_REMINDER_TEMPLATE,
     build_reminder_email_subject,
-    build_reminder_email_content,
+    build_reminder_email_context,
 )
 from finance.emails.weekly_summary.queries import get_users_needing_weekly_summary
-from finance.emails.weekly_summary.calculations import calculate_weekly_totals
+from finance.emails.weekly_summary.calculations import (
+    calculate_weekly_totals_for_users,
+)
 from finance.emails.weekly_summary.content import (
+    WEEKLY_SUMMARY_TEMPLATE,
     build_weekly_summary_subject,
-    build_weekly_summary_content,
+    build_weekly_summary_context,
 )
 from finance.emails.monthly_summary.queries import get_users_needing_monthly_summary
-from finance.emails.monthly_summary.calculations import calculate_monthly_totals
+from finance.emails.monthly_summary.calculations import (
+    calculate_monthly_totals_for_users,
+)
 from finance.emails.monthly_summary.content import (
+    MONTHLY_SUMMARY_TEMPLATE,
     build_monthly_summary_subject,
-    build_monthly_summary_content,
+    build_monthly_summary_context,
 )
 from finance.emails.yearly_summary.queries import get_users_needing_yearly_summary
-from finance.emails.yearly_summary.calculations import calculate_yearly_totals
+from finance.emails.yearly_summary.calculations import (
+    calculate_yearly_totals_for_users,
+)
 from finance.emails.yearly_summary.content import (
+    YEARLY_SUMMARY_TEMPLATE,
     build_yearly_summary_subject,
-    build_yearly_summary_content,
+    build_yearly_summary_context,
+)
+from finance.utils.email_service import (
+    EMAIL_RECIPIENT_FIELDS,
+    PreparedEmail,
+    build_email_message,
+    log_email_results,
+    send_emails_with_logging,
+)
+from finance.utils.async_email_sender import send_messages_concurrently
+from finance.utils.email_runs import (
+    begin_run_dispatch,
+    checkpoint_email_run,
+    complete_email_run,
+    email_period_key,
+    exclude_delivered_users,
+    get_delivered_user_ids,
+    is_current_dispatch,
+    record_run_dispatch,
+    start_email_run,
 )
-from finance.utils.email_service import send_email_with_logging
-from finance.enums.email_enums import EmailType
+from finance.utils.email_schedule import build_delivery_etas, is_last_day_of_month
+from finance.models import EmailRun
+from finance.enums.email_enums import EmailRunStatus, EmailType
 
+logger = get_task_logger(__name__)
 
-@shared_task
-def send_weekly_reminders() -> dict[str, int]:
-    users = get_users_needing_reminders()
-    sent_count = 0
-    failed_count = 0
-
-    for user in users:
-        subject = build_reminder_email_subject()
-        content = build_reminder_email_content(user)
-
-        success = send_email_with_logging(
-            user=user,
-            email_type=EmailType.WEEKLY_REMINDER,
-            subject=subject,
-            content=content,
-        )
 
-        if success:
-            sent_count += 1
+def build_prepared_emails(
+    users: list[User],
+    subject: str,
+    template_name: str,
+    contexts: list[dict],
+    template_params: list[dict],
+) -> list[PreparedEmail]:
+    rendered_emails = render_emails(template_name, contexts)
+    return [
+        {
+            "user": user,
+            "message": build_email_message(
+                user, subject, rendered["text"], rendered["html"]
+            ),
+            "template_params": params,
+        }
+        for user, rendered, params in zip(users, rendered_emails, template_params)
+    ]
+
+
+def build_weekly_reminder_emails(users: list[User]) -> list[PreparedEmail]:
+    return build_prepared_emails(
+        users,
+        build_reminder_email_subject(),
+        WEEKLY_REMINDER_TEMPLATE,
+        [build_reminder_email_context(user) for user in users],
+        [{} for _ in users],
+    )
+
+
+def build_weekly_summary_emails(users: list[User]) -> list[PreparedEmail]:
+    summaries = calculate_weekly_totals_for_users([user.id for user in users])
+    return build_prepared_emails(
+        users,
+        build_weekly_summary_subject(),
+        WEEKLY_SUMMARY_TEMPLATE,
+        [build_weekly_summary_context(user, summaries[user.id]) for user in users],
+        [dict(summaries[user.id]) for user in users],
+    )
+
+
+def build_monthly_summary_emails(users: list[User]) -> list[PreparedEmail]:
+    summaries = calculate_monthly_totals_for_users([user.id for user in users])
+    return build_prepared_emails(
+        users,
+        build_monthly_summary_subject(),
+        MONTHLY_SUMMARY_TEMPLATE,
+        [build_monthly_summary_context(user, summaries[user.id]) for user in users],
+        [dict(summaries[user.id]) for user in users],
+    )
+
+
+def build_yearly_summary_emails(users: list[User]) -> list[PreparedEmail]:
+    summaries = calculate_yearly_totals_for_users([user.id for user in users])
+    return build_prepared_emails(
+        users,
+        build_yearly_summary_subject(),
+        YEARLY_SUMMARY_TEMPLATE,
+        [build_yearly_summary_context(user, summaries[user.id]) for user in users],
+        [dict(summaries[user.id]) for user in users],
+    )
+
+
+EMAIL_BUILDERS: dict[EmailType, Callable[[list[User]], list[PreparedEmail]]] = {
+    EmailType.WEEKLY_REMINDER: build_weekly_reminder_emails,
+    EmailType.WEEKLY_SUMMARY: build_weekly_summary_emails,
+    EmailType.MONTHLY_SUMMARY: build_monthly_summary_emails,
+    EmailType.YEARLY_SUMMARY: build_yearly_summary_emails,
+}
+
+
+def iter_user_id_chunks(users: QuerySet[User], chunk_size: int) -> Iterator[list[int]]:
+    user_ids = (
+        users.order_by("id")
+        .values_list("id", flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+
+    for chunk in batched(user_ids, chunk_size):
+        yield list(chunk)
+
+
+def dispatch_email_batches(
+    email_type: EmailType,
+    users: QuerySet[User],
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    period_key: Optional[str] = None,
+    delivery_window_minutes: Optional[int] = None,
+) -> dict[str, int | str]:
+    chunk_size = chunk_size or settings.EMAIL_BATCH_SIZE
+    concurrency = concurrency or settings.EMAIL_BATCH_CONCURRENCY
+
+    run = start_email_run(email_type, period_key or email_period_key(email_type))
+    run_id = str(run.run_id)
+    if run.status == EmailRunStatus.COMPLETED.name:
+        return {"run_id": run_id, "users": 0, "batches": 0}
+
+    generation = begin_run_dispatch(run)
+    users = exclude_delivered_users(users, email_type, run.period_key)
+    lanes = [[] for _ in range(concurrency)]
+    user_count = 0
+
+    for index, user_ids in enumerate(iter_user_id_chunks(users, chunk_size)):
+        lane = lanes[index % concurrency]
+        arguments = (email_type.name, user_ids, run_id, generation)
+        if lane:
+            lane.append(send_email_batch.s(*arguments))
         else:
-            failed_count += 1
+            lane.append(send_email_batch.s(None, *arguments))
+        user_count += len(user_ids)
+
+    batch_count = sum(len(lane) for lane in lanes)
+    etas = build_delivery_etas(batch_count, delivery_window_minutes)
+    for index, eta in enumerate(etas):
+        if eta:
+            lanes[index % concurrency][index // concurrency].set(eta=eta)
+
+    record_run_dispatch(run, generation, user_count, batch_count)
+
+    if batch_count:
+        chord(
+            group(chain(*lane) for lane in lanes if lane),
+            aggregate_email_batches.s(email_type.name, run_id, generation),
+        ).apply_async()
+
+    return {"run_id": run_id, "users": user_count, "batches": batch_count}
 
-    return {"sent": sent_count, "failed": failed_count}
+
+def send_prepared_emails(
+    email_type: EmailType,
+    emails: list[PreparedEmail],
+    period_key: str,
+    run: Optional[EmailRun],
+) -> dict[str, int]:
+    if settings.EMAIL_SEND_CONCURRENCY <= 1:
+        return send_emails_with_logging(email_type, emails, period_key, run)
+
+    errors = send_messages_concurrently(
+        email_type, [email["message"] for email in emails]
+    )
+    return log_email_results(email_type, emails, errors, period_key, run)
+
+
+def send_user_batch(
+    email_type: EmailType, user_ids: list[int], run: Optional[EmailRun]
+) -> dict[str, int]:
+    period_key = run.period_key if run else email_period_key(email_type)
+    delivered_user_ids = get_delivered_user_ids(email_type, period_key, user_ids)
+
+    users = User.objects.filter(id__in=user_ids).only(*EMAIL_RECIPIENT_FIELDS)
+    users = users.exclude(id__in=delivered_user_ids)
+    emails = EMAIL_BUILDERS[email_type](list(users.order_by("id")))
+    return send_prepared_emails(email_type, emails, period_key, run)
 
 
 @shared_task
-def send_weekly_summaries() -> dict[str, int]:
-    users = get_users_needing_weekly_summary()
-    sent_count = 0
-    failed_count = 0
-
-    for user in users:
-        summary_data = calculate_weekly_totals(user)
-        subject = build_weekly_summary_subject()
-        content = build_weekly_summary_content(user, summary_data)
-
-        success = send_email_with_logging(
-            user=user,
-            email_type=EmailType.WEEKLY_SUMMARY,
-            subject=subject,
-            content=content,
+def send_email_batch(
+    totals: Optional[dict[str, int]],
+    email_type_name: str,
+    user_ids: list[int],
+    run_id: Optional[str] = None,
+    generation: Optional[int] = None,
+) -> dict[str, int]:
+    email_type = EmailType[email_type_name]
+    totals = dict(totals or {"sent": 0, "failed": 0})
+    run = EmailRun.objects.filter(run_id=run_id).first() if run_id else None
+    if run and not is_current_dispatch(run, generation):
+        return totals
+
+    try:
+        batch_totals = send_user_batch(email_type, user_ids, run)
+    except Exception:
+        logger.exception(
+            "Email batch of %d %s users failed", len(user_ids), email_type_name
         )
+        batch_totals = {"sent": 0, "failed": len(user_ids)}
 
-        if success:
-            sent_count += 1
-        else:
-            failed_count += 1
+    if run:
+        checkpoint_email_run(run, batch_totals, generation)
 
-    return {"sent": sent_count, "failed": failed_count}
+    return {
+        "sent": totals["sent"] + batch_totals["sent"],
+        "failed": totals["failed"] + batch_totals["failed"],
+    }
 
 
 @shared_task
-def send_monthly_summaries() -> dict[str, int]:
-    users = get_users_needing_monthly_summary()
-    sent_count = 0
-    failed_count = 0
-
-    for user in users:
-        summary_data = calculate_monthly_totals(user)
-        subject = build_monthly_summary_subject()
-        content = build_monthly_summary_content(user, summary_data)
-
-        success = send_email_with_logging(
-            user=user,
-            email_type=EmailType.MONTHLY_SUMMARY,
-            subject=subject,
-            content=content,
-        )
+def aggregate_email_batches(
+    lane_totals: list[dict[str, int]],
+    email_type_name: str,
+    run_id: Optional[str] = None,
+    generation: Optional[int] = None,
+) -> dict[str, int | str]:
+    if run_id:
+        complete_email_run(run_id, generation)
 
-        if success:
-            sent_count += 1
-        else:
-            failed_count += 1
+    return {
+        "email_type": email_type_name,
+        "sent": sum(totals["sent"] for totals in lane_totals),
+        "failed": sum(totals["failed"] for totals in lane_totals),
+    }
 
-    return {"sent": sent_count, "failed": failed_count}
+
+@shared_task
+def send_weekly_reminders(
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delivery_window_minutes: Optional[int] = None,
+) -> dict[str, int | str]:
+    return dispatch_email_batches(
+        EmailType.WEEKLY_REMINDER,
+        get_users_needing_reminders(),
+        chunk_size,
+        concurrency,
+        delivery_window_minutes=delivery_window_minutes,
+    )
 
 
 @shared_task
-def send_yearly_summaries() -> dict[str, int]:
-    users = get_users_needing_yearly_summary()
-    sent_count = 0
-    failed_count = 0
-
-    for user in users:
-        summary_data = calculate_yearly_totals(user)
-        subject = build_yearly_summary_subject()
-        content = build_yearly_summary_content(user, summary_data)
-
-        success = send_email_with_logging(
-            user=user,
-            email_type=EmailType.YEARLY_SUMMARY,
-            subject=subject,
-            content=content,
-        )
+def send_weekly_summaries(
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delivery_window_minutes: Optional[int] = None,
+) -> dict[str, int | str]:
+    return dispatch_email_batches(
+        EmailType.WEEKLY_SUMMARY,
+        get_users_needing_weekly_summary(),
+        chunk_size,
+        concurrency,
+        delivery_window_minutes=delivery_window_minutes,
+    )
 
-        if success:
-            sent_count += 1
-        else:
-            failed_count += 1
 
-    return {"sent": sent_count, "failed": failed_count}
+@shared_task
+def send_monthly_summaries(
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delivery_window_minutes: Optional[int] = None,
+    last_day_only: bool = False,
+) -> dict[str, int | str]:
+    if last_day_only and not is_last_day_of_month(timezone.localdate()):
+        return {"users": 0, "batches": 0}
+
+    return dispatch_email_batches(
+        EmailType.MONTHLY_SUMMARY,
+        get_users_needing_monthly_summary(),
+        chunk_size,
+        concurrency,
+        delivery_window_minutes=delivery_window_minutes,
+    )
+
+
+@shared_task
+def send_yearly_summaries(
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    delivery_window_minutes: Optional[int] = None,
+) -> dict[str, int | str]:
+    return dispatch_email_batches(
+        EmailType.YEARLY_SUMMARY,
+        get_users_needing_yearly_summary(),
+        chunk_size,
+        concurrency,
+        delivery_window_minutes=delivery_window_minutes,
+    )
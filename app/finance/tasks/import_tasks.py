@@ -0,0 +1,34 @@
+from celery import shared_task
+
+from finance.enums import TransactionType
+from finance.models import TransactionImport
+from finance.utils.transaction_import import (
+    open_import_stream,
+    run_transaction_import,
+)
+
+
+@shared_task
+def import_transactions_file(
+    import_id: str, ofx_expense_type: str = TransactionType.WANT.name
+) -> dict[str, int]:
+    transaction_import = TransactionImport.objects.select_related("user").get(
+        import_id=import_id
+    )
+
+    try:
+        with transaction_import.source.open("rb") as source:
+            result = run_transaction_import(
+                transaction_import,
+                open_import_stream(source),
+                ofx_expense_type=TransactionType[ofx_expense_type],
+            )
+    finally:
+        transaction_import.source.delete(save=False)
+        TransactionImport.objects.filter(pk=transaction_import.pk).update(source="")
+
+    return {
+        "processed": result["processed"],
+        "imported": result["imported"],
+        "failed": result["failed"],
+    }
@@ -0,0 +1,110 @@
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core import mail
+
+from clink.celery import app as celery_app
+from finance.models import EmailLog, UserSettings
+from finance.enums import EmailType
+from finance.tasks.email_tasks import (
+    aggregate_email_batches,
+    dispatch_email_batches,
+    iter_user_id_chunks,
+    send_email_batch,
+    send_weekly_reminders,
+)
+
+
+class EmailFanOutTests(TestCase):
+    def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+        self.users = []
+        for index in range(5):
+            user = User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            UserSettings.objects.create(user=user, weekly_reminder_enabled=True)
+            self.users.append(user)
+
+    def test_iter_user_id_chunks_pages_by_id(self):
+        chunks = list(iter_user_id_chunks(User.objects.all(), 2))
+
+        self.assertEqual(
+            chunks,
+            [
+                [self.users[0].id, self.users[1].id],
+                [self.users[2].id, self.users[3].id],
+                [self.users[4].id],
+            ],
+        )
+
+    def test_dispatch_sends_every_batch(self):
+        result = dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER, User.objects.all(), chunk_size=2, concurrency=2
+        )
+
+        self.assertEqual((result["users"], result["batches"]), (5, 3))
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(EmailLog.objects.filter(success=True).count(), 5)
+
+    @patch("finance.tasks.email_tasks.chord")
+    def test_dispatch_limits_lanes_to_concurrency(self, mock_chord):
+        dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER, User.objects.all(), chunk_size=1, concurrency=2
+        )
+
+        header, callback = mock_chord.call_args.args
+        lanes = list(header.tasks)
+        self.assertEqual(len(lanes), 2)
+        self.assertEqual([len(lane.tasks) for lane in lanes], [3, 2])
+        self.assertEqual(callback.args[0], "WEEKLY_REMINDER")
+
+    @patch("finance.tasks.email_tasks.chord")
+    def test_dispatch_without_users_queues_nothing(self, mock_chord):
+        result = dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER, User.objects.none(), chunk_size=2
+        )
+
+        self.assertEqual((result["users"], result["batches"]), (0, 0))
+        mock_chord.assert_not_called()
+
+    @override_settings(EMAIL_BATCH_SIZE=2, EMAIL_BATCH_CONCURRENCY=1)
+    def test_task_uses_configured_chunk_size(self):
+        result = send_weekly_reminders()
+
+        self.assertEqual((result["users"], result["batches"]), (5, 3))
+
+    def test_batch_accumulates_totals_from_previous_batch(self):
+        result = send_email_batch(
+            {"sent": 3, "failed": 1},
+            EmailType.WEEKLY_REMINDER.name,
+            [self.users[0].id, self.users[1].id],
+        )
+
+        self.assertEqual(result, {"sent": 5, "failed": 1})
+
+    @patch(
+        "finance.utils.email_service.send_message_with_reconnect",
+        side_effect=Exception("SMTP Error"),
+    )
+    def test_batch_counts_failures(self, mock_send):
+        result = send_email_batch(
+            None, EmailType.WEEKLY_REMINDER.name, [self.users[0].id]
+        )
+
+        self.assertEqual(result, {"sent": 0, "failed": 1})
+
+    def test_aggregate_sums_lane_totals(self):
+        result = aggregate_email_batches(
+            [{"sent": 3, "failed": 1}, {"sent": 2, "failed": 0}],
+            EmailType.WEEKLY_SUMMARY.name,
+        )
+
+        self.assertEqual(
+            result, {"email_type": "WEEKLY_SUMMARY", "sent": 5, "failed": 1}
+        )
@@ -0,0 +1,113 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.template.loader import get_template
+
+from finance.emails.rendering import (
+    get_email_templates,
+    render_email,
+    render_emails,
+)
+from finance.emails.weekly_summary.content import (
+    WEEKLY_SUMMARY_TEMPLATE,
+    build_weekly_summary_content,
+    build_weekly_summary_context,
+)
+from finance.emails.weekly_summary.calculations import WeeklySummaryData
+from finance.tasks.email_tasks import build_weekly_summary_emails
+
+
+class EmailRenderingTests(TestCase):
+    def setUp(self):
+        get_email_templates.cache_clear()
+        self.addCleanup(get_email_templates.cache_clear)
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+            first_name="Ann & <Bob>",
+        )
+        self.summary_data: WeeklySummaryData = {
+            "totals_by_category": [{"category": "Groceries", "total": 75.5}],
+            "remaining_budgets": [
+                {
+                    "category": "Groceries",
+                    "budget": 50.0,
+                    "spent": 75.5,
+                    "remaining": -25.5,
+                }
+            ],
+            "grand_total": 75.5,
+        }
+
+    def test_templates_are_compiled_once_per_process(self):
+        with patch(
+            "finance.emails.rendering.get_template", side_effect=get_template
+        ) as mock_get_template:
+            render_email(WEEKLY_SUMMARY_TEMPLATE, {"user_name": "A"})
+            render_email(WEEKLY_SUMMARY_TEMPLATE, {"user_name": "B"})
+
+        self.assertEqual(mock_get_template.call_count, 2)
+
+    def test_renders_text_and_escaped_html(self):
+        rendered = render_email(
+            WEEKLY_SUMMARY_TEMPLATE,
+            build_weekly_summary_context(self.user, self.summary_data),
+        )
+
+        self.assertIn("Hello Ann & <Bob>,", rendered["text"])
+        self.assertIn(
+            "Groceries: $75.50 / $50.00 ($25.50 over budget)", rendered["text"]
+        )
+        self.assertIn("Hello Ann &amp; &lt;Bob&gt;,", rendered["html"])
+        self.assertIn("$25.50 over budget", rendered["html"])
+
+    def test_text_matches_content_builder(self):
+        rendered = render_email(
+            WEEKLY_SUMMARY_TEMPLATE,
+            build_weekly_summary_context(self.user, self.summary_data),
+        )
+
+        self.assertEqual(
+            rendered["text"],
+            build_weekly_summary_content(self.user, self.summary_data),
+        )
+
+    def test_batch_rendering_keeps_contexts_separate(self):
+        rendered = render_emails(
+            WEEKLY_SUMMARY_TEMPLATE,
+            [
+                {"user_name": "First", "totals_by_category": [], "grand_total": 0},
+                {"user_name": "Second", "remaining_budgets": []},
+            ],
+        )
+
+        self.assertEqual(len(rendered), 2)
+        self.assertIn("Hello First,", rendered[0]["text"])
+        self.assertIn("Hello Second,", rendered[1]["text"])
+        self.assertNotIn("First", rendered[1]["html"])
+
+    def test_prepared_emails_are_multipart(self):
+        [email] = build_weekly_summary_emails([self.user])
+
+        message = email["message"]
+        self.assertIn("Hello Ann & <Bob>,", message.body)
+        [(html, mimetype)] = message.alternatives
+        self.assertEqual(mimetype, "text/html")
+        self.assertIn("<html", html)
+
+    def test_benchmark_command_reports_each_template(self):
+        out = StringIO()
+
+        call_command("benchmark_email_rendering", count=2, stdout=out)
+
+        for template_name in [
+            "weekly_reminder",
+            "weekly_summary",
+            "monthly_summary",
+            "yearly_summary",
+        ]:
+            self.assertIn(f"{template_name}: compile per email", out.getvalue())
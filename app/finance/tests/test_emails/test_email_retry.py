@@ -0,0 +1,169 @@
+from io import StringIO
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.management import call_command
+
+from clink.celery import app as celery_app
+from finance.models import EmailDeadLetter, EmailLog
+from finance.enums import EmailType
+from finance.tasks.email_retry_tasks import retry_failed_email
+from finance.utils.email_runs import start_email_run
+from finance.utils.email_service import (
+    build_email_message,
+    email_retry_countdown,
+    schedule_email_retry,
+    send_emails_with_logging,
+)
+
+
+@override_settings(
+    EMAIL_RETRY_BACKOFF_SECONDS=30,
+    EMAIL_RETRY_BACKOFF_MAX_SECONDS=300,
+    EMAIL_RETRY_MAX_ATTEMPTS=3,
+)
+class EmailRetryTests(TestCase):
+    def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+        )
+        self.email_data = {
+            "subject": "Weekly Summary",
+            "recipient": "test@example.com",
+            "content": "Plain body",
+            "html_content": "<p>HTML body</p>",
+        }
+
+    def test_backoff_doubles_until_capped(self):
+        self.assertEqual(
+            [email_retry_countdown(attempt) for attempt in range(1, 6)],
+            [30, 60, 120, 240, 300],
+        )
+
+    def test_retry_is_scheduled_with_backoff(self):
+        with patch("celery.canvas.Signature.apply_async") as mock_apply_async:
+            with self.captureOnCommitCallbacks() as callbacks:
+                schedule_email_retry(
+                    self.user.id, EmailType.WEEKLY_SUMMARY, self.email_data, attempt=3
+                )
+
+            mock_apply_async.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        mock_apply_async.assert_called_once_with(countdown=120)
+
+    def test_failed_batch_send_is_retried_from_stored_content(self):
+        run = start_email_run(EmailType.WEEKLY_SUMMARY, "2026-W42")
+        message = build_email_message(
+            self.user, "Weekly Summary", "Plain body", "<p>HTML body</p>"
+        )
+
+        with (
+            self.captureOnCommitCallbacks(execute=True),
+            patch(
+                "finance.utils.email_service.send_message_with_reconnect",
+                side_effect=Exception("SMTP Error"),
+            ),
+        ):
+            totals = send_emails_with_logging(
+                EmailType.WEEKLY_SUMMARY,
+                [{"user": self.user, "message": message, "template_params": {}}],
+                period_key="2026-W42",
+                run=run,
+            )
+
+        self.assertEqual(totals, {"sent": 0, "failed": 1})
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].body, "Plain body")
+        self.assertEqual(mail.outbox[0].alternatives[0].content, "<p>HTML body</p>")
+        delivered = EmailLog.objects.get(success=True)
+        self.assertEqual(delivered.period_key, "2026-W42")
+        self.assertEqual(delivered.run, run)
+
+    def test_retry_skips_users_already_delivered_for_period(self):
+        EmailLog.objects.create(
+            user=self.user,
+            email_type=EmailType.WEEKLY_SUMMARY.name,
+            period_key="2026-W42",
+            success=True,
+        )
+
+        result = retry_failed_email.delay(
+            EmailType.WEEKLY_SUMMARY.name,
+            self.user.id,
+            self.email_data,
+            period_key="2026-W42",
+        ).get()
+
+        self.assertEqual(result, "skipped")
+        self.assertEqual(len(mail.outbox), 0)
+
+    @patch("django.core.mail.EmailMessage.send", side_effect=Exception("Mailbox full"))
+    def test_permanent_failure_lands_in_dead_letter(self, mock_send):
+        with self.captureOnCommitCallbacks(execute=True):
+            retry_failed_email.delay(
+                EmailType.WEEKLY_SUMMARY.name, self.user.id, self.email_data
+            )
+
+        self.assertEqual(mock_send.call_count, 3)
+        dead_letter = EmailDeadLetter.objects.get()
+        self.assertEqual(dead_letter.user, self.user)
+        self.assertEqual(dead_letter.attempts, 3)
+        self.assertEqual(dead_letter.last_error, "Mailbox full")
+        self.assertEqual(dead_letter.email_data, self.email_data)
+
+
+class ReplayDeadLettersCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser",
+            email="test@example.com",
+            password="testpass123",
+        )
+        for email_type in [EmailType.WEEKLY_SUMMARY, EmailType.MONTHLY_SUMMARY]:
+            EmailDeadLetter.objects.create(
+                user=self.user,
+                email_type=email_type.name,
+                email_data={"subject": "Subject", "content": "Body"},
+                attempts=5,
+            )
+
+    @patch("finance.utils.email_dead_letters.schedule_email_retry")
+    def test_replays_pending_dead_letters_once(self, mock_schedule_retry):
+        out = StringIO()
+        call_command("replay_dead_letters", stdout=out)
+        call_command("replay_dead_letters", stdout=out)
+
+        self.assertEqual(mock_schedule_retry.call_count, 2)
+        self.assertIn("Queued 2 dead letters", out.getvalue())
+        self.assertIn("Queued 0 dead letters", out.getvalue())
+        self.assertFalse(
+            EmailDeadLetter.objects.filter(replayed_at__isnull=True).exists()
+        )
+
+    @patch("finance.utils.email_dead_letters.schedule_email_retry")
+    def test_filters_by_email_type(self, mock_schedule_retry):
+        call_command(
+            "replay_dead_letters", email_type="MONTHLY_SUMMARY", stdout=StringIO()
+        )
+
+        mock_schedule_retry.assert_called_once()
+        self.assertEqual(
+            mock_schedule_retry.call_args.args[1], EmailType.MONTHLY_SUMMARY
+        )
+
+    @patch("finance.utils.email_dead_letters.schedule_email_retry")
+    def test_dry_run_does_not_queue(self, mock_schedule_retry):
+        out = StringIO()
+        call_command("replay_dead_letters", dry_run=True, stdout=out)
+
+        mock_schedule_retry.assert_not_called()
+        self.assertIn("2 dead letters would be replayed", out.getvalue())
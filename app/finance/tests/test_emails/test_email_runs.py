@@ -0,0 +1,180 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core import mail
+
+from clink.celery import app as celery_app
+from finance.models import EmailLog, EmailRun, UserSettings
+from finance.enums import EmailRunStatus, EmailType
+from finance.tasks.email_tasks import (
+    EMAIL_BUILDERS,
+    dispatch_email_batches,
+    send_email_batch,
+)
+from finance.utils.email_runs import email_period_key, start_email_run
+
+
+class EmailPeriodKeyTests(TestCase):
+    def test_period_key_per_email_type(self):
+        when = date(2026, 1, 1)
+
+        self.assertEqual(email_period_key(EmailType.WEEKLY_REMINDER, when), "2026-W01")
+        self.assertEqual(email_period_key(EmailType.WEEKLY_SUMMARY, when), "2026-W01")
+        self.assertEqual(email_period_key(EmailType.MONTHLY_SUMMARY, when), "2026-01")
+        self.assertEqual(email_period_key(EmailType.YEARLY_SUMMARY, when), "2026")
+
+    def test_weekly_key_uses_iso_year(self):
+        self.assertEqual(
+            email_period_key(EmailType.WEEKLY_SUMMARY, date(2024, 12, 30)), "2025-W01"
+        )
+
+
+class EmailRunTests(TestCase):
+    def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+        self.users = []
+        for index in range(5):
+            user = User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            UserSettings.objects.create(user=user, weekly_reminder_enabled=True)
+            self.users.append(user)
+
+    def dispatch(self):
+        return dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER,
+            User.objects.all(),
+            chunk_size=2,
+            concurrency=2,
+            period_key="2026-W42",
+        )
+
+    def log_delivery(self, user, run=None, success=True):
+        EmailLog.objects.create(
+            user=user,
+            email_type=EmailType.WEEKLY_REMINDER.name,
+            period_key="2026-W42",
+            run=run,
+            success=success,
+        )
+
+    def test_completed_run_is_not_repeated(self):
+        first = self.dispatch()
+        second = self.dispatch()
+
+        self.assertEqual(first["run_id"], second["run_id"])
+        self.assertEqual((second["users"], second["batches"]), (0, 0))
+        self.assertEqual(len(mail.outbox), 5)
+
+        run = EmailRun.objects.get(run_id=first["run_id"])
+        self.assertEqual(run.status, EmailRunStatus.COMPLETED.name)
+        self.assertEqual((run.batch_count, run.completed_batches), (3, 3))
+        self.assertEqual(run.sent_count, 5)
+        self.assertEqual(run.logs.filter(period_key="2026-W42").count(), 5)
+
+    def test_interrupted_run_resumes_with_undelivered_users(self):
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
+        self.log_delivery(self.users[0], run)
+        self.log_delivery(self.users[1], run)
+        self.log_delivery(self.users[2], run, success=False)
+
+        result = self.dispatch()
+
+        self.assertEqual(result["run_id"], str(run.run_id))
+        self.assertEqual((result["users"], result["batches"]), (3, 2))
+        self.assertEqual(
+            sorted(message.to[0] for message in mail.outbox),
+            ["user2@example.com", "user3@example.com", "user4@example.com"],
+        )
+        run.refresh_from_db()
+        self.assertEqual(run.status, EmailRunStatus.COMPLETED.name)
+
+    def test_resumed_run_sets_counts_instead_of_adding(self):
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
+        EmailRun.objects.filter(pk=run.pk).update(
+            user_count=5, batch_count=3, completed_batches=1, sent_count=2
+        )
+        self.log_delivery(self.users[0], run)
+        self.log_delivery(self.users[1], run)
+
+        self.dispatch()
+
+        run.refresh_from_db()
+        self.assertEqual(run.status, EmailRunStatus.COMPLETED.name)
+        self.assertEqual((run.user_count, run.sent_count), (5, 5))
+        self.assertEqual((run.batch_count, run.completed_batches), (3, 3))
+        self.assertEqual(run.dispatch_generation, 1)
+
+    def test_batch_from_previous_dispatch_is_skipped(self):
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
+        EmailRun.objects.filter(pk=run.pk).update(dispatch_generation=2)
+
+        totals = send_email_batch(
+            None,
+            EmailType.WEEKLY_REMINDER.name,
+            [self.users[0].id],
+            str(run.run_id),
+            1,
+        )
+
+        self.assertEqual(totals, {"sent": 0, "failed": 0})
+        self.assertEqual(len(mail.outbox), 0)
+        run.refresh_from_db()
+        self.assertEqual(run.completed_batches, 0)
+        self.assertIsNone(run.checkpointed_at)
+
+    def test_failing_batch_does_not_stop_its_lane(self):
+        build_emails = EMAIL_BUILDERS[EmailType.WEEKLY_REMINDER]
+
+        def fail_first_batch(users):
+            if users[0] == self.users[0]:
+                raise RuntimeError("Template error")
+            return build_emails(users)
+
+        with patch.dict(EMAIL_BUILDERS, {EmailType.WEEKLY_REMINDER: fail_first_batch}):
+            dispatch_email_batches(
+                EmailType.WEEKLY_REMINDER,
+                User.objects.all(),
+                chunk_size=2,
+                concurrency=1,
+                period_key="2026-W42",
+            )
+
+        self.assertEqual(len(mail.outbox), 3)
+        run = EmailRun.objects.get(period_key="2026-W42")
+        self.assertEqual(run.status, EmailRunStatus.COMPLETED.name)
+        self.assertEqual((run.batch_count, run.completed_batches), (3, 3))
+        self.assertEqual((run.sent_count, run.failed_count), (3, 2))
+
+    def test_batch_skips_users_delivered_after_dispatch(self):
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
+        self.log_delivery(self.users[0])
+
+        totals = send_email_batch(
+            None,
+            EmailType.WEEKLY_REMINDER.name,
+            [self.users[0].id, self.users[1].id],
+            str(run.run_id),
+        )
+
+        self.assertEqual(totals, {"sent": 1, "failed": 0})
+        self.assertEqual(mail.outbox[0].to, ["user1@example.com"])
+        run.refresh_from_db()
+        self.assertEqual((run.completed_batches, run.sent_count), (1, 1))
+        self.assertIsNotNone(run.checkpointed_at)
+
+    def test_other_periods_are_sent_again(self):
+        self.dispatch()
+
+        result = dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER, User.objects.all(), period_key="2026-W43"
+        )
+
+        self.assertEqual(result["users"], 5)
+        self.assertEqual(EmailRun.objects.count(), 2)
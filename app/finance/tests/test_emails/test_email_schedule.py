@@ -0,0 +1,144 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+
+from clink.celery import app as celery_app
+from finance.models import UserSettings
+from finance.enums import EmailType
+from finance.tasks.email_tasks import dispatch_email_batches, send_monthly_summaries
+from finance.utils.email_runs import start_email_run
+from finance.utils.email_schedule import build_delivery_etas, is_last_day_of_month
+
+
+class DeliveryScheduleTests(TestCase):
+    def test_etas_are_spread_across_window(self):
+        start = timezone.make_aware(datetime(2026, 10, 4, 18, 0))
+
+        etas = build_delivery_etas(4, 60, start)
+
+        self.assertEqual(
+            etas,
+            [
+                None,
+                start + timedelta(minutes=15),
+                start + timedelta(minutes=30),
+                start + timedelta(minutes=45),
+            ],
+        )
+
+    def test_zero_window_sends_immediately(self):
+        self.assertEqual(build_delivery_etas(3, 0), [None, None, None])
+
+    def test_last_day_of_month(self):
+        self.assertTrue(is_last_day_of_month(date(2024, 2, 29)))
+        self.assertFalse(is_last_day_of_month(date(2025, 2, 28) - timedelta(days=1)))
+        self.assertTrue(is_last_day_of_month(date(2025, 12, 31)))
+
+    def test_beat_schedule_points_at_registered_tasks(self):
+        celery_app.loader.import_default_modules()
+
+        for entry in settings.CELERY_BEAT_SCHEDULE.values():
+            self.assertIn(entry["task"], celery_app.tasks)
+
+
+class ScheduledDispatchTests(TestCase):
+    def setUp(self):
+        self.users = []
+        for index in range(4):
+            user = User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            UserSettings.objects.create(user=user)
+            self.users.append(user)
+
+    @patch("finance.tasks.email_tasks.chord")
+    def test_batches_get_increasing_etas(self, mock_chord):
+        dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER,
+            User.objects.all(),
+            chunk_size=1,
+            concurrency=2,
+            delivery_window_minutes=40,
+        )
+
+        header, _ = mock_chord.call_args.args
+        first_lane, second_lane = [list(lane.tasks) for lane in header.tasks]
+        etas = [
+            first_lane[0].options.get("eta"),
+            second_lane[0].options["eta"],
+            first_lane[1].options["eta"],
+            second_lane[1].options["eta"],
+        ]
+
+        self.assertIsNone(etas[0])
+        self.assertEqual(etas[2] - etas[1], timedelta(minutes=10))
+        self.assertEqual(etas[3] - etas[2], timedelta(minutes=10))
+
+    @override_settings(EMAIL_DELIVERY_WINDOW_MINUTES=0)
+    @patch("finance.tasks.email_tasks.chord")
+    def test_window_can_be_disabled(self, mock_chord):
+        dispatch_email_batches(
+            EmailType.WEEKLY_REMINDER, User.objects.all(), chunk_size=1
+        )
+
+        header, _ = mock_chord.call_args.args
+        for lane in header.tasks:
+            for signature in lane.tasks:
+                self.assertNotIn("eta", signature.options)
+
+    @patch("finance.tasks.email_tasks.dispatch_email_batches")
+    @patch("finance.tasks.email_tasks.timezone.localdate")
+    def test_monthly_summary_waits_for_last_day(self, mock_localdate, mock_dispatch):
+        mock_localdate.return_value = date(2026, 10, 30)
+        send_monthly_summaries(last_day_only=True)
+        mock_dispatch.assert_not_called()
+
+        mock_localdate.return_value = date(2026, 10, 31)
+        send_monthly_summaries(last_day_only=True)
+        mock_dispatch.assert_called_once()
+
+
+class EmailQueueStatusCommandTests(TestCase):
+    @patch(
+        "finance.management.commands.email_queue_status.get_worker_task_counts",
+        return_value={"active": 2, "reserved": 1, "scheduled": 7},
+    )
+    @patch(
+        "finance.management.commands.email_queue_status.get_broker_queue_depths",
+        return_value={"email": 12},
+    )
+    def test_reports_queue_depth_and_run_progress(self, mock_depths, mock_counts):
+        run = start_email_run(EmailType.WEEKLY_SUMMARY, "2026-W42")
+        run.batch_count = 10
+        run.completed_batches = 3
+        run.sent_count = 1500
+        run.save()
+        out = StringIO()
+
+        call_command("email_queue_status", stdout=out)
+
+        output = out.getvalue()
+        mock_depths.assert_called_once_with(["email", "email_retry"])
+        self.assertIn("Queue email: 12 waiting", output)
+        self.assertIn("2 active, 1 reserved, 7 scheduled", output)
+        self.assertIn("WEEKLY_SUMMARY 2026-W42: 3/10 batches, 1500 sent", output)
+
+    @patch(
+        "finance.management.commands.email_queue_status.get_broker_queue_depths",
+        side_effect=ConnectionError("refused"),
+    )
+    def test_reports_unavailable_broker(self, mock_depths):
+        out = StringIO()
+
+        call_command("email_queue_status", stdout=out)
+
+        self.assertIn("Broker unavailable: refused", out.getvalue())
+        self.assertIn("No email runs in progress.", out.getvalue())
@@ -122,3 +122,18 @@ class MonthlySummaryQueriesTests(TestCase):
         users = get_users_needing_monthly_summary()
 
         self.assertIn(self.user_with_transactions, users)
+
+    def test_each_user_is_returned_once(self):
+        for _ in range(3):
+            Transaction.objects.create(
+                user=self.user_with_transactions,
+                type=TransactionType.NEED.name,
+                category="Groceries",
+                amount_in_cents=5000,
+                date_of_expense=timezone.now().date(),
+            )
+
+        users = get_users_needing_monthly_summary()
+
+        self.assertEqual(list(users), [self.user_with_transactions])
+        self.assertIn("EXISTS", str(users.query).upper())
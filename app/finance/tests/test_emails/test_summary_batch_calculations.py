@@ -0,0 +1,115 @@
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.utils import timezone
+from datetime import timedelta
+
+from finance.models import Transaction, Budget
+from finance.emails.weekly_summary.calculations import (
+    calculate_weekly_totals,
+    calculate_weekly_totals_for_users,
+)
+from finance.emails.monthly_summary.calculations import (
+    calculate_monthly_totals,
+    calculate_monthly_totals_for_users,
+)
+from finance.emails.yearly_summary.calculations import (
+    calculate_yearly_totals,
+    calculate_yearly_totals_for_users,
+)
+from finance.enums import TransactionType
+
+
+class SummaryBatchCalculationsTests(TestCase):
+    def setUp(self):
+        today = timezone.now().date()
+        self.users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            for index in range(4)
+        ]
+
+        for index, user in enumerate(self.users[:3]):
+            Transaction.objects.create(
+                user=user,
+                type=TransactionType.NEED.name,
+                category="Groceries",
+                amount_in_cents=5000 + index,
+                date_of_expense=today,
+            )
+            Transaction.objects.create(
+                user=user,
+                type=TransactionType.WANT.name,
+                category="Dining",
+                amount_in_cents=2000 * (index + 1),
+                date_of_expense=today - timedelta(days=index),
+            )
+            Transaction.objects.create(
+                user=user,
+                type=TransactionType.INCOME.name,
+                category="Salary",
+                amount_in_cents=300000,
+                date_of_expense=today,
+            )
+            Budget.objects.create(
+                user=user,
+                type=TransactionType.NEED.name,
+                category="Groceries",
+                amount_in_cents=20000,
+                carried_over_amount_in_cents=1000 * index,
+                budget_year=today.year,
+                budget_month=today.month,
+            )
+            Budget.objects.create(
+                user=user,
+                type=TransactionType.WANT.name,
+                category="Travel",
+                amount_in_cents=10000,
+                budget_year=today.year,
+                budget_month=today.month,
+            )
+
+        self.user_ids = [user.id for user in self.users]
+
+    def test_weekly_batch_matches_per_user_calculation(self):
+        summaries = calculate_weekly_totals_for_users(self.user_ids)
+
+        self.assertEqual(
+            summaries,
+            {user.id: calculate_weekly_totals(user) for user in self.users},
+        )
+
+    def test_monthly_batch_matches_per_user_calculation(self):
+        summaries = calculate_monthly_totals_for_users(self.user_ids)
+
+        self.assertEqual(
+            summaries,
+            {user.id: calculate_monthly_totals(user) for user in self.users},
+        )
+
+    def test_yearly_batch_matches_per_user_calculation(self):
+        summaries = calculate_yearly_totals_for_users(self.user_ids)
+
+        self.assertEqual(
+            summaries,
+            {user.id: calculate_yearly_totals(user) for user in self.users},
+        )
+
+    def test_user_without_data_gets_empty_summary(self):
+        summary = calculate_weekly_totals_for_users([self.users[3].id])[
+            self.users[3].id
+        ]
+
+        self.assertEqual(summary["totals_by_category"], [])
+        self.assertEqual(summary["remaining_budgets"], [])
+        self.assertEqual(summary["grand_total"], 0)
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        with self.assertNumQueries(3):
+            calculate_weekly_totals_for_users(self.user_ids)
+        with self.assertNumQueries(1):
+            calculate_monthly_totals_for_users(self.user_ids)
+        with self.assertNumQueries(1):
+            calculate_yearly_totals_for_users(self.user_ids)
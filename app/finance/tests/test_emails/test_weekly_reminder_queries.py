@@ -101,3 +101,22 @@ class WeeklyReminderQueriesTests(TestCase):
         users = get_users_needing_reminders()
 
         self.assertNotIn(self.user_with_settings, users)
+
+    def test_uses_correlated_not_exists_without_distinct(self):
+        sql = str(get_users_needing_reminders().query).upper()
+
+        self.assertIn("NOT EXISTS", sql)
+        self.assertNotIn("DISTINCT", sql)
+        self.assertNotIn(" NOT IN ", sql)
+
+    def test_loads_only_recipient_fields(self):
+        user = get_users_needing_reminders().get(id=self.user_with_settings.id)
+
+        self.assertEqual(
+            user.get_deferred_fields(),
+            {
+                field.attname
+                for field in User._meta.concrete_fields
+                if field.attname not in {"id", "username", "first_name", "email"}
+            },
+        )
@@ -5,12 +5,16 @@ from django.utils import timezone
 from datetime import timedelta
 
 from finance.models import UserSettings, Transaction, EmailLog
+from clink.celery import app as celery_app
 from finance.tasks.email_tasks import send_weekly_reminders
 from finance.enums import TransactionType, EmailType
 
 
 class WeeklyReminderTaskTests(TestCase):
     def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
         self.user_needs_reminder = User.objects.create_user(
             username="user1",
             email="user1@example.com",
@@ -51,8 +55,8 @@ class WeeklyReminderTaskTests(TestCase):
     def test_send_weekly_reminders_sends_to_eligible_users(self):
         result = send_weekly_reminders()
 
-        self.assertEqual(result["sent"], 1)
-        self.assertEqual(result["failed"], 0)
+        self.assertEqual(result["users"], 1)
+        self.assertEqual(result["batches"], 1)
         self.assertEqual(len(mail.outbox), 1)
 
     def test_email_sent_has_correct_recipient(self):
@@ -103,5 +107,5 @@ class WeeklyReminderTaskTests(TestCase):
 
         result = send_weekly_reminders()
 
-        self.assertEqual(result["sent"], 2)
+        self.assertEqual(result["users"], 2)
         self.assertEqual(len(mail.outbox), 2)
@@ -5,12 +5,16 @@ from django.utils import timezone
 from datetime import timedelta
 
 from finance.models import UserSettings, Transaction, EmailLog, Budget
+from clink.celery import app as celery_app
 from finance.tasks.email_tasks import send_weekly_summaries
 from finance.enums import TransactionType, EmailType
 
 
 class WeeklySummaryTaskTests(TestCase):
     def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
         self.user_with_transactions = User.objects.create_user(
             username="user1",
             email="user1@example.com",
@@ -58,8 +62,8 @@ class WeeklySummaryTaskTests(TestCase):
     def test_send_weekly_summaries_sends_to_eligible_users(self):
         result = send_weekly_summaries()
 
-        self.assertEqual(result["sent"], 1)
-        self.assertEqual(result["failed"], 0)
+        self.assertEqual(result["users"], 1)
+        self.assertEqual(result["batches"], 1)
         self.assertEqual(len(mail.outbox), 1)
 
     def test_email_sent_has_correct_recipient(self):
@@ -121,7 +125,7 @@ class WeeklySummaryTaskTests(TestCase):
 
         result = send_weekly_summaries()
 
-        self.assertEqual(result["sent"], 2)
+        self.assertEqual(result["users"], 2)
         self.assertEqual(len(mail.outbox), 2)
 
     def test_includes_budget_information_when_available(self):
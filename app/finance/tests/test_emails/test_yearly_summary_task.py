@@ -4,12 +4,16 @@ from django.core import mail
 from django.utils import timezone
 
 from finance.models import UserSettings, Transaction, EmailLog
+from clink.celery import app as celery_app
 from finance.tasks.email_tasks import send_yearly_summaries
 from finance.enums import TransactionType, EmailType
 
 
 class YearlySummaryTaskTests(TestCase):
     def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
         current_date = timezone.now()
 
         self.user_with_transactions = User.objects.create_user(
@@ -59,8 +63,8 @@ class YearlySummaryTaskTests(TestCase):
     def test_send_yearly_summaries_sends_to_eligible_users(self):
         result = send_yearly_summaries()
 
-        self.assertEqual(result["sent"], 1)
-        self.assertEqual(result["failed"], 0)
+        self.assertEqual(result["users"], 1)
+        self.assertEqual(result["batches"], 1)
         self.assertEqual(len(mail.outbox), 1)
 
     def test_email_sent_has_correct_recipient(self):
@@ -128,7 +132,7 @@ class YearlySummaryTaskTests(TestCase):
 
         result = send_yearly_summaries()
 
-        self.assertEqual(result["sent"], 2)
+        self.assertEqual(result["users"], 2)
         self.assertEqual(len(mail.outbox), 2)
 
     def test_excludes_users_with_only_previous_year_transactions(self):
@@ -151,5 +155,5 @@ class YearlySummaryTaskTests(TestCase):
 
         result = send_yearly_summaries()
 
-        self.assertEqual(result["sent"], 1)
+        self.assertEqual(result["users"], 1)
         self.assertFalse(EmailLog.objects.filter(user=user5).exists())
@@ -1,8 +1,11 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
 from django.core.exceptions import ValidationError
 
 from finance.forms import (
+    BudgetCopyForm,
     BudgetItemForm,
     MultiBudgetForm,
     BudgetItemFormSet,
@@ -388,6 +391,63 @@ class MultiBudgetFormSaveTests(TestCase):
         self.assertIsInstance(budgets, list)
         self.assertIsInstance(budgets[0], Budget)
 
+    def test_save_keeps_existing_budget_identity_and_settings(self):
+        existing = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Vacation",
+            amount_in_cents=10000,
+            allow_carry_over=True,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+        form = MultiBudgetForm(
+            data={
+                "year": 2025,
+                "month": 10,
+                "budgets": [
+                    {
+                        "type": TransactionType.SAVINGS.name,
+                        "category": "Vacation",
+                        "amount": 250.00,
+                    },
+                ],
+            }
+        )
+        self.assertTrue(form.is_valid())
+
+        budgets = form.save(self.user)
+
+        existing.refresh_from_db()
+        self.assertEqual(budgets[0].id, existing.id)
+        self.assertEqual(existing.amount_in_cents, 25000)
+        self.assertTrue(existing.allow_carry_over)
+
+    def test_save_query_count_does_not_grow_with_budget_count(self):
+        def save_budgets(month, count):
+            form = MultiBudgetForm(
+                data={
+                    "year": 2025,
+                    "month": month,
+                    "budgets": [
+                        {
+                            "type": TransactionType.NEED.name,
+                            "category": f"Category {index}",
+                            "amount": 10.00,
+                        }
+                        for index in range(count)
+                    ],
+                }
+            )
+            self.assertTrue(form.is_valid())
+            with CaptureQueriesContext(connection) as queries:
+                form.save(self.user)
+            return len(queries)
+
+        self.assertEqual(save_budgets(10, 2), save_budgets(11, 40))
+        self.assertEqual(Budget.objects.filter(user=self.user).count(), 42)
+
     def test_save_invalid_form_raises_error(self):
         data = {"year": 2025, "month": 13, "budgets": []}
         form = MultiBudgetForm(data=data)
@@ -563,3 +623,51 @@ class InternalTransferFormTests(TestCase):
         form = InternalTransferForm(data=data)
         self.assertTrue(form.is_valid())
         self.assertEqual(form.cleaned_data.get("description", ""), "")
+
+
+class BudgetCopyFormTests(TestCase):
+    def test_builds_target_months_across_year_boundary(self):
+        form = BudgetCopyForm(
+            data={
+                "source_year": 2025,
+                "source_month": 10,
+                "start_year": 2025,
+                "start_month": 11,
+                "end_year": 2026,
+                "end_month": 2,
+            }
+        )
+
+        self.assertTrue(form.is_valid())
+        self.assertEqual(
+            form.cleaned_data["target_months"],
+            [(2025, 11), (2025, 12), (2026, 1), (2026, 2)],
+        )
+
+    def test_end_before_start_is_invalid(self):
+        form = BudgetCopyForm(
+            data={
+                "source_year": 2025,
+                "source_month": 10,
+                "start_year": 2025,
+                "start_month": 11,
+                "end_year": 2025,
+                "end_month": 10,
+            }
+        )
+
+        self.assertFalse(form.is_valid())
+
+    def test_range_is_limited(self):
+        form = BudgetCopyForm(
+            data={
+                "source_year": 2025,
+                "source_month": 1,
+                "start_year": 2025,
+                "start_month": 1,
+                "end_year": 2030,
+                "end_month": 12,
+            }
+        )
+
+        self.assertFalse(form.is_valid())
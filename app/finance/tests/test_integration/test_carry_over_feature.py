@@ -401,8 +401,8 @@ class DashboardViewCarryOverTests(TestCase):
         )
         self.client.login(username="testuser", password="testpass123")
 
-    def test_dashboard_triggers_carry_over_processing(self):
-        jan_budget = Budget.objects.create(
+    def test_dashboard_does_not_process_carry_over(self):
+        Budget.objects.create(
             user=self.user,
             type=TransactionType.SAVINGS.name,
             category="Emergency Fund",
@@ -412,21 +412,12 @@ class DashboardViewCarryOverTests(TestCase):
             allow_carry_over=True,
         )
 
-        self.assertFalse(
-            Budget.objects.filter(
-                user=self.user,
-                category="Emergency Fund",
-                budget_year=2025,
-                budget_month=2,
-            ).exists()
-        )
-
         response = self.client.get(
             reverse("home_with_date", kwargs={"year": 2025, "month": 2})
         )
         self.assertEqual(response.status_code, 200)
 
-        self.assertTrue(
+        self.assertFalse(
             Budget.objects.filter(
                 user=self.user,
                 category="Emergency Fund",
@@ -435,10 +426,22 @@ class DashboardViewCarryOverTests(TestCase):
             ).exists()
         )
 
-        feb_budget = Budget.objects.get(
+    def test_dashboard_shows_materialized_carry_over(self):
+        Budget.objects.create(
             user=self.user,
+            type=TransactionType.SAVINGS.name,
             category="Emergency Fund",
+            amount_in_cents=100000,
             budget_year=2025,
-            budget_month=2,
+            budget_month=1,
+            allow_carry_over=True,
         )
-        self.assertEqual(feb_budget.carried_over_amount_in_cents, 100000)
+        process_month_end_carry_over(self.user, 2025, 1)
+
+        response = self.client.get(
+            reverse("home_with_date", kwargs={"year": 2025, "month": 2})
+        )
+
+        savings_items = response.context["budget_data"][TransactionType.SAVINGS.value]
+        self.assertEqual(len(savings_items), 1)
+        self.assertEqual(savings_items[0]["carried_over"], 1000)
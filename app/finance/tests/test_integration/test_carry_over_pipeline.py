@@ -0,0 +1,282 @@
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.utils import timezone
+
+from finance.models import Budget, Transaction, InternalTransfer
+from finance.enums.transaction_enums import TransactionType
+from finance.tasks.carry_over_tasks import (
+    process_carry_over_for_user,
+    process_month_end_carry_overs,
+)
+from finance.utils.budget_calculator import process_carry_over_chain
+
+
+def months_ago(count: int) -> tuple[int, int]:
+    current_date = timezone.now()
+    month_index = current_date.year * 12 + current_date.month - 1 - count
+    year, month_offset = divmod(month_index, 12)
+    return year, month_offset + 1
+
+
+class CarryOverPipelineTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def create_carry_over_budget(self, year: int, month: int) -> Budget:
+        return Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=100000,
+            budget_year=year,
+            budget_month=month,
+            allow_carry_over=True,
+        )
+
+    def get_budget(self, year: int, month: int) -> Budget:
+        return Budget.objects.get(
+            user=self.user,
+            category="Emergency Fund",
+            budget_year=year,
+            budget_month=month,
+        )
+
+
+class ProcessCarryOverChainTests(CarryOverPipelineTestCase):
+    def test_walks_forward_through_requested_month(self):
+        self.create_carry_over_budget(2024, 11)
+
+        results = process_carry_over_chain(self.user, 2024, 11, 2025, 2)
+
+        self.assertEqual(len(results), 3)
+        self.assertEqual(self.get_budget(2024, 12).carried_over_amount_in_cents, 100000)
+        self.assertEqual(self.get_budget(2025, 1).carried_over_amount_in_cents, 200000)
+        self.assertEqual(self.get_budget(2025, 2).carried_over_amount_in_cents, 300000)
+        self.assertFalse(
+            Budget.objects.filter(budget_year=2025, budget_month=3).exists()
+        )
+
+    def test_does_nothing_when_already_at_target_month(self):
+        self.create_carry_over_budget(2025, 2)
+
+        self.assertEqual(process_carry_over_chain(self.user, 2025, 2, 2025, 2), [])
+
+    @patch(
+        "finance.utils.budget_calculator.calculate_carry_over_amount",
+        side_effect=[100000, 100000, 200000, RuntimeError("Interrupted")],
+    )
+    def test_interrupted_month_is_rolled_back(self, mock_carry_over):
+        self.create_carry_over_budget(2024, 11)
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Vacation",
+            amount_in_cents=100000,
+            budget_year=2024,
+            budget_month=11,
+            allow_carry_over=True,
+        )
+
+        with self.assertRaises(RuntimeError):
+            process_carry_over_chain(self.user, 2024, 11, 2025, 2)
+
+        self.assertEqual(self.get_budget(2024, 12).carried_over_amount_in_cents, 100000)
+        self.assertFalse(
+            Budget.objects.filter(budget_year=2025, budget_month=1).exists()
+        )
+
+
+class CarryOverTaskTests(CarryOverPipelineTestCase):
+    def test_process_carry_over_for_user_refreshes_chain_to_current_month(self):
+        start_year, start_month = months_ago(2)
+        middle_year, middle_month = months_ago(1)
+        current_year, current_month = months_ago(0)
+        self.create_carry_over_budget(start_year, start_month)
+
+        result = process_carry_over_for_user(self.user.id, start_year, start_month)
+
+        self.assertEqual(result["months_processed"], 2)
+        self.assertEqual(
+            self.get_budget(middle_year, middle_month).carried_over_amount_in_cents,
+            100000,
+        )
+        self.assertEqual(
+            self.get_budget(current_year, current_month).carried_over_amount_in_cents,
+            200000,
+        )
+
+    def test_process_carry_over_for_unknown_user(self):
+        result = process_carry_over_for_user(999999, 2025, 1)
+
+        self.assertEqual(result, {"months_processed": 0, "budgets_processed": 0})
+
+    @patch("finance.tasks.carry_over_tasks.process_carry_over_for_user.delay")
+    def test_month_end_task_queues_users_with_carry_over_budgets(self, mock_delay):
+        prev_year, prev_month = months_ago(1)
+        self.create_carry_over_budget(prev_year, prev_month)
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Fun",
+            amount_in_cents=10000,
+            budget_year=prev_year,
+            budget_month=prev_month,
+            allow_carry_over=True,
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        Budget.objects.create(
+            user=other_user,
+            type=TransactionType.WANT.name,
+            category="Fun",
+            amount_in_cents=10000,
+            budget_year=prev_year,
+            budget_month=prev_month,
+        )
+
+        result = process_month_end_carry_overs()
+
+        self.assertEqual(result, {"queued": 1})
+        mock_delay.assert_called_once_with(self.user.id, prev_year, prev_month)
+
+
+@patch("finance.signals.carry_over_signals.process_carry_over_for_user.delay")
+class CarryOverInvalidationTests(CarryOverPipelineTestCase):
+    def test_prior_month_transaction_schedules_refresh(self, mock_delay):
+        prev_year, prev_month = months_ago(1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Transaction.objects.create(
+                user=self.user,
+                type=TransactionType.SAVINGS.name,
+                category="Emergency Fund",
+                amount_in_cents=5000,
+                date_of_expense=date(prev_year, prev_month, 10),
+            )
+
+        mock_delay.assert_called_once_with(self.user.id, prev_year, prev_month)
+
+    def test_current_month_transaction_does_not_schedule_refresh(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            Transaction.objects.create(
+                user=self.user,
+                type=TransactionType.SAVINGS.name,
+                category="Emergency Fund",
+                amount_in_cents=5000,
+                date_of_expense=timezone.now().date(),
+            )
+
+        mock_delay.assert_not_called()
+
+    def test_moving_transaction_out_of_prior_month_refreshes_from_original_month(
+        self, mock_delay
+    ):
+        old_year, old_month = months_ago(3)
+        transaction = Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=5000,
+            date_of_expense=date(old_year, old_month, 10),
+        )
+        transaction = Transaction.objects.get(id=transaction.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transaction.date_of_expense = timezone.now().date()
+            transaction.save()
+
+        mock_delay.assert_called_once_with(self.user.id, old_year, old_month)
+
+    def test_prior_month_budget_change_schedules_refresh(self, mock_delay):
+        prev_year, prev_month = months_ago(1)
+        budget = self.create_carry_over_budget(prev_year, prev_month)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            budget.amount_in_cents = 5000
+            budget.save()
+
+        mock_delay.assert_called_once_with(self.user.id, prev_year, prev_month)
+
+    def test_new_budget_refreshes_from_month_before(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_carry_over_budget(*months_ago(0))
+
+        mock_delay.assert_called_once_with(self.user.id, *months_ago(1))
+
+    def test_prior_month_transfer_deletion_schedules_refresh(self, mock_delay):
+        prev_year, prev_month = months_ago(1)
+        budget = self.create_carry_over_budget(prev_year, prev_month)
+        transfer = InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=budget,
+            amount_in_cents=1000,
+            transfer_date=date(prev_year, prev_month, 3),
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            transfer.delete()
+
+        mock_delay.assert_called_once_with(self.user.id, prev_year, prev_month)
+
+    def test_chain_processing_does_not_schedule_refresh(self, mock_delay):
+        start_year, start_month = months_ago(3)
+        self.create_carry_over_budget(start_year, start_month)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            process_carry_over_for_user(self.user.id, start_year, start_month)
+
+        mock_delay.assert_not_called()
+
+
+class BackfillCarryOversCommandTests(CarryOverPipelineTestCase):
+    def test_backfills_chain_for_every_user(self):
+        start_year, start_month = months_ago(2)
+        current_year, current_month = months_ago(0)
+        self.create_carry_over_budget(start_year, start_month)
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        Budget.objects.create(
+            user=other_user,
+            type=TransactionType.WANT.name,
+            category="Fun",
+            amount_in_cents=10000,
+            budget_year=current_year,
+            budget_month=current_month,
+            allow_carry_over=True,
+        )
+        out = StringIO()
+
+        call_command("backfill_carry_overs", stdout=out)
+
+        self.assertEqual(
+            self.get_budget(current_year, current_month).carried_over_amount_in_cents,
+            200000,
+        )
+        self.assertIn("2 users", out.getvalue())
+
+    def test_limits_backfill_to_given_users(self):
+        start_year, start_month = months_ago(1)
+        current_year, current_month = months_ago(0)
+        self.create_carry_over_budget(start_year, start_month)
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+
+        call_command(
+            "backfill_carry_overs", user_ids=[other_user.id], stdout=StringIO()
+        )
+
+        self.assertFalse(
+            Budget.objects.filter(
+                budget_year=current_year, budget_month=current_month
+            ).exists()
+        )
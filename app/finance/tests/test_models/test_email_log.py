@@ -1,5 +1,9 @@
+from datetime import timedelta
+from io import StringIO
+
 from django.test import TestCase
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.utils import timezone
 
 from finance.models import EmailLog
@@ -120,3 +124,41 @@ class EmailLogModelTests(TestCase):
         )
 
         self.assertFalse(email_log.success)
+
+
+class PruneEmailLogsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+
+    def create_log(self, days_ago):
+        email_log = EmailLog.objects.create(
+            user=self.user, email_type=EmailType.WEEKLY_SUMMARY.name, success=True
+        )
+        EmailLog.objects.filter(id=email_log.id).update(
+            sent_at=timezone.now() - timedelta(days=days_ago)
+        )
+        return email_log
+
+    def test_deletes_logs_older_than_retention_in_chunks(self):
+        for _ in range(5):
+            self.create_log(days_ago=40)
+        recent_log = self.create_log(days_ago=5)
+        out = StringIO()
+
+        call_command("prune_email_logs", days=30, chunk_size=2, stdout=out)
+
+        self.assertEqual(
+            list(EmailLog.objects.values_list("id", flat=True)), [recent_log.id]
+        )
+        self.assertIn("Deleted 5 email logs", out.getvalue())
+
+    def test_dry_run_keeps_logs(self):
+        self.create_log(days_ago=40)
+        out = StringIO()
+
+        call_command("prune_email_logs", days=30, dry_run=True, stdout=out)
+
+        self.assertEqual(EmailLog.objects.count(), 1)
+        self.assertIn("1 email logs", out.getvalue())
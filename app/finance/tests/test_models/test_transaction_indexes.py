@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+from unittest import skipUnless
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.db import connection
+
+from finance.models import Transaction
+from finance.enums import TransactionType
+from finance.utils.date_utils import month_date_range, year_date_range
+from finance.utils.transaction_listing import (
+    get_transaction_page,
+    get_transaction_page_queryset,
+)
+
+
+class DateRangeTests(TestCase):
+    def test_month_date_range(self):
+        self.assertEqual(
+            month_date_range(2025, 3), (date(2025, 3, 1), date(2025, 4, 1))
+        )
+        self.assertEqual(
+            month_date_range(2025, 12), (date(2025, 12, 1), date(2026, 1, 1))
+        )
+
+    def test_year_date_range(self):
+        self.assertEqual(year_date_range(2025), (date(2025, 1, 1), date(2026, 1, 1)))
+
+    def test_month_filter_includes_boundaries(self):
+        user = User.objects.create_user(username="testuser", password="testpass123")
+        for expense_date in ["2025-02-28", "2025-03-01", "2025-03-31", "2025-04-01"]:
+            Transaction.objects.create(
+                user=user,
+                type=TransactionType.NEED.name,
+                category="Rent",
+                amount_in_cents=100,
+                date_of_expense=expense_date,
+            )
+
+        page = get_transaction_page(user, 2025, 3)
+
+        self.assertEqual(
+            [row["date_of_expense"] for row in page["transactions"]],
+            [date(2025, 3, 31), date(2025, 3, 1)],
+        )
+
+
+@skipUnless(connection.vendor == "postgresql", "EXPLAIN plans are PostgreSQL-specific")
+class TransactionIndexUsageTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.users = [
+            User.objects.create_user(username=f"user{index}", password="testpass123")
+            for index in range(20)
+        ]
+        start_date = date(2023, 1, 1)
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    user=user,
+                    type=TransactionType.WANT.name,
+                    category=f"Category {day % 15}",
+                    amount_in_cents=1000 + day,
+                    date_of_expense=start_date + timedelta(days=day),
+                )
+                for user in cls.users
+                for day in range(0, 1000, 2)
+            ]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE finance_transaction")
+
+    def explain(self, queryset) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        return queryset.explain()
+
+    def test_month_listing_uses_user_date_index(self):
+        plan = self.explain(get_transaction_page_queryset(self.users[0], 2024, 6)[:51])
+
+        self.assertIn("finance_txn_user_date_idx", plan)
+
+    def test_month_listing_after_cursor_uses_user_date_index(self):
+        cursor = (date(2024, 6, 15), 10**9)
+        plan = self.explain(
+            get_transaction_page_queryset(self.users[0], 2024, 6, cursor)[:51]
+        )
+
+        self.assertIn("finance_txn_user_date_idx", plan)
+
+    def test_category_month_filter_uses_category_index(self):
+        start_date, end_date = month_date_range(2024, 6)
+        transactions = Transaction.objects.filter(
+            user=self.users[0],
+            type=TransactionType.WANT.name,
+            category="Category 3",
+            date_of_expense__gte=start_date,
+            date_of_expense__lt=end_date,
+        )
+
+        self.assertIn("finance_txn_user_cat_date_idx", self.explain(transactions))
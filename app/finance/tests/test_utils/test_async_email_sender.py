@@ -0,0 +1,162 @@
+import threading
+import time
+from email import message_from_bytes
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from clink.celery import app as celery_app
+from finance.models import EmailLog, UserSettings
+from finance.enums import EmailType
+from finance.tasks.email_tasks import send_email_batch
+from finance.utils.async_email_sender import send_messages_concurrently
+from finance.utils.email_service import build_email_message
+from finance.utils.fake_smtp_server import FakeSMTPServer
+
+
+class TrackingEmailBackend(EmailBackend):
+    lock = threading.Lock()
+    created = 0
+    active = 0
+    max_active = 0
+    refused = set()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        with TrackingEmailBackend.lock:
+            TrackingEmailBackend.created += 1
+
+    def send_messages(self, messages):
+        with TrackingEmailBackend.lock:
+            TrackingEmailBackend.active += 1
+            TrackingEmailBackend.max_active = max(
+                TrackingEmailBackend.max_active, TrackingEmailBackend.active
+            )
+        try:
+            time.sleep(0.01)
+            if messages[0].to[0] in TrackingEmailBackend.refused:
+                raise ValueError("Recipient refused")
+            return super().send_messages(messages)
+        finally:
+            with TrackingEmailBackend.lock:
+                TrackingEmailBackend.active -= 1
+
+
+@override_settings(
+    EMAIL_BACKEND="finance.tests.test_utils.test_async_email_sender.TrackingEmailBackend"
+)
+class AsyncEmailSenderTests(TestCase):
+    def setUp(self):
+        TrackingEmailBackend.created = 0
+        TrackingEmailBackend.active = 0
+        TrackingEmailBackend.max_active = 0
+        TrackingEmailBackend.refused = set()
+        self.users = [
+            User(username=f"user{index}", email=f"user{index}@example.com")
+            for index in range(12)
+        ]
+        self.messages = [
+            build_email_message(user, "Subject", f"Hello {user.username}")
+            for user in self.users
+        ]
+
+    def test_sends_all_messages(self):
+        errors = send_messages_concurrently(
+            EmailType.WEEKLY_SUMMARY, self.messages, concurrency=4, pool_size=4
+        )
+
+        self.assertEqual(errors, [None] * 12)
+        self.assertEqual(
+            sorted(message.body for message in mail.outbox),
+            sorted(message.body for message in self.messages),
+        )
+
+    def test_concurrency_is_bounded_and_sessions_are_reused(self):
+        send_messages_concurrently(
+            EmailType.WEEKLY_SUMMARY, self.messages, concurrency=3, pool_size=2
+        )
+
+        self.assertEqual(TrackingEmailBackend.created, 2)
+        self.assertEqual(TrackingEmailBackend.max_active, 2)
+
+    def test_reports_per_message_results_in_order(self):
+        TrackingEmailBackend.refused = {"user3@example.com"}
+
+        errors = send_messages_concurrently(
+            EmailType.WEEKLY_SUMMARY, self.messages, concurrency=4, pool_size=4
+        )
+
+        self.assertEqual(str(errors[3]), "Recipient refused")
+        self.assertEqual(errors[:3] + errors[4:], [None] * 11)
+        self.assertEqual(len(mail.outbox), 11)
+
+    def test_empty_batch_does_not_connect(self):
+        self.assertEqual(send_messages_concurrently(EmailType.WEEKLY_SUMMARY, []), [])
+        self.assertEqual(TrackingEmailBackend.created, 0)
+
+
+class FakeSMTPServerTests(TestCase):
+    def test_delivers_over_smtp_to_fake_server(self):
+        users = [
+            User(username=f"user{index}", email=f"user{index}@example.com")
+            for index in range(6)
+        ]
+        messages = [
+            build_email_message(user, "Subject", f"Hello {user.username}")
+            for user in users
+        ]
+
+        with FakeSMTPServer(latency=0.001) as server:
+            errors = send_messages_concurrently(
+                EmailType.WEEKLY_SUMMARY,
+                messages,
+                concurrency=3,
+                pool_size=2,
+                connection_factory=server.get_connection,
+            )
+
+        self.assertEqual(errors, [None] * 6)
+        self.assertEqual(server.sessions, 2)
+        self.assertEqual(
+            sorted(message_from_bytes(data)["To"] for data in server.messages),
+            sorted(user.email for user in users),
+        )
+
+
+@override_settings(
+    EMAIL_SEND_CONCURRENCY=4,
+    EMAIL_BACKEND="finance.tests.test_utils.test_async_email_sender.TrackingEmailBackend",
+)
+class ConcurrentEmailBatchTests(TestCase):
+    def setUp(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+        TrackingEmailBackend.refused = {"user1@example.com"}
+
+        self.users = []
+        for index in range(4):
+            user = User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            UserSettings.objects.create(user=user, weekly_reminder_enabled=True)
+            self.users.append(user)
+
+    @patch("finance.utils.email_service.schedule_email_retry")
+    def test_batch_results_are_logged(self, mock_schedule_retry):
+        totals = send_email_batch(
+            None,
+            EmailType.WEEKLY_REMINDER.name,
+            [user.id for user in self.users],
+        )
+
+        self.assertEqual(totals, {"sent": 3, "failed": 1})
+        self.assertEqual(EmailLog.objects.filter(success=True).count(), 3)
+        failed_log = EmailLog.objects.get(success=False)
+        self.assertEqual(failed_log.user, self.users[1])
+        self.assertEqual(failed_log.error_message, "Recipient refused")
+        mock_schedule_retry.assert_called_once()
@@ -0,0 +1,190 @@
+from hashlib import sha256
+from smtplib import SMTPServerDisconnected
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+
+from finance.models import EmailLog
+from finance.utils.email_service import (
+    EmailLogBuffer,
+    build_email_message,
+    send_emails_with_logging,
+)
+from finance.enums.email_enums import EmailType
+
+
+class CountingEmailBackend(EmailBackend):
+    opened = 0
+    closed = 0
+    failures = []
+
+    def open(self):
+        CountingEmailBackend.opened += 1
+        return True
+
+    def close(self):
+        CountingEmailBackend.closed += 1
+
+    def send_messages(self, messages):
+        if CountingEmailBackend.failures:
+            raise CountingEmailBackend.failures.pop(0)
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND="finance.tests.test_utils.test_batch_email_service.CountingEmailBackend"
+)
+class BatchEmailServiceTests(TestCase):
+    def setUp(self):
+        CountingEmailBackend.opened = 0
+        CountingEmailBackend.closed = 0
+        CountingEmailBackend.failures = []
+        schedule_patcher = patch("finance.utils.email_service.schedule_email_retry")
+        self.mock_schedule_retry = schedule_patcher.start()
+        self.addCleanup(schedule_patcher.stop)
+        self.users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            for index in range(3)
+        ]
+
+    def build_emails(self):
+        return [
+            {
+                "user": user,
+                "message": build_email_message(
+                    user, "Subject", f"Hello {user.username}"
+                ),
+                "template_params": {"name": user.username},
+            }
+            for user in self.users
+        ]
+
+    def test_sends_batch_over_one_connection(self):
+        totals = send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails())
+
+        self.assertEqual(totals, {"sent": 3, "failed": 0})
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(CountingEmailBackend.closed, 1)
+        self.assertEqual(
+            EmailLog.objects.filter(
+                email_type=EmailType.WEEKLY_SUMMARY.name, success=True
+            ).count(),
+            3,
+        )
+
+    def test_reconnects_and_retries_after_disconnect(self):
+        CountingEmailBackend.failures = [SMTPServerDisconnected("gone")]
+
+        totals = send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails())
+
+        self.assertEqual(totals, {"sent": 3, "failed": 0})
+        self.assertEqual(CountingEmailBackend.closed, 2)
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_logs_failure_and_continues_with_next_message(self):
+        CountingEmailBackend.failures = [ValueError("Recipient refused")]
+
+        totals = send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails())
+
+        self.assertEqual(totals, {"sent": 2, "failed": 1})
+        failed_log = EmailLog.objects.get(success=False)
+        self.assertEqual(failed_log.user, self.users[0])
+        self.assertEqual(failed_log.error_message, "Recipient refused")
+        self.assertEqual(failed_log.email_data["content"], "Hello user0")
+        self.mock_schedule_retry.assert_called_once_with(
+            self.users[0].id,
+            EmailType.WEEKLY_SUMMARY,
+            failed_log.email_data,
+            "",
+            None,
+        )
+
+    def test_fails_message_when_reconnect_also_fails(self):
+        CountingEmailBackend.failures = [
+            SMTPServerDisconnected("gone"),
+            SMTPServerDisconnected("still gone"),
+        ]
+
+        totals = send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails())
+
+        self.assertEqual(totals, {"sent": 2, "failed": 1})
+
+    def test_empty_batch_does_not_connect(self):
+        self.assertEqual(
+            send_emails_with_logging(EmailType.WEEKLY_SUMMARY, []),
+            {"sent": 0, "failed": 0},
+        )
+        self.assertEqual(CountingEmailBackend.opened, 0)
+
+
+class EmailLogStorageTests(TestCase):
+    def setUp(self):
+        self.users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                email=f"user{index}@example.com",
+                password="testpass123",
+            )
+            for index in range(4)
+        ]
+
+    def build_emails(self):
+        return [
+            {
+                "user": user,
+                "message": build_email_message(user, "Subject", "Body"),
+                "template_params": {"grand_total": 12.5},
+            }
+            for user in self.users
+        ]
+
+    @override_settings(EMAIL_LOG_BATCH_SIZE=500)
+    def test_logs_are_written_with_one_insert(self):
+        emails = self.build_emails()
+
+        with self.assertNumQueries(1):
+            send_emails_with_logging(EmailType.WEEKLY_SUMMARY, emails)
+
+        self.assertEqual(EmailLog.objects.count(), 4)
+
+    def test_buffer_flushes_when_batch_size_is_reached(self):
+        log_buffer = EmailLogBuffer(batch_size=3)
+
+        for user in self.users:
+            log_buffer.add(
+                EmailLog(
+                    user=user, email_type=EmailType.WEEKLY_SUMMARY.name, success=True
+                )
+            )
+
+        self.assertEqual(EmailLog.objects.count(), 3)
+        log_buffer.flush()
+        self.assertEqual(EmailLog.objects.count(), 4)
+
+    @override_settings(EMAIL_LOG_STORE_CONTENT=False)
+    def test_stores_hash_and_params_instead_of_body(self):
+        send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails()[:1])
+
+        email_data = EmailLog.objects.get().email_data
+        self.assertNotIn("content", email_data)
+        self.assertEqual(email_data["content_hash"], sha256(b"Body").hexdigest())
+        self.assertEqual(email_data["template_params"], {"grand_total": 12.5})
+        self.assertEqual(email_data["subject"], "Subject")
+
+    @override_settings(EMAIL_LOG_STORE_CONTENT=False)
+    @patch("finance.utils.email_service.schedule_email_retry")
+    @patch(
+        "finance.utils.email_service.send_message_with_reconnect",
+        side_effect=Exception("SMTP Error"),
+    )
+    def test_failed_sends_keep_full_body(self, mock_send, mock_schedule_retry):
+        send_emails_with_logging(EmailType.WEEKLY_SUMMARY, self.build_emails()[:1])
+
+        self.assertEqual(EmailLog.objects.get().email_data["content"], "Body")
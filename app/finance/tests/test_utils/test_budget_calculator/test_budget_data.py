@@ -0,0 +1,85 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from finance.models import Budget, Transaction
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.month_snapshot import MonthSnapshot
+
+
+class BudgetDataTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def create_budget(self, transaction_type, category, amount):
+        return Budget.objects.create(
+            user=self.user,
+            type=transaction_type.name,
+            category=category,
+            amount_in_cents=amount,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+    def create_transaction(self, transaction_type, category, amount, expense_date):
+        return Transaction.objects.create(
+            user=self.user,
+            type=transaction_type.name,
+            category=category,
+            amount_in_cents=amount,
+            date_of_expense=expense_date,
+        )
+
+    def budget_data(self):
+        return MonthSnapshot(self.user, 2025, 10).budget_data()
+
+    def test_creates_groups_for_all_transaction_types(self):
+        result = self.budget_data()
+
+        for transaction_type in TransactionType:
+            self.assertEqual(result[transaction_type.value], [])
+
+    def test_groups_budgets_by_type(self):
+        self.create_budget(TransactionType.INCOME, "Salary", 500000)
+        self.create_budget(TransactionType.NEED, "Rent", 150000)
+        self.create_budget(TransactionType.NEED, "Groceries", 50000)
+
+        result = self.budget_data()
+
+        self.assertEqual(len(result[TransactionType.INCOME.value]), 1)
+        self.assertEqual(result[TransactionType.INCOME.value][0]["category"], "Salary")
+        self.assertEqual(len(result[TransactionType.NEED.value]), 2)
+        self.assertEqual(len(result[TransactionType.WANT.value]), 0)
+
+    def test_includes_actual_spent_amounts(self):
+        self.create_budget(TransactionType.NEED, "Rent", 150000)
+        self.create_transaction(TransactionType.NEED, "Rent", 75000, "2025-10-01")
+        self.create_transaction(TransactionType.NEED, "Rent", 75000, "2025-10-15")
+
+        need_budgets = self.budget_data()[TransactionType.NEED.value]
+
+        self.assertEqual(len(need_budgets), 1)
+        self.assertEqual(need_budgets[0]["expected"], Decimal("1500.00"))
+        self.assertEqual(need_budgets[0]["actual"], Decimal("1500.00"))
+        self.assertEqual(need_budgets[0]["remaining"], Decimal("0.00"))
+
+    def test_actual_spent_excludes_non_matching_transactions(self):
+        self.create_budget(TransactionType.NEED, "Rent", 150000)
+        self.create_transaction(TransactionType.NEED, "Rent", 75000, "2025-10-01")
+        self.create_transaction(TransactionType.NEED, "Groceries", 5000, "2025-10-01")
+        self.create_transaction(TransactionType.WANT, "Rent", 2000, "2025-10-01")
+        self.create_transaction(TransactionType.NEED, "Rent", 9000, "2025-11-01")
+
+        need_budgets = self.budget_data()[TransactionType.NEED.value]
+
+        self.assertEqual(need_budgets[0]["actual"], Decimal("750.00"))
+
+    def test_actual_spent_is_zero_without_transactions(self):
+        self.create_budget(TransactionType.NEED, "Rent", 150000)
+
+        need_budgets = self.budget_data()[TransactionType.NEED.value]
+
+        self.assertEqual(need_budgets[0]["actual"], Decimal("0.00"))
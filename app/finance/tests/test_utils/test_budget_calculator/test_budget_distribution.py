@@ -5,10 +5,10 @@ from django.contrib.auth.models import User
 
 from finance.models import Budget
 from finance.enums.transaction_enums import TransactionType
-from finance.utils.budget_calculator import calculate_budget_distribution
+from finance.utils.month_snapshot import MonthSnapshot
 
 
-class CalculateBudgetDistributionTests(TestCase):
+class BudgetDistributionTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username="testuser", password="testpass123"
@@ -56,8 +56,7 @@ class CalculateBudgetDistributionTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(len(result), 5)
         self.assertEqual(result[TransactionType.NEED.value], Decimal("1000.00"))
@@ -84,8 +83,7 @@ class CalculateBudgetDistributionTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(len(result), 2)
         self.assertEqual(result[TransactionType.NEED.value], Decimal("1000.00"))
@@ -104,15 +102,13 @@ class CalculateBudgetDistributionTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[TransactionType.NEED.value], Decimal("1500.00"))
 
     def test_no_budgets_returns_empty_dict(self):
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(result, {})
 
@@ -134,8 +130,7 @@ class CalculateBudgetDistributionTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(len(result), 1)
         self.assertNotIn(TransactionType.INCOME.value, result)
@@ -167,8 +162,7 @@ class CalculateBudgetDistributionTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-        result = calculate_budget_distribution(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).budget_distribution()
 
         self.assertEqual(len(result), 1)
         self.assertEqual(result[TransactionType.NEED.value], Decimal("1800.00"))
@@ -0,0 +1,142 @@
+from datetime import date
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from finance.models import Budget, Transaction, InternalTransfer
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.budget_calculator import (
+    process_carry_over_chain,
+    process_month_end_carry_over,
+    resolve_carry_over_chain,
+    resolve_carry_overs,
+)
+
+
+class ResolveCarryOverTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def create_budget(self, category, year, month, **kwargs):
+        return Budget.objects.create(
+            user=self.user,
+            type=kwargs.get("type", TransactionType.SAVINGS.name),
+            category=category,
+            amount_in_cents=kwargs.get("amount_in_cents", 10000),
+            budget_year=year,
+            budget_month=month,
+            allow_carry_over=kwargs.get("allow_carry_over", True),
+            carried_over_amount_in_cents=kwargs.get("carried_over", 0),
+        )
+
+    def create_transaction(self, category, amount_cents, expense_date, **kwargs):
+        return Transaction.objects.create(
+            user=self.user,
+            type=kwargs.get("type", TransactionType.SAVINGS.name),
+            category=category,
+            amount_in_cents=amount_cents,
+            date_of_expense=expense_date,
+        )
+
+
+class ResolveCarryOversTests(ResolveCarryOverTestCase):
+    def test_matches_materialized_carry_over(self):
+        self.create_budget("Emergency", 2025, 2, carried_over=2500)
+        self.create_budget("Vacation", 2025, 2, amount_in_cents=5000)
+        self.create_budget("Car", 2025, 2, allow_carry_over=False)
+        source = self.create_budget("Gifts", 2025, 2)
+        self.create_transaction("Emergency", 4000, "2025-02-10")
+        self.create_transaction("Vacation", 9000, "2025-02-11")
+        InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=source,
+            amount_in_cents=3000,
+            transfer_date=date(2025, 2, 12),
+        )
+        budgets = [
+            self.create_budget(category, 2025, 3)
+            for category in ["Emergency", "Vacation", "Car", "Gifts", "New"]
+        ]
+
+        carry_overs = resolve_carry_overs(self.user, budgets)
+        process_month_end_carry_over(self.user, 2025, 2)
+
+        self.assertEqual(
+            carry_overs,
+            {
+                budget.id: budget.carried_over_amount_in_cents
+                for budget in Budget.objects.filter(id__in=carry_overs)
+            },
+        )
+        self.assertEqual(carry_overs[budgets[0].id], 8500)
+        self.assertEqual(carry_overs[budgets[1].id], 0)
+        self.assertEqual(carry_overs[budgets[3].id], 7000)
+
+    def test_query_count_is_constant(self):
+        budgets = []
+        for index in range(30):
+            self.create_budget(f"Category {index}", 2024, 12)
+            budgets.append(self.create_budget(f"Category {index}", 2025, 1))
+
+        with self.assertNumQueries(3):
+            carry_overs = resolve_carry_overs(self.user, budgets)
+
+        self.assertEqual(set(carry_overs.values()), {10000})
+
+    def test_skips_spend_and_transfer_queries_without_previous_budgets(self):
+        budgets = [self.create_budget("Emergency", 2025, 1)]
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                resolve_carry_overs(self.user, budgets), {budgets[0].id: 0}
+            )
+
+    def test_empty_budget_list(self):
+        with self.assertNumQueries(0):
+            self.assertEqual(resolve_carry_overs(self.user, []), {})
+
+
+class ResolveCarryOverChainTests(ResolveCarryOverTestCase):
+    def test_walks_chain_without_writing(self):
+        self.create_budget("Emergency", 2024, 11, carried_over=1000)
+        december = self.create_budget("Emergency", 2024, 12)
+        january = self.create_budget("Emergency", 2025, 1)
+        self.create_transaction("Emergency", 4000, "2024-12-05")
+
+        with self.assertNumQueries(6):
+            carry_overs = resolve_carry_over_chain(self.user, 2024, 12, 2025, 1)
+
+        self.assertEqual(carry_overs, {december.id: 11000, january.id: 17000})
+        january.refresh_from_db()
+        self.assertEqual(january.carried_over_amount_in_cents, 0)
+
+    def test_matches_materialized_chain(self):
+        self.create_budget("Emergency", 2024, 10)
+        self.create_budget("Fun", 2024, 10, type=TransactionType.WANT.name)
+        self.create_transaction("Emergency", 2500, "2024-11-03")
+        self.create_transaction(
+            "Fun", 25000, "2024-12-03", type=TransactionType.WANT.name
+        )
+        process_carry_over_chain(self.user, 2024, 10, 2025, 2)
+
+        carry_overs = resolve_carry_over_chain(self.user, 2024, 11, 2025, 2)
+
+        self.assertEqual(
+            carry_overs,
+            dict(
+                Budget.objects.filter(user=self.user)
+                .exclude(budget_year=2024, budget_month=10)
+                .values_list("id", "carried_over_amount_in_cents")
+            ),
+        )
+
+    def test_chain_breaks_when_carry_over_disabled(self):
+        self.create_budget("Emergency", 2024, 12)
+        january = self.create_budget("Emergency", 2025, 1, allow_carry_over=False)
+        february = self.create_budget("Emergency", 2025, 2)
+
+        carry_overs = resolve_carry_over_chain(self.user, 2025, 1, 2025, 2)
+
+        self.assertEqual(carry_overs, {january.id: 10000, february.id: 0})
@@ -5,10 +5,10 @@ from django.contrib.auth.models import User
 
 from finance.models import Budget
 from finance.enums.transaction_enums import TransactionType
-from finance.utils.budget_calculator import calculate_unallocated_income
+from finance.utils.month_snapshot import MonthSnapshot
 
 
-class CalculateUnallocatedIncomeTests(TestCase):
+class UnallocatedIncomeTests(TestCase):
     def setUp(self):
         self.user = User.objects.create_user(
             username="testuser", password="testpass123"
@@ -40,9 +40,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("2000.00"))
         self.assertEqual(result["total_allocated"], Decimal("1500.00"))
@@ -75,9 +73,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("2000.00"))
         self.assertEqual(result["total_allocated"], Decimal("1000.00"))
@@ -102,9 +98,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("2000.00"))
         self.assertEqual(result["total_allocated"], Decimal("2500.00"))
@@ -121,9 +115,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("2000.00"))
         self.assertEqual(result["total_allocated"], Decimal("0.00"))
@@ -140,19 +132,15 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("0.00"))
         self.assertEqual(result["total_allocated"], Decimal("1000.00"))
         self.assertEqual(result["unallocated"], Decimal("-1000.00"))
         self.assertEqual(result["percent_allocated"], 0.0)
 
-    def test_empty_budgets_queryset(self):
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+    def test_month_without_budgets(self):
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("0.00"))
         self.assertEqual(result["total_allocated"], Decimal("0.00"))
@@ -185,9 +173,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("2500.00"))
         self.assertEqual(result["total_allocated"], Decimal("1000.00"))
@@ -244,9 +230,7 @@ class CalculateUnallocatedIncomeTests(TestCase):
             budget_month=10,
         )
 
-        budgets = Budget.objects.filter(user=self.user)
-
-        result = calculate_unallocated_income(budgets)
+        result = MonthSnapshot(self.user, 2025, 10).unallocated_income()
 
         self.assertEqual(result["total_income"], Decimal("5000.00"))
         self.assertEqual(result["total_allocated"], Decimal("4500.00"))
@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from clink.celery import app as celery_app
+
+from finance.models import Budget
+from finance.enums import TransactionType
+from finance.utils.budget_upsert import copy_month_budgets
+from finance.utils.date_utils import month_span, shift_month
+
+
+class CopyMonthBudgetsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        for category, amount, allow_carry_over in [
+            ("Rent", 150000, False),
+            ("Vacation", 20000, True),
+        ]:
+            Budget.objects.create(
+                user=self.user,
+                type=TransactionType.NEED.name,
+                category=category,
+                amount_in_cents=amount,
+                allow_carry_over=allow_carry_over,
+                budget_year=2025,
+                budget_month=1,
+            )
+
+    def test_copies_a_full_year_in_one_statement(self):
+        with CaptureQueriesContext(connection) as queries:
+            budgets = copy_month_budgets(
+                self.user, 2025, 1, month_span(2025, 1, 2025, 12)
+            )
+
+        inserts = [query for query in queries if "INSERT" in query["sql"]]
+        self.assertEqual(len(inserts), 1)
+        self.assertEqual(len(budgets), 22)
+        self.assertEqual(Budget.objects.filter(user=self.user).count(), 24)
+        self.assertEqual(
+            set(
+                Budget.objects.filter(user=self.user, category="Vacation").values_list(
+                    "allow_carry_over", "amount_in_cents"
+                )
+            ),
+            {(True, 20000)},
+        )
+
+    def test_overwrites_matching_budgets_in_target_months(self):
+        existing = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=100,
+            budget_year=2025,
+            budget_month=2,
+        )
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Dining",
+            amount_in_cents=5000,
+            budget_year=2025,
+            budget_month=2,
+        )
+
+        copy_month_budgets(self.user, 2025, 1, [(2025, 2)])
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.amount_in_cents, 150000)
+        self.assertEqual(
+            Budget.objects.filter(user=self.user, budget_month=2).count(), 3
+        )
+
+    @patch("finance.signals.carry_over_signals.schedule_carry_over_refresh")
+    def test_refreshes_carry_over_once_from_month_before_earliest_target(
+        self, mock_schedule
+    ):
+        copy_month_budgets(self.user, 2025, 1, [(2025, 4), (2025, 3)])
+
+        mock_schedule.assert_called_once_with(self.user.id, 2025, 2)
+
+    def test_new_budgets_receive_carry_over_from_previous_month(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+        current_date = timezone.now()
+        prev_year, prev_month = shift_month(current_date.year, current_date.month, -1)
+        Budget.objects.filter(user=self.user).update(
+            budget_year=prev_year, budget_month=prev_month
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            copy_month_budgets(
+                self.user,
+                prev_year,
+                prev_month,
+                [(current_date.year, current_date.month)],
+            )
+
+        vacation = Budget.objects.get(
+            user=self.user,
+            category="Vacation",
+            budget_year=current_date.year,
+            budget_month=current_date.month,
+        )
+        self.assertEqual(vacation.carried_over_amount_in_cents, 20000)
+
+    def test_empty_source_month_copies_nothing(self):
+        self.assertEqual(copy_month_budgets(self.user, 2024, 1, [(2024, 2)]), [])
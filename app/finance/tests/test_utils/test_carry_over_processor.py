@@ -418,3 +418,77 @@ class ProcessMonthEndCarryOverTests(TestCase):
 
         self.assertEqual(budgets.count(), 1)
         self.assertEqual(budgets.first().carried_over_amount_in_cents, 100000)
+
+    def test_resets_carry_over_when_source_stops_carrying_over(self):
+        source = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=1,
+            allow_carry_over=True,
+        )
+        process_month_end_carry_over(self.user, 2025, 1)
+
+        source.allow_carry_over = False
+        source.save()
+        results = process_month_end_carry_over(self.user, 2025, 1)
+
+        self.assertEqual(results["processed"], 0)
+        self.assertEqual(results["reset"], 1)
+        next_budget = Budget.objects.get(
+            user=self.user, category="Emergency Fund", budget_year=2025, budget_month=2
+        )
+        self.assertEqual(next_budget.carried_over_amount_in_cents, 0)
+
+    def test_resets_carry_over_when_source_is_deleted(self):
+        source = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=1,
+            allow_carry_over=True,
+        )
+        process_month_end_carry_over(self.user, 2025, 1)
+
+        source.delete()
+        results = process_month_end_carry_over(self.user, 2025, 1)
+
+        self.assertEqual(results["reset"], 1)
+        next_budget = Budget.objects.get(
+            user=self.user, category="Emergency Fund", budget_year=2025, budget_month=2
+        )
+        self.assertEqual(next_budget.carried_over_amount_in_cents, 0)
+
+    def test_reset_keeps_carry_over_from_remaining_sources(self):
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=1,
+            allow_carry_over=True,
+        )
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=120000,
+            budget_year=2025,
+            budget_month=2,
+            carried_over_amount_in_cents=5000,
+        )
+
+        results = process_month_end_carry_over(self.user, 2025, 1)
+
+        self.assertEqual((results["created"], results["reset"]), (1, 1))
+        rent = Budget.objects.get(user=self.user, category="Rent")
+        self.assertEqual(rent.carried_over_amount_in_cents, 0)
+        next_budget = Budget.objects.get(
+            user=self.user, category="Emergency Fund", budget_year=2025, budget_month=2
+        )
+        self.assertEqual(next_budget.carried_over_amount_in_cents, 100000)
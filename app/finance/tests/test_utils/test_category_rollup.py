@@ -0,0 +1,164 @@
+from io import StringIO
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from finance.models import MonthlyCategoryRollup, Transaction
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.category_rollup import (
+    find_rollup_mismatches,
+    get_spent_by_category_for_month,
+    rebuild_rollups_for_user,
+)
+
+
+class CategoryRollupTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def create_transaction(self, category, amount_cents, date, **kwargs):
+        return Transaction.objects.create(
+            user=self.user,
+            type=kwargs.get("type", TransactionType.WANT.name),
+            category=category,
+            amount_in_cents=amount_cents,
+            date_of_expense=date,
+        )
+
+    def get_rollup(self, year, month, category, type_name=TransactionType.WANT.name):
+        return MonthlyCategoryRollup.objects.get(
+            user=self.user, year=year, month=month, type=type_name, category=category
+        )
+
+
+class IncrementalRollupTests(CategoryRollupTestCase):
+    def test_create_adds_to_rollup(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        self.create_transaction("Dining", 2500, "2025-03-20")
+
+        rollup = self.get_rollup(2025, 3, "Dining")
+        self.assertEqual(rollup.total_cents, 4000)
+        self.assertEqual(rollup.txn_count, 2)
+
+    def test_amount_change_updates_total(self):
+        transaction = self.create_transaction("Dining", 1500, "2025-03-04")
+
+        transaction.amount_in_cents = 1000
+        transaction.save()
+
+        rollup = self.get_rollup(2025, 3, "Dining")
+        self.assertEqual(rollup.total_cents, 1000)
+        self.assertEqual(rollup.txn_count, 1)
+
+    def test_moving_transaction_updates_both_rollups(self):
+        self.create_transaction("Dining", 500, "2025-03-01")
+        transaction = self.create_transaction("Dining", 1500, "2025-03-04")
+        transaction = Transaction.objects.get(id=transaction.id)
+
+        transaction.date_of_expense = "2025-04-02"
+        transaction.category = "Travel"
+        transaction.save()
+
+        self.assertEqual(self.get_rollup(2025, 3, "Dining").total_cents, 500)
+        self.assertEqual(self.get_rollup(2025, 4, "Travel").total_cents, 1500)
+
+    def test_changing_type_moves_rollup(self):
+        transaction = self.create_transaction("Gym", 3000, "2025-03-04")
+
+        transaction.type = TransactionType.NEED.name
+        transaction.save()
+
+        self.assertFalse(
+            MonthlyCategoryRollup.objects.filter(
+                type=TransactionType.WANT.name
+            ).exists()
+        )
+        self.assertEqual(
+            self.get_rollup(2025, 3, "Gym", TransactionType.NEED.name).total_cents,
+            3000,
+        )
+
+    def test_deleting_last_transaction_removes_rollup(self):
+        transaction = self.create_transaction("Dining", 1500, "2025-03-04")
+
+        transaction.delete()
+
+        self.assertFalse(MonthlyCategoryRollup.objects.exists())
+
+    def test_deleting_user_does_not_leave_rollups(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+
+        self.user.delete()
+
+        self.assertFalse(MonthlyCategoryRollup.objects.exists())
+
+    def test_spent_by_category_for_month(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        self.create_transaction(
+            "Rent", 90000, "2025-03-01", type=TransactionType.NEED.name
+        )
+        self.create_transaction("Dining", 700, "2025-04-01")
+
+        with self.assertNumQueries(1):
+            spent = get_spent_by_category_for_month(self.user, 2025, 3)
+
+        self.assertEqual(
+            spent,
+            {
+                (TransactionType.WANT.name, "Dining"): 1500,
+                (TransactionType.NEED.name, "Rent"): 90000,
+            },
+        )
+
+
+class RollupVerificationTests(CategoryRollupTestCase):
+    def test_no_mismatches_after_incremental_updates(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        self.create_transaction("Travel", 800, "2025-05-04")
+
+        self.assertEqual(find_rollup_mismatches(self.user), [])
+
+    def test_detects_and_rebuilds_drifted_rollups(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        Transaction.objects.filter(user=self.user).update(amount_in_cents=2000)
+        MonthlyCategoryRollup.objects.create(
+            user=self.user,
+            year=2025,
+            month=6,
+            type=TransactionType.WANT.name,
+            category="Ghost",
+            total_cents=100,
+            txn_count=1,
+        )
+
+        mismatches = find_rollup_mismatches(self.user)
+
+        self.assertEqual(len(mismatches), 2)
+        self.assertEqual(
+            rebuild_rollups_for_user(self.user), {"deleted": 2, "created": 1}
+        )
+        self.assertEqual(find_rollup_mismatches(self.user), [])
+        self.assertEqual(self.get_rollup(2025, 3, "Dining").total_cents, 2000)
+
+    def test_command_verifies_without_rewriting(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        MonthlyCategoryRollup.objects.update(total_cents=1)
+        out = StringIO()
+
+        call_command("rebuild_category_rollups", verify=True, stdout=out)
+
+        self.assertIn("Found 1 mismatches", out.getvalue())
+        self.assertEqual(self.get_rollup(2025, 3, "Dining").total_cents, 1)
+
+    def test_command_rebuilds_given_users(self):
+        self.create_transaction("Dining", 1500, "2025-03-04")
+        MonthlyCategoryRollup.objects.update(total_cents=1)
+        out = StringIO()
+
+        call_command("rebuild_category_rollups", user_ids=[self.user.id], stdout=out)
+
+        self.assertIn("Rebuilt 1 rollups for 1 users", out.getvalue())
+        self.assertEqual(self.get_rollup(2025, 3, "Dining").total_cents, 1500)
@@ -0,0 +1,128 @@
+from io import StringIO
+from unittest.mock import patch
+
+import redis
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+
+from finance.enums.email_enums import EmailType
+from finance.utils.email_rate_limit import (
+    LocalTokenBucket,
+    acquire_email_send_slot,
+    build_token_bucket,
+    get_rate_limit_stats,
+)
+from finance.utils.email_service import build_email_message, send_emails_with_logging
+
+RATE_LIMITS = {
+    "default": {"rate": 2.0, "burst": 2},
+    "YEARLY_SUMMARY": {"rate": 1.0, "burst": 1},
+}
+
+
+class LocalTokenBucketTests(TestCase):
+    @patch("finance.utils.email_rate_limit.time.monotonic")
+    def test_allows_burst_then_spaces_reservations(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        bucket = LocalTokenBucket()
+
+        waits = [bucket.reserve("default", 2.0, 2) for _ in range(4)]
+
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 1.0])
+
+    @patch("finance.utils.email_rate_limit.time.monotonic")
+    def test_refills_over_time_up_to_burst(self, mock_monotonic):
+        mock_monotonic.return_value = 100.0
+        bucket = LocalTokenBucket()
+        bucket.reserve("default", 2.0, 2)
+        bucket.reserve("default", 2.0, 2)
+
+        mock_monotonic.return_value = 160.0
+
+        self.assertEqual(
+            [bucket.reserve("default", 2.0, 2) for _ in range(3)], [0.0, 0.0, 0.5]
+        )
+
+
+@override_settings(EMAIL_RATE_LIMITS=RATE_LIMITS, EMAIL_RATE_LIMIT_REDIS_URL="")
+class AcquireEmailSendSlotTests(TestCase):
+    def setUp(self):
+        build_token_bucket.cache_clear()
+        self.addCleanup(build_token_bucket.cache_clear)
+        cache.clear()
+        self.waits = []
+
+    def acquire(self, email_type):
+        return acquire_email_send_slot(email_type, sleep=self.waits.append)
+
+    def test_sleeps_and_records_throttled_wait(self):
+        for _ in range(3):
+            self.acquire(EmailType.WEEKLY_SUMMARY)
+
+        self.assertEqual(len(self.waits), 1)
+        self.assertAlmostEqual(self.waits[0], 0.5, places=2)
+        stats = get_rate_limit_stats()["default"]
+        self.assertEqual(stats["acquired"], 3)
+        self.assertEqual(stats["throttled"], 1)
+        self.assertAlmostEqual(stats["wait_ms"], 500, delta=10)
+
+    def test_email_types_share_default_bucket(self):
+        self.acquire(EmailType.WEEKLY_SUMMARY)
+        self.acquire(EmailType.MONTHLY_SUMMARY)
+        self.acquire(EmailType.WEEKLY_REMINDER)
+
+        self.assertEqual(len(self.waits), 1)
+
+    def test_configured_type_uses_own_bucket(self):
+        self.acquire(EmailType.WEEKLY_SUMMARY)
+        self.acquire(EmailType.WEEKLY_SUMMARY)
+        self.acquire(EmailType.YEARLY_SUMMARY)
+
+        self.assertEqual(self.waits, [])
+        self.assertEqual(get_rate_limit_stats()["YEARLY_SUMMARY"]["acquired"], 1)
+
+    @override_settings(EMAIL_RATE_LIMITS={"default": {"rate": 0, "burst": 1}})
+    def test_zero_rate_disables_limiter(self):
+        for _ in range(5):
+            self.assertEqual(self.acquire(EmailType.WEEKLY_SUMMARY), 0.0)
+
+        self.assertEqual(get_rate_limit_stats()["default"]["acquired"], 0)
+
+    @patch("finance.utils.email_rate_limit.get_token_bucket")
+    def test_falls_back_to_local_bucket_when_redis_is_down(self, mock_bucket):
+        mock_bucket.return_value.reserve.side_effect = redis.ConnectionError("down")
+
+        self.assertEqual(self.acquire(EmailType.WEEKLY_SUMMARY), 0.0)
+        self.assertEqual(get_rate_limit_stats()["default"]["acquired"], 1)
+
+    def test_batch_sends_wait_for_slots(self):
+        user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+        emails = [
+            {
+                "user": user,
+                "message": build_email_message(user, "Subject", "Body"),
+                "template_params": {},
+            }
+            for _ in range(3)
+        ]
+
+        with patch(
+            "finance.utils.email_service.acquire_email_send_slot"
+        ) as mock_acquire:
+            send_emails_with_logging(EmailType.WEEKLY_SUMMARY, emails)
+
+        self.assertEqual(mock_acquire.call_count, 3)
+
+    def test_stats_command_prints_and_resets(self):
+        for _ in range(4):
+            self.acquire(EmailType.WEEKLY_SUMMARY)
+        out = StringIO()
+
+        call_command("email_rate_limit_stats", reset=True, stdout=out)
+
+        self.assertIn("Bucket default: 4 sends, 2 throttled (50.0%)", out.getvalue())
+        self.assertEqual(get_rate_limit_stats()["default"]["acquired"], 0)
@@ -4,7 +4,8 @@ from django.core import mail
 from unittest.mock import patch
 
 from finance.models import EmailLog
-from finance.utils.email_service import send_email_with_logging
+from finance.utils.email_runs import start_email_run
+from finance.utils.email_service import build_email_message, send_emails_with_logging
 from finance.enums.email_enums import EmailType
 
 
@@ -16,59 +17,79 @@ class EmailServiceTests(TestCase):
             password="testpass123",
         )
 
-    def test_send_email_with_logging_sends_email(self):
-        success = send_email_with_logging(
-            user=self.user,
-            email_type=EmailType.WEEKLY_REMINDER,
-            subject="Test Subject",
-            content="Test Content",
+    def build_emails(self, subject="Test Subject", content="Test Content"):
+        return [
+            {
+                "user": self.user,
+                "message": build_email_message(self.user, subject, content),
+                "template_params": {"name": self.user.username},
+            }
+        ]
+
+    def test_send_emails_with_logging_sends_email(self):
+        totals = send_emails_with_logging(
+            EmailType.WEEKLY_REMINDER, self.build_emails()
         )
 
-        self.assertTrue(success)
+        self.assertEqual(totals, {"sent": 1, "failed": 0})
         self.assertEqual(len(mail.outbox), 1)
         self.assertEqual(mail.outbox[0].subject, "Test Subject")
         self.assertEqual(mail.outbox[0].body, "Test Content")
         self.assertEqual(mail.outbox[0].to, ["test@example.com"])
 
     def test_creates_successful_email_log(self):
-        send_email_with_logging(
-            user=self.user,
-            email_type=EmailType.WEEKLY_REMINDER,
-            subject="Test Subject",
-            content="Test Content",
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
+
+        send_emails_with_logging(
+            EmailType.WEEKLY_REMINDER,
+            self.build_emails(),
+            period_key="2026-W42",
+            run=run,
         )
 
         log = EmailLog.objects.get(user=self.user)
         self.assertTrue(log.success)
         self.assertEqual(log.email_type, EmailType.WEEKLY_REMINDER.name)
+        self.assertEqual((log.period_key, log.run), ("2026-W42", run))
         self.assertIsNone(log.error_message)
         self.assertEqual(log.email_data["subject"], "Test Subject")
-        self.assertEqual(log.email_data["content"], "Test Content")
         self.assertEqual(log.email_data["recipient"], "test@example.com")
 
-    @patch("finance.utils.email_service.send_mail")
-    def test_creates_failed_email_log_on_exception(self, mock_send_mail):
-        mock_send_mail.side_effect = Exception("SMTP Error")
+    @patch("finance.utils.email_service.schedule_email_retry")
+    @patch(
+        "finance.utils.email_service.send_message_with_reconnect",
+        side_effect=Exception("SMTP Error"),
+    )
+    def test_creates_failed_email_log_on_exception(
+        self, mock_send, mock_schedule_retry
+    ):
+        run = start_email_run(EmailType.WEEKLY_REMINDER, "2026-W42")
 
-        success = send_email_with_logging(
-            user=self.user,
-            email_type=EmailType.WEEKLY_REMINDER,
-            subject="Test Subject",
-            content="Test Content",
+        totals = send_emails_with_logging(
+            EmailType.WEEKLY_REMINDER,
+            self.build_emails(),
+            period_key="2026-W42",
+            run=run,
         )
 
-        self.assertFalse(success)
+        self.assertEqual(totals, {"sent": 0, "failed": 1})
         log = EmailLog.objects.get(user=self.user)
         self.assertFalse(log.success)
         self.assertEqual(log.error_message, "SMTP Error")
         self.assertEqual(log.email_type, EmailType.WEEKLY_REMINDER.name)
+        self.assertEqual(log.email_data["content"], "Test Content")
+        mock_schedule_retry.assert_called_once_with(
+            self.user.id,
+            EmailType.WEEKLY_REMINDER,
+            log.email_data,
+            "2026-W42",
+            str(run.run_id),
+        )
 
     def test_handles_different_email_types(self):
-        send_email_with_logging(
-            user=self.user,
-            email_type=EmailType.MONTHLY_SUMMARY,
-            subject="Monthly Summary",
-            content="Monthly Content",
+        send_emails_with_logging(
+            EmailType.MONTHLY_SUMMARY,
+            self.build_emails("Monthly Summary", "Monthly Content"),
         )
 
         log = EmailLog.objects.get(user=self.user)
@@ -0,0 +1,201 @@
+from datetime import date
+from decimal import Decimal
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from finance.models import Budget, Transaction, InternalTransfer
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.month_snapshot import MonthSnapshot
+from finance.utils.budget_calculator import (
+    process_month_end_carry_over,
+    resolve_carry_overs,
+)
+
+
+class MonthSnapshotTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def create_budget(
+        self, category, transaction_type, amount, year=2025, month=10, **kwargs
+    ):
+        return Budget.objects.create(
+            user=self.user,
+            type=transaction_type.name,
+            category=category,
+            amount_in_cents=amount,
+            budget_year=year,
+            budget_month=month,
+            **kwargs,
+        )
+
+    def create_transaction(self, category, transaction_type, amount, expense_date):
+        return Transaction.objects.create(
+            user=self.user,
+            type=transaction_type.name,
+            category=category,
+            amount_in_cents=amount,
+            date_of_expense=expense_date,
+        )
+
+    def test_query_count_is_constant_regardless_of_budget_count(self):
+        self.create_budget("Rent", TransactionType.NEED, 150000)
+
+        with self.assertNumQueries(3):
+            MonthSnapshot(self.user, 2025, 10).budget_data()
+
+        for index in range(40):
+            budget = self.create_budget(f"Category {index}", TransactionType.WANT, 1000)
+            self.create_transaction(
+                budget.category, TransactionType.WANT, 500, date(2025, 10, 5)
+            )
+
+        with self.assertNumQueries(3):
+            snapshot = MonthSnapshot(self.user, 2025, 10)
+            snapshot.budget_data()
+            snapshot.unallocated_income()
+            snapshot.budget_distribution()
+            snapshot.total_spent()
+
+    def test_skips_transfer_query_when_no_budgets(self):
+        with self.assertNumQueries(2):
+            snapshot = MonthSnapshot(self.user, 2025, 10)
+
+        self.assertEqual(snapshot.budget_data()[TransactionType.NEED.value], [])
+
+    def test_actual_spent_matches_transactions_for_month(self):
+        self.create_budget("Groceries", TransactionType.NEED, 50000)
+        self.create_transaction(
+            "Groceries", TransactionType.NEED, 12000, date(2025, 10, 3)
+        )
+        self.create_transaction(
+            "Groceries", TransactionType.NEED, 3000, date(2025, 10, 30)
+        )
+        self.create_transaction(
+            "Groceries", TransactionType.NEED, 9999, date(2025, 11, 1)
+        )
+
+        item = MonthSnapshot(self.user, 2025, 10).budget_data()[
+            TransactionType.NEED.value
+        ][0]
+
+        self.assertEqual(item["actual"], Decimal("150.00"))
+        self.assertEqual(item["remaining"], Decimal("350.00"))
+
+    def test_carry_over_reads_materialized_amount(self):
+        self.create_budget(
+            "Emergency Fund",
+            TransactionType.SAVINGS,
+            100000,
+            year=2025,
+            month=1,
+            carried_over_amount_in_cents=75000,
+        )
+
+        item = MonthSnapshot(self.user, 2025, 1).budget_data()[
+            TransactionType.SAVINGS.value
+        ][0]
+
+        self.assertEqual(item["carried_over"], Decimal("750.00"))
+        self.assertEqual(item["available"], Decimal("1750.00"))
+
+    def test_does_not_compute_carry_over_from_previous_month(self):
+        self.create_budget(
+            "Fun", TransactionType.WANT, 10000, month=9, allow_carry_over=True
+        )
+        self.create_budget("Fun", TransactionType.WANT, 10000)
+
+        item = MonthSnapshot(self.user, 2025, 10).budget_data()[
+            TransactionType.WANT.value
+        ][0]
+
+        self.assertEqual(item["carried_over"], Decimal("0"))
+
+    def test_net_transfers_applied_to_both_budgets(self):
+        source = self.create_budget("Fun", TransactionType.WANT, 20000)
+        destination = self.create_budget("Rent", TransactionType.NEED, 150000)
+        InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=source,
+            destination_budget=destination,
+            amount_in_cents=5000,
+            transfer_date=date(2025, 10, 5),
+        )
+        InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=source,
+            amount_in_cents=1000,
+            transfer_date=date(2025, 10, 6),
+        )
+
+        budget_data = MonthSnapshot(self.user, 2025, 10).budget_data()
+
+        self.assertEqual(
+            budget_data[TransactionType.WANT.value][0]["net_transfers"],
+            Decimal("-60.00"),
+        )
+        self.assertEqual(
+            budget_data[TransactionType.NEED.value][0]["net_transfers"],
+            Decimal("50.00"),
+        )
+
+    def test_materialized_carry_over_matches_resolver(self):
+        self.create_budget("Salary", TransactionType.INCOME, 500000)
+        self.create_budget(
+            "Fun", TransactionType.WANT, 20000, month=9, allow_carry_over=True
+        )
+        self.create_budget("Fun", TransactionType.WANT, 20000, allow_carry_over=True)
+        self.create_budget("Rent", TransactionType.NEED, 150000)
+        self.create_transaction("Fun", TransactionType.WANT, 7000, date(2025, 9, 14))
+        self.create_transaction("Fun", TransactionType.WANT, 4000, date(2025, 10, 2))
+        process_month_end_carry_over(self.user, 2025, 9)
+
+        snapshot = MonthSnapshot(self.user, 2025, 10)
+        carry_overs = resolve_carry_overs(self.user, snapshot.budgets)
+
+        self.assertEqual(
+            {
+                item["id"]: int(item["carried_over"] * 100)
+                for items in snapshot.budget_data().values()
+                for item in items
+            },
+            carry_overs,
+        )
+        self.assertEqual(sorted(carry_overs.values()), [0, 0, 13000])
+
+    def test_totals_by_type_group(self):
+        self.create_transaction(
+            "Salary", TransactionType.INCOME, 500000, date(2025, 10, 1)
+        )
+        self.create_transaction("Rent", TransactionType.NEED, 150000, date(2025, 10, 1))
+        self.create_transaction("Fun", TransactionType.WANT, 2500, date(2025, 10, 9))
+        self.create_transaction(
+            "Index Fund", TransactionType.INVESTING, 40000, date(2025, 10, 15)
+        )
+
+        snapshot = MonthSnapshot(self.user, 2025, 10)
+
+        self.assertEqual(snapshot.total_income(), Decimal("5000.00"))
+        self.assertEqual(snapshot.total_spent(), Decimal("1525.00"))
+        self.assertEqual(snapshot.total_saved(), Decimal("400.00"))
+
+    def test_filters_by_user(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        Budget.objects.create(
+            user=other_user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=150000,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+        snapshot = MonthSnapshot(self.user, 2025, 10)
+
+        self.assertEqual(snapshot.budgets, [])
+        self.assertEqual(snapshot.unallocated_income()["total_allocated"], Decimal("0"))
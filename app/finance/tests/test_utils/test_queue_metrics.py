@@ -0,0 +1,156 @@
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.core.cache import cache
+from django.core.management import call_command
+
+from clink.celery import app as celery_app
+from finance.signals.queue_metrics_signals import (
+    record_task_queue_latency,
+    stamp_task_published_at,
+)
+from finance.utils.queue_metrics import (
+    get_queue_latency_stats,
+    get_task_wait,
+    record_queue_latency,
+)
+
+
+class TaskRoutingTests(TestCase):
+    def route(self, task_name):
+        return celery_app.amqp.router.route({}, task_name)["queue"].name
+
+    def test_tasks_are_routed_to_dedicated_queues(self):
+        self.assertEqual(
+            self.route("finance.tasks.email_tasks.send_email_batch"), "email"
+        )
+        self.assertEqual(
+            self.route("finance.tasks.email_retry_tasks.retry_failed_email"),
+            "email_retry",
+        )
+        self.assertEqual(
+            self.route("finance.tasks.carry_over_tasks.process_carry_over_for_user"),
+            "recompute",
+        )
+        self.assertEqual(
+            self.route("finance.tasks.carry_over_tasks.process_month_end_carry_overs"),
+            "maintenance",
+        )
+
+    def test_unrouted_tasks_use_maintenance_queue(self):
+        self.assertEqual(
+            self.route("finance.tasks.test_task.test_celery_task"), "maintenance"
+        )
+
+    def test_queue_options_are_applied_to_tasks(self):
+        batch_task = celery_app.tasks["finance.tasks.email_tasks.send_email_batch"]
+        recompute_task = celery_app.tasks[
+            "finance.tasks.carry_over_tasks.process_carry_over_for_user"
+        ]
+
+        self.assertTrue(batch_task.acks_late)
+        self.assertEqual(batch_task.time_limit, 60 * 60)
+        self.assertTrue(recompute_task.acks_late)
+        self.assertEqual(recompute_task.time_limit, 11 * 60)
+
+
+class QueueLatencyTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_wait_is_measured_from_eta_when_later_than_publish(self):
+        eta = datetime(2026, 1, 1, 12, 0, tzinfo=dt_timezone.utc)
+
+        self.assertEqual(get_task_wait(100.0, None, 102.5), 2.5)
+        self.assertEqual(
+            get_task_wait(eta.timestamp() - 600, eta.isoformat(), eta.timestamp() + 3),
+            3,
+        )
+        self.assertEqual(get_task_wait(100.0, None, 99.0), 0.0)
+
+    def test_records_count_total_and_max_wait(self):
+        record_queue_latency("email", 0.25)
+        record_queue_latency("email", 1.0)
+
+        self.assertEqual(
+            get_queue_latency_stats(["email", "recompute"]),
+            {
+                "email": {"started": 2, "wait_ms": 1250, "max_wait_ms": 1000},
+                "recompute": {"started": 0, "wait_ms": 0, "max_wait_ms": 0},
+            },
+        )
+
+    def test_signals_record_wait_for_published_tasks(self):
+        headers = {}
+        with patch(
+            "finance.signals.queue_metrics_signals.time.time", return_value=100.0
+        ):
+            stamp_task_published_at(headers=headers)
+        task = SimpleNamespace(
+            request=SimpleNamespace(
+                published_at=headers["published_at"],
+                eta=None,
+                delivery_info={"routing_key": "recompute"},
+            )
+        )
+
+        with patch(
+            "finance.signals.queue_metrics_signals.time.time", return_value=100.5
+        ):
+            record_task_queue_latency(task=task)
+
+        self.assertEqual(
+            get_queue_latency_stats(["recompute"])["recompute"],
+            {"started": 1, "wait_ms": 500, "max_wait_ms": 500},
+        )
+
+    def test_signal_without_task_is_ignored(self):
+        record_task_queue_latency(task=None)
+
+        self.assertEqual(
+            get_queue_latency_stats(["maintenance"])["maintenance"]["started"], 0
+        )
+
+    def test_eager_tasks_are_not_recorded(self):
+        record_task_queue_latency(task=SimpleNamespace(request=SimpleNamespace()))
+
+        self.assertEqual(
+            get_queue_latency_stats(["maintenance"])["maintenance"]["started"], 0
+        )
+
+
+class TaskQueueStatusCommandTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    @patch(
+        "finance.management.commands.task_queue_status.get_broker_queue_depths",
+        return_value={"email": 40, "email_retry": 0, "recompute": 2, "maintenance": 0},
+    )
+    def test_reports_depth_and_latency_per_queue(self, mock_depths):
+        record_queue_latency("recompute", 0.2)
+        out = StringIO()
+
+        call_command("task_queue_status", stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Queue email: 40 waiting, 0 started", output)
+        self.assertIn(
+            "Queue recompute: 2 waiting, 1 started, 200ms average wait, 200ms max wait",
+            output,
+        )
+
+    @patch(
+        "finance.management.commands.task_queue_status.get_broker_queue_depths",
+        side_effect=ConnectionError("refused"),
+    )
+    def test_reports_unavailable_broker(self, mock_depths):
+        out = StringIO()
+
+        call_command("task_queue_status", stdout=out)
+
+        self.assertIn("Broker unavailable: refused", out.getvalue())
+        self.assertIn("Queue maintenance: ? waiting", out.getvalue())
@@ -0,0 +1,199 @@
+import csv
+import gzip
+import io
+import json
+import tempfile
+from datetime import date
+from pathlib import Path
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.core.management.base import CommandError
+
+from finance.models import Budget, InternalTransfer, Transaction
+from finance.enums import ExportFormat, ExportStream, TransactionType
+from finance.utils.transaction_export import (
+    export_file_name,
+    format_cents,
+    iter_export_blocks,
+    stream_export,
+)
+
+
+class TransactionExportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+
+        for user, category in [(self.user, "Groceries"), (other_user, "Hidden")]:
+            Transaction.objects.create(
+                user=user,
+                type=TransactionType.NEED.name,
+                category=category,
+                amount_in_cents=12345,
+                date_of_expense=date(2024, 12, 31),
+            )
+        Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Dining, out",
+            amount_in_cents=2005,
+            date_of_expense=date(2025, 3, 1),
+        )
+        self.budget = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Vacation",
+            amount_in_cents=50000,
+            budget_year=2025,
+            budget_month=3,
+        )
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Vacation",
+            amount_in_cents=50000,
+            budget_year=2023,
+            budget_month=6,
+        )
+        InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=self.budget,
+            amount_in_cents=1000,
+            transfer_date=date(2025, 3, 10),
+            description="Used funds",
+        )
+
+    def export(self, export_format, streams, **kwargs):
+        return b"".join(stream_export(self.user, export_format, streams, **kwargs))
+
+    def test_csv_export_lists_user_transactions_in_date_order(self):
+        content = self.export(ExportFormat.CSV, [ExportStream.TRANSACTIONS])
+
+        rows = list(csv.reader(io.StringIO(content.decode())))
+        self.assertEqual(
+            rows[0], ["record", "id", "date_of_expense", "type", "category", "amount"]
+        )
+        self.assertEqual(
+            [row[2:] for row in rows[1:]],
+            [
+                ["2024-12-31", "NEED", "Groceries", "123.45"],
+                ["2025-03-01", "WANT", "Dining, out", "20.05"],
+            ],
+        )
+
+    def test_ndjson_export_includes_extra_streams_within_range(self):
+        content = self.export(
+            ExportFormat.NDJSON,
+            [ExportStream.TRANSACTIONS, ExportStream.BUDGETS, ExportStream.TRANSFERS],
+            start=date(2025, 1, 1),
+            end=date(2025, 12, 31),
+        )
+
+        records = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(
+            [record["record"] for record in records],
+            ["transactions", "budgets", "transfers"],
+        )
+        self.assertEqual(records[0]["amount"], "20.05")
+        self.assertEqual(records[1]["id"], self.budget.id)
+        self.assertEqual(records[2]["destination_budget_id"], None)
+        self.assertEqual(records[2]["transfer_date"], "2025-03-10")
+
+    def test_csv_export_rejects_extra_streams(self):
+        with self.assertRaises(ValueError):
+            stream_export(
+                self.user,
+                ExportFormat.CSV,
+                [ExportStream.TRANSACTIONS, ExportStream.BUDGETS],
+            )
+
+    def test_gzip_export_round_trips(self):
+        plain = self.export(ExportFormat.CSV, [ExportStream.TRANSACTIONS])
+        compressed = self.export(
+            ExportFormat.CSV, [ExportStream.TRANSACTIONS], compress=True
+        )
+
+        self.assertEqual(gzip.decompress(compressed), plain)
+
+    @override_settings(TRANSACTION_EXPORT_CHUNK_SIZE=1)
+    def test_rows_are_read_in_chunks(self):
+        content = self.export(
+            ExportFormat.CSV, [ExportStream.TRANSACTIONS], start=date(2025, 1, 1)
+        )
+
+        self.assertEqual(len(content.decode().splitlines()), 2)
+
+    def test_cents_are_formatted_exactly(self):
+        self.assertEqual(
+            [format_cents(cents) for cents in [0, 5, 2005, -150, 900719925474099103]],
+            ["0.00", "0.05", "20.05", "-1.50", "9007199254740991.03"],
+        )
+
+    def test_blocks_group_lines_up_to_the_size_limit(self):
+        blocks = list(iter_export_blocks(["aaaa\n", "bbbb\n", "cc\n"], 8))
+
+        self.assertEqual(blocks, [b"aaaa\nbbbb\n", b"cc\n"])
+
+    def test_file_name_reflects_range_and_compression(self):
+        self.assertEqual(
+            export_file_name(
+                ExportFormat.NDJSON, date(2024, 1, 1), date(2024, 12, 31), True
+            ),
+            "transactions_2024-01-01_2024-12-31.ndjson.gz",
+        )
+        self.assertEqual(export_file_name(ExportFormat.CSV), "transactions.csv")
+
+
+class ExportTransactionsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Groceries",
+            amount_in_cents=5000,
+            date_of_expense=date(2025, 10, 5),
+        )
+
+    def test_writes_csv_to_stdout(self):
+        out = io.StringIO()
+
+        call_command("export_transactions", username="testuser", stdout=out)
+
+        self.assertIn("transactions,", out.getvalue())
+        self.assertIn("Groceries,50.00", out.getvalue())
+
+    def test_writes_compressed_file(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = Path(directory.name) / "export.ndjson.gz"
+
+        call_command(
+            "export_transactions",
+            username="testuser",
+            format="NDJSON",
+            include=["BUDGETS"],
+            gzip=True,
+            output=path,
+            stdout=io.StringIO(),
+        )
+
+        lines = gzip.decompress(path.read_bytes()).decode().splitlines()
+        self.assertEqual(json.loads(lines[0])["category"], "Groceries")
+
+    def test_rejects_extra_streams_for_csv(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "export_transactions",
+                username="testuser",
+                include=["BUDGETS"],
+                stdout=io.StringIO(),
+            )
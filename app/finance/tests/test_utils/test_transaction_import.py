@@ -0,0 +1,179 @@
+import io
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from finance.models import MonthlyUserActivity, Transaction
+from finance.enums import ImportFormat, TransactionType
+from finance.utils.category_rollup import find_rollup_mismatches
+from finance.utils.transaction_import import (
+    detect_import_format,
+    import_transactions,
+    iter_ofx_rows,
+)
+
+CSV_CONTENT = """Date,Type,Category,Amount
+2025-10-01,INCOME,Salary,5000.00
+2025-10-03,need,Groceries,120.50
+2025-10-03,Want,Dining,45.00
+2025-11-02,NEED,Rent,1500.00
+not-a-date,NEED,Rent,10.00
+2025-11-04,UNKNOWN,Misc,-5
+"""
+
+OFX_CONTENT = (
+    "OFXHEADER:100\nDATA:OFXSGML\n\n<OFX><BANKMSGSRSV1><STMTTRNRS><STMTRS>"
+    "<BANKTRANLIST>"
+    "<STMTTRN><TRNTYPE>DEBIT<DTPOSTED>20251005120000<TRNAMT>-23.45"
+    "<FITID>1<NAME>Coffee Shop</STMTTRN>"
+    "<STMTTRN>\n<TRNTYPE>CREDIT\n<DTPOSTED>20251015\n<TRNAMT>2500.00\n"
+    "<FITID>2\n<MEMO>Payroll\n</STMTTRN>"
+    "</BANKTRANLIST></STMTRS></STMTTRNRS></BANKMSGSRSV1></OFX>"
+)
+
+
+class TransactionImportTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def test_detects_format_from_file_name(self):
+        self.assertEqual(detect_import_format("bank.OFX"), ImportFormat.OFX)
+        self.assertEqual(detect_import_format("bank.qfx"), ImportFormat.OFX)
+        self.assertEqual(detect_import_format("history.csv"), ImportFormat.CSV)
+
+    def test_imports_valid_csv_rows_and_reports_errors(self):
+        result = import_transactions(
+            self.user, io.StringIO(CSV_CONTENT), ImportFormat.CSV
+        )
+
+        self.assertEqual(
+            (result["processed"], result["imported"], result["failed"]), (6, 4, 2)
+        )
+        self.assertEqual([error["row"] for error in result["errors"]], [6, 7])
+        self.assertIn("date_of_expense", result["errors"][0]["errors"])
+        self.assertEqual(set(result["errors"][1]["errors"]), {"type", "amount"})
+        self.assertEqual(
+            sorted(
+                Transaction.objects.filter(user=self.user).values_list(
+                    "type", "amount_in_cents"
+                )
+            ),
+            [
+                (TransactionType.INCOME.name, 500000),
+                (TransactionType.NEED.name, 12050),
+                (TransactionType.NEED.name, 150000),
+                (TransactionType.WANT.name, 4500),
+            ],
+        )
+
+    def test_keeps_rollups_and_activity_in_sync(self):
+        import_transactions(
+            self.user, io.StringIO(CSV_CONTENT), ImportFormat.CSV, chunk_size=2
+        )
+
+        self.assertEqual(find_rollup_mismatches(self.user), [])
+        activity = MonthlyUserActivity.objects.get(user=self.user, year=2025, month=10)
+        self.assertEqual(activity.txn_count, 3)
+        self.assertEqual(str(activity.last_transaction_date), "2025-10-03")
+
+    def test_reports_progress_per_chunk(self):
+        progress = []
+
+        import_transactions(
+            self.user,
+            io.StringIO(CSV_CONTENT),
+            ImportFormat.CSV,
+            chunk_size=4,
+            on_progress=lambda result: progress.append(result["processed"]),
+        )
+
+        self.assertEqual(progress, [4, 6])
+
+    def test_inserts_each_chunk_with_one_statement(self):
+        rows = "".join(
+            f"2025-10-{day:02d},NEED,Groceries,10.00\n" for day in range(1, 21)
+        )
+
+        with patch.object(
+            Transaction.objects, "bulk_create", wraps=Transaction.objects.bulk_create
+        ) as mock_bulk_create:
+            import_transactions(
+                self.user,
+                io.StringIO("date,type,category,amount\n" + rows),
+                ImportFormat.CSV,
+                chunk_size=8,
+            )
+
+        self.assertEqual(mock_bulk_create.call_count, 3)
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 20)
+
+    @override_settings(TRANSACTION_IMPORT_MAX_ERRORS=1)
+    def test_error_details_are_capped(self):
+        result = import_transactions(
+            self.user, io.StringIO(CSV_CONTENT), ImportFormat.CSV
+        )
+
+        self.assertEqual(result["failed"], 2)
+        self.assertEqual(len(result["errors"]), 1)
+
+    @patch("finance.utils.transaction_import.OFX_READ_SIZE", 16)
+    def test_parses_ofx_transactions_across_read_boundaries(self):
+        rows = list(iter_ofx_rows(io.StringIO(OFX_CONTENT), TransactionType.NEED))
+
+        self.assertEqual(
+            rows,
+            [
+                (
+                    1,
+                    {
+                        "type": TransactionType.NEED.name,
+                        "category": "Coffee Shop",
+                        "amount": "23.45",
+                        "date_of_expense": "2025-10-05",
+                    },
+                ),
+                (
+                    2,
+                    {
+                        "type": TransactionType.INCOME.name,
+                        "category": "Payroll",
+                        "amount": "2500.00",
+                        "date_of_expense": "2025-10-15",
+                    },
+                ),
+            ],
+        )
+
+
+class ImportTransactionsCommandTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "history.csv"
+        self.path.write_text(CSV_CONTENT)
+
+    def test_imports_file_and_prints_summary(self):
+        out = io.StringIO()
+
+        call_command(
+            "import_transactions",
+            str(self.path),
+            username="testuser",
+            chunk_size=3,
+            stdout=out,
+        )
+
+        output = out.getvalue()
+        self.assertIn("Processed 3 rows: 3 imported, 0 failed.", output)
+        self.assertIn("Row 6: date_of_expense:", output)
+        self.assertIn("Imported 4 of 6 rows, 2 failed.", output)
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 4)
@@ -0,0 +1,136 @@
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.core.management import call_command
+
+from finance.models import MonthlyUserActivity, Transaction, UserSettings
+from finance.enums.transaction_enums import TransactionType
+from finance.emails.weekly_reminder.queries import get_users_needing_reminders
+from finance.emails.yearly_summary.queries import get_users_needing_yearly_summary
+from finance.utils.user_activity import calculate_activity_from_transactions
+
+
+class UserActivityTestCase(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", email="test@example.com", password="testpass123"
+        )
+
+    def create_transaction(self, date_of_expense, amount_cents=1000):
+        return Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Dining",
+            amount_in_cents=amount_cents,
+            date_of_expense=date_of_expense,
+        )
+
+    def get_activity(self, year, month):
+        activity = MonthlyUserActivity.objects.get(
+            user=self.user, year=year, month=month
+        )
+        return (
+            activity.first_transaction_date,
+            activity.last_transaction_date,
+            activity.txn_count,
+        )
+
+    def assertMatchesTransactions(self):
+        self.assertEqual(
+            {
+                (row.user_id, row.year, row.month): (
+                    row.first_transaction_date,
+                    row.last_transaction_date,
+                    row.txn_count,
+                )
+                for row in MonthlyUserActivity.objects.all()
+            },
+            calculate_activity_from_transactions(Transaction.objects.all()),
+        )
+
+
+class IncrementalActivityTests(UserActivityTestCase):
+    def test_create_widens_month_range(self):
+        self.create_transaction("2025-03-10")
+        self.create_transaction("2025-03-04")
+        self.create_transaction("2025-03-20")
+
+        self.assertEqual(
+            self.get_activity(2025, 3), (date(2025, 3, 4), date(2025, 3, 20), 3)
+        )
+
+    @patch("finance.utils.user_activity.record_transaction_activity")
+    @patch("finance.utils.user_activity.refresh_monthly_activity")
+    def test_amount_change_does_not_touch_activity(self, mock_refresh, mock_record):
+        transaction = self.create_transaction("2025-03-10")
+        mock_record.reset_mock()
+        transaction.amount_in_cents = 2000
+
+        transaction.save()
+
+        mock_refresh.assert_not_called()
+        mock_record.assert_not_called()
+
+    def test_moving_transaction_updates_both_months(self):
+        self.create_transaction("2025-03-04")
+        transaction = self.create_transaction("2025-03-20")
+        transaction = Transaction.objects.get(id=transaction.id)
+
+        transaction.date_of_expense = date(2025, 4, 2)
+        transaction.save()
+
+        self.assertEqual(
+            self.get_activity(2025, 3), (date(2025, 3, 4), date(2025, 3, 4), 1)
+        )
+        self.assertEqual(
+            self.get_activity(2025, 4), (date(2025, 4, 2), date(2025, 4, 2), 1)
+        )
+
+    def test_deleting_transactions_shrinks_and_removes_activity(self):
+        first = self.create_transaction("2025-03-04")
+        last = self.create_transaction("2025-03-20")
+
+        last.delete()
+        self.assertEqual(
+            self.get_activity(2025, 3), (date(2025, 3, 4), date(2025, 3, 4), 1)
+        )
+
+        first.delete()
+        self.assertFalse(MonthlyUserActivity.objects.exists())
+
+    def test_rebuild_command_restores_drifted_records(self):
+        self.create_transaction("2025-03-04")
+        self.create_transaction("2025-05-04")
+        MonthlyUserActivity.objects.filter(month=3).delete()
+        MonthlyUserActivity.objects.filter(month=5).update(txn_count=9)
+        out = StringIO()
+
+        call_command("rebuild_user_activity", user_ids=[self.user.id], stdout=out)
+
+        self.assertIn("Rebuilt 2 activity records for 1 users.", out.getvalue())
+        self.assertMatchesTransactions()
+
+
+class ActivityEligibilityTests(UserActivityTestCase):
+    def setUp(self):
+        super().setUp()
+        UserSettings.objects.create(user=self.user)
+
+    def test_eligibility_queries_do_not_join_transactions(self):
+        for users in [
+            get_users_needing_reminders(),
+            get_users_needing_yearly_summary(),
+        ]:
+            sql = str(users.query)
+
+            self.assertIn(MonthlyUserActivity._meta.db_table, sql)
+            self.assertNotIn(Transaction._meta.db_table, sql)
+
+    def test_future_transaction_in_other_month_does_not_count_for_year(self):
+        self.create_transaction(date(date.today().year + 1, 1, 5))
+
+        self.assertNotIn(self.user, get_users_needing_yearly_summary())
+        self.assertNotIn(self.user, get_users_needing_reminders())
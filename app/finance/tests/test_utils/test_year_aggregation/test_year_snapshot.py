@@ -0,0 +1,264 @@
+from decimal import Decimal
+
+from django.test import TestCase
+from django.contrib.auth.models import User
+
+from finance.models import Budget, Transaction
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.year_snapshot import YearSnapshot
+
+
+def create_transaction(user, transaction_type, category, amount_cents, date):
+    return Transaction.objects.create(
+        user=user,
+        type=transaction_type.name,
+        category=category,
+        amount_in_cents=amount_cents,
+        date_of_expense=date,
+    )
+
+
+def create_budget(user, transaction_type, category, amount_cents, year, month):
+    return Budget.objects.create(
+        user=user,
+        type=transaction_type.name,
+        category=category,
+        amount_in_cents=amount_cents,
+        budget_year=year,
+        budget_month=month,
+    )
+
+
+class YearSnapshotTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def test_query_count_is_constant_regardless_of_category_count(self):
+        for index in range(60):
+            create_transaction(
+                self.user,
+                TransactionType.WANT,
+                f"Category {index}",
+                1000,
+                f"2025-{index % 12 + 1:02d}-10",
+            )
+
+        with self.assertNumQueries(2):
+            snapshot = YearSnapshot(self.user, 2025)
+            snapshot.type_breakdown()
+            for transaction_type in TransactionType:
+                snapshot.category_breakdown(transaction_type)
+
+    def test_type_breakdown_sums_months_with_total_and_average(self):
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 150000, "2025-01-01"
+        )
+        create_transaction(
+            self.user, TransactionType.NEED, "Groceries", 20000, "2025-01-15"
+        )
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 150000, "2025-03-01"
+        )
+
+        need_row = YearSnapshot(self.user, 2025).type_breakdown()[
+            TransactionType.NEED.value
+        ]
+
+        self.assertEqual(len(need_row), 14)
+        self.assertEqual(need_row[0], Decimal("1700.00"))
+        self.assertEqual(need_row[1], Decimal("0"))
+        self.assertEqual(need_row[2], Decimal("1500.00"))
+        self.assertEqual(need_row[12], Decimal("3200.00"))
+        self.assertEqual(need_row[13], Decimal("1600.00"))
+
+    def test_category_breakdown_includes_budget_only_categories(self):
+        create_budget(self.user, TransactionType.WANT, "Hobbies", 5000, 2025, 4)
+        create_transaction(
+            self.user, TransactionType.WANT, "Dining", 4500, "2025-04-20"
+        )
+
+        breakdown = YearSnapshot(self.user, 2025).category_breakdown(
+            TransactionType.WANT
+        )
+
+        self.assertEqual(list(breakdown), ["Dining", "Hobbies"])
+        self.assertEqual(breakdown["Hobbies"]["total"], Decimal("0"))
+        self.assertEqual(breakdown["Hobbies"]["average"], Decimal("0.00"))
+        self.assertEqual(breakdown["Dining"]["months"][3], Decimal("45.00"))
+
+    def test_excludes_other_years_and_users(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        create_transaction(other_user, TransactionType.NEED, "Rent", 1000, "2025-05-01")
+        create_transaction(self.user, TransactionType.NEED, "Rent", 1000, "2024-12-31")
+        create_transaction(self.user, TransactionType.NEED, "Rent", 1000, "2026-01-01")
+
+        snapshot = YearSnapshot(self.user, 2025)
+
+        self.assertFalse(snapshot.has_data)
+        self.assertEqual(snapshot.category_breakdown(TransactionType.NEED), {})
+
+    def test_has_data_with_budgets_only(self):
+        create_budget(self.user, TransactionType.NEED, "Rent", 150000, 2025, 2)
+
+        self.assertTrue(YearSnapshot(self.user, 2025).has_data)
+
+    def test_breakdowns_match_transactions_across_types_and_categories(self):
+        create_budget(self.user, TransactionType.SAVINGS, "Emergency", 1000, 2025, 1)
+        create_transaction(
+            self.user, TransactionType.SAVINGS, "Emergency", 12345, "2025-02-11"
+        )
+        create_transaction(
+            self.user, TransactionType.SAVINGS, "Vacation", 999, "2025-07-30"
+        )
+        create_transaction(
+            self.user, TransactionType.INCOME, "Salary", 500000, "2025-07-01"
+        )
+
+        snapshot = YearSnapshot(self.user, 2025)
+        type_breakdown = snapshot.type_breakdown()
+        savings = snapshot.category_breakdown(TransactionType.SAVINGS)
+
+        self.assertEqual(type_breakdown["Savings"][1], Decimal("123.45"))
+        self.assertEqual(type_breakdown["Savings"][6], Decimal("9.99"))
+        self.assertEqual(type_breakdown["Savings"][12], Decimal("133.44"))
+        self.assertEqual(type_breakdown["Income"][6], Decimal("5000.00"))
+        self.assertEqual(list(savings), ["Emergency", "Vacation"])
+        self.assertEqual(savings["Emergency"]["total"], Decimal("123.45"))
+        self.assertEqual(savings["Vacation"]["months"][6], Decimal("9.99"))
+
+
+class YearSnapshotTypeBreakdownTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def type_breakdown(self):
+        return YearSnapshot(self.user, 2025).type_breakdown()
+
+    def test_returns_all_transaction_types(self):
+        self.assertEqual(
+            list(self.type_breakdown()),
+            ["Income", "Need", "Want", "Debts", "Savings", "Investing"],
+        )
+
+    def test_returns_14_values_per_type(self):
+        for values in self.type_breakdown().values():
+            self.assertEqual(len(values), 14)
+
+    def test_aggregates_transactions_by_month(self):
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 100000, "2025-01-15"
+        )
+        create_transaction(
+            self.user, TransactionType.NEED, "Groceries", 50000, "2025-01-20"
+        )
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 100000, "2025-02-15"
+        )
+
+        result = self.type_breakdown()
+
+        self.assertEqual(result["Need"][0], Decimal("1500.00"))
+        self.assertEqual(result["Need"][1], Decimal("1000.00"))
+        self.assertEqual(result["Need"][2], Decimal("0.00"))
+
+    def test_calculates_year_total_correctly(self):
+        create_transaction(
+            self.user, TransactionType.INCOME, "Salary", 500000, "2025-01-15"
+        )
+        create_transaction(
+            self.user, TransactionType.INCOME, "Salary", 500000, "2025-06-15"
+        )
+
+        self.assertEqual(self.type_breakdown()["Income"][12], Decimal("10000.00"))
+
+    def test_calculates_average_correctly(self):
+        create_transaction(
+            self.user, TransactionType.WANT, "Entertainment", 120000, "2025-01-15"
+        )
+
+        self.assertEqual(self.type_breakdown()["Want"][13], Decimal("1200.00"))
+
+    def test_returns_zero_when_no_transactions(self):
+        need_row = self.type_breakdown()["Need"]
+
+        for month_index in range(12):
+            self.assertEqual(need_row[month_index], Decimal("0.00"))
+        self.assertEqual(need_row[12], Decimal("0.00"))
+        self.assertEqual(need_row[13], Decimal("0.00"))
+
+
+class YearSnapshotCategoryBreakdownTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+
+    def category_breakdown(self, transaction_type):
+        return YearSnapshot(self.user, 2025).category_breakdown(transaction_type)
+
+    def test_returns_categories_from_budgets(self):
+        create_budget(self.user, TransactionType.NEED, "Rent", 150000, 2025, 1)
+        create_budget(self.user, TransactionType.NEED, "Groceries", 50000, 2025, 1)
+
+        result = self.category_breakdown(TransactionType.NEED)
+
+        self.assertIn("Rent", result)
+        self.assertIn("Groceries", result)
+
+    def test_aggregates_transactions_by_category_and_month(self):
+        create_budget(self.user, TransactionType.NEED, "Rent", 150000, 2025, 1)
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 100000, "2025-01-15"
+        )
+        create_transaction(self.user, TransactionType.NEED, "Rent", 50000, "2025-02-15")
+
+        result = self.category_breakdown(TransactionType.NEED)
+
+        self.assertEqual(result["Rent"]["months"][0], Decimal("1000.00"))
+        self.assertEqual(result["Rent"]["months"][1], Decimal("500.00"))
+        self.assertEqual(result["Rent"]["months"][2], Decimal("0.00"))
+
+    def test_calculates_total_for_category(self):
+        create_budget(
+            self.user, TransactionType.SAVINGS, "Emergency Fund", 100000, 2025, 1
+        )
+        create_transaction(
+            self.user, TransactionType.SAVINGS, "Emergency Fund", 100000, "2025-01-15"
+        )
+        create_transaction(
+            self.user, TransactionType.SAVINGS, "Emergency Fund", 100000, "2025-06-15"
+        )
+
+        result = self.category_breakdown(TransactionType.SAVINGS)
+
+        self.assertEqual(result["Emergency Fund"]["total"], Decimal("2000.00"))
+
+    def test_calculates_average_for_category(self):
+        create_budget(self.user, TransactionType.WANT, "Dining Out", 50000, 2025, 1)
+        create_transaction(
+            self.user, TransactionType.WANT, "Dining Out", 120000, "2025-01-15"
+        )
+
+        result = self.category_breakdown(TransactionType.WANT)
+
+        self.assertEqual(result["Dining Out"]["average"], Decimal("1200.00"))
+
+    def test_returns_empty_dict_when_no_budgets_for_type(self):
+        self.assertEqual(self.category_breakdown(TransactionType.NEED), {})
+
+    def test_excludes_other_transaction_types(self):
+        create_budget(self.user, TransactionType.NEED, "Rent", 150000, 2025, 1)
+        create_transaction(
+            self.user, TransactionType.NEED, "Rent", 100000, "2025-01-15"
+        )
+        create_transaction(self.user, TransactionType.WANT, "Rent", 50000, "2025-01-15")
+
+        result = self.category_breakdown(TransactionType.NEED)
+
+        self.assertEqual(result["Rent"]["months"][0], Decimal("1000.00"))
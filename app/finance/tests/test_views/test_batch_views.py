@@ -0,0 +1,412 @@
+import json
+from datetime import date
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from clink.celery import app as celery_app
+from finance.models import Budget, InternalTransfer, MonthlyUserActivity, Transaction
+from finance.enums import TransactionType
+from finance.utils.budget_calculator import process_month_end_carry_over
+from finance.utils.category_rollup import find_rollup_mismatches
+
+
+class BatchMutationViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+        self.groceries = Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Groceries",
+            amount_in_cents=5000,
+            date_of_expense=date(2025, 10, 5),
+        )
+        self.dining = Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Dining",
+            amount_in_cents=2500,
+            date_of_expense=date(2025, 9, 20),
+        )
+        self.savings = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=10,
+        )
+        self.vacation = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Vacation",
+            amount_in_cents=50000,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+    def post_batch(self, operations):
+        return self.client.post(
+            reverse("batch_mutations"),
+            json.dumps({"operations": operations}),
+            content_type="application/json",
+        )
+
+    def test_batch_requires_authentication(self):
+        self.client.logout()
+        response = self.post_batch([])
+        self.assertEqual(response.status_code, 302)
+
+    def test_malformed_payload_is_rejected(self):
+        response = self.client.post(
+            reverse("batch_mutations"), "not json", content_type="application/json"
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.post_batch([])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("operations", json.loads(response.content)["errors"])
+
+    def test_applies_mixed_operations_and_reports_results(self):
+        response = self.post_batch(
+            [
+                {
+                    "model": "transaction",
+                    "action": "create",
+                    "data": {
+                        "type": "NEED",
+                        "category": "Rent",
+                        "amount": "1500.00",
+                        "date_of_expense": "2025-10-01",
+                    },
+                },
+                {
+                    "model": "transaction",
+                    "action": "update",
+                    "id": self.groceries.id,
+                    "data": {
+                        "type": "NEED",
+                        "category": "Groceries",
+                        "amount": "75.00",
+                        "date_of_expense": "2025-11-02",
+                    },
+                },
+                {"model": "transaction", "action": "delete", "id": self.dining.id},
+                {
+                    "model": "budget",
+                    "action": "create",
+                    "data": {
+                        "type": "NEED",
+                        "category": "Rent",
+                        "amount": "1500.00",
+                        "year": 2025,
+                        "month": 10,
+                    },
+                },
+                {
+                    "model": "budget",
+                    "action": "update",
+                    "id": self.vacation.id,
+                    "data": {
+                        "type": "SAVINGS",
+                        "category": "Vacation",
+                        "amount": "600.00",
+                        "allow_carry_over": True,
+                    },
+                },
+                {
+                    "model": "transfer",
+                    "action": "create",
+                    "data": {
+                        "source_budget_id": self.savings.id,
+                        "destination_budget_id": self.vacation.id,
+                        "amount": "25.00",
+                        "transfer_date": "2025-10-15",
+                    },
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertTrue(data["success"])
+        self.assertTrue(all(result["success"] for result in data["results"]))
+
+        rent = Transaction.objects.get(id=data["results"][0]["id"])
+        self.assertEqual(rent.amount_in_cents, 150000)
+        self.groceries.refresh_from_db()
+        self.assertEqual(self.groceries.amount_in_cents, 7500)
+        self.assertEqual(self.groceries.date_of_expense, date(2025, 11, 2))
+        self.assertFalse(Transaction.objects.filter(id=self.dining.id).exists())
+        self.assertTrue(
+            Budget.objects.filter(
+                id=data["results"][3]["id"], category="Rent", budget_month=10
+            ).exists()
+        )
+        self.vacation.refresh_from_db()
+        self.assertEqual(self.vacation.amount_in_cents, 60000)
+        self.assertTrue(self.vacation.allow_carry_over)
+        transfer = InternalTransfer.objects.get(id=data["results"][5]["id"])
+        self.assertEqual(transfer.destination_budget, self.vacation)
+
+        self.assertEqual(find_rollup_mismatches(self.user), [])
+        self.assertEqual(
+            sorted(
+                MonthlyUserActivity.objects.filter(user=self.user).values_list(
+                    "month", "txn_count"
+                )
+            ),
+            [(10, 1), (11, 1)],
+        )
+
+    def test_invalid_operation_rejects_whole_batch(self):
+        response = self.post_batch(
+            [
+                {"model": "transaction", "action": "delete", "id": self.dining.id},
+                {
+                    "model": "transaction",
+                    "action": "create",
+                    "data": {"type": "NEED", "category": "Rent", "amount": "-5"},
+                },
+                {"model": "invoice", "action": "create"},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        results = json.loads(response.content)["results"]
+        self.assertFalse(any(result["success"] for result in results))
+        self.assertNotIn("errors", results[0])
+        self.assertEqual(set(results[1]["errors"]), {"amount", "date_of_expense"})
+        self.assertEqual(results[2]["errors"], {"model": ["Unknown model."]})
+        self.assertTrue(Transaction.objects.filter(id=self.dining.id).exists())
+
+    def test_objects_of_other_users_are_not_found(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        other_budget = Budget.objects.create(
+            user=other_user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=1000,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+        response = self.post_batch(
+            [
+                {"model": "budget", "action": "delete", "id": other_budget.id},
+                {
+                    "model": "transfer",
+                    "action": "create",
+                    "data": {
+                        "source_budget_id": self.savings.id,
+                        "destination_budget_id": other_budget.id,
+                        "amount": "10.00",
+                        "transfer_date": "2025-10-15",
+                    },
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        results = json.loads(response.content)["results"]
+        self.assertEqual(results[0]["errors"], {"id": ["Object not found."]})
+        self.assertIn("destination_budget_id", results[1]["errors"])
+        self.assertTrue(Budget.objects.filter(id=other_budget.id).exists())
+
+    def test_duplicate_budget_keys_are_rejected(self):
+        response = self.post_batch(
+            [
+                {
+                    "model": "budget",
+                    "action": "create",
+                    "data": {
+                        "type": "SAVINGS",
+                        "category": "Vacation",
+                        "amount": "10.00",
+                        "year": 2025,
+                        "month": 10,
+                    },
+                },
+                {"model": "budget", "action": "delete", "id": self.savings.id},
+                {"model": "budget", "action": "delete", "id": self.savings.id},
+            ]
+        )
+
+        self.assertEqual(response.status_code, 400)
+        results = json.loads(response.content)["results"]
+        self.assertIn("category", results[0]["errors"])
+        self.assertNotIn("errors", results[1])
+        self.assertIn("id", results[2]["errors"])
+
+    def test_deleting_budget_removes_its_transfers(self):
+        transfer = InternalTransfer.objects.create(
+            user=self.user,
+            source_budget=self.savings,
+            destination_budget=self.vacation,
+            amount_in_cents=1000,
+            transfer_date=date(2025, 10, 10),
+        )
+
+        response = self.post_batch(
+            [
+                {"model": "budget", "action": "delete", "id": self.vacation.id},
+                {
+                    "model": "transfer",
+                    "action": "update",
+                    "id": transfer.id,
+                    "data": {
+                        "source_budget_id": self.savings.id,
+                        "amount": "5.00",
+                        "transfer_date": "2025-10-10",
+                    },
+                },
+            ]
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = self.post_batch(
+            [{"model": "budget", "action": "delete", "id": self.vacation.id}]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(InternalTransfer.objects.filter(id=transfer.id).exists())
+
+    def carry_savings_into_november(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+
+        Budget.objects.filter(id=self.savings.id).update(allow_carry_over=True)
+        process_month_end_carry_over(self.user, 2025, 10)
+        november = Budget.objects.get(
+            user=self.user, category="Emergency Fund", budget_month=11
+        )
+        self.assertEqual(november.carried_over_amount_in_cents, 100000)
+        return november
+
+    def test_disabling_carry_over_clears_next_month(self):
+        november = self.carry_savings_into_november()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_batch(
+                [
+                    {
+                        "model": "budget",
+                        "action": "update",
+                        "id": self.savings.id,
+                        "data": {
+                            "type": "SAVINGS",
+                            "category": "Emergency Fund",
+                            "amount": "1000.00",
+                            "allow_carry_over": False,
+                        },
+                    }
+                ]
+            )
+
+        self.assertEqual(response.status_code, 200)
+        november.refresh_from_db()
+        self.assertEqual(november.carried_over_amount_in_cents, 0)
+
+    def test_created_budget_receives_carry_over_from_previous_month(self):
+        celery_app.conf.task_always_eager = True
+        self.addCleanup(setattr, celery_app.conf, "task_always_eager", False)
+        Budget.objects.filter(id=self.savings.id).update(allow_carry_over=True)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_batch(
+                [
+                    {
+                        "model": "budget",
+                        "action": "create",
+                        "data": {
+                            "type": "SAVINGS",
+                            "category": "Emergency Fund",
+                            "amount": "1000.00",
+                            "year": 2025,
+                            "month": 11,
+                        },
+                    }
+                ]
+            )
+
+        self.assertEqual(response.status_code, 200)
+        november = Budget.objects.get(
+            user=self.user, category="Emergency Fund", budget_month=11
+        )
+        self.assertEqual(november.carried_over_amount_in_cents, 100000)
+
+    def test_deleting_carry_over_budget_clears_next_month(self):
+        november = self.carry_savings_into_november()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.post_batch(
+                [{"model": "budget", "action": "delete", "id": self.savings.id}]
+            )
+
+        self.assertEqual(response.status_code, 200)
+        november.refresh_from_db()
+        self.assertEqual(november.carried_over_amount_in_cents, 0)
+
+    @patch("finance.signals.dashboard_cache_signals.invalidate_dashboard_cache")
+    @patch("finance.signals.carry_over_signals.schedule_carry_over_refresh")
+    def test_dependent_figures_refresh_once_per_batch(
+        self, mock_schedule, mock_invalidate
+    ):
+        response = self.post_batch(
+            [
+                {"model": "transaction", "action": "delete", "id": self.groceries.id},
+                {"model": "transaction", "action": "delete", "id": self.dining.id},
+                {"model": "budget", "action": "delete", "id": self.savings.id},
+                {
+                    "model": "transaction",
+                    "action": "create",
+                    "data": {
+                        "type": "WANT",
+                        "category": "Books",
+                        "amount": "12.00",
+                        "date_of_expense": "2025-10-12",
+                    },
+                },
+            ]
+        )
+
+        self.assertEqual(response.status_code, 200)
+        mock_schedule.assert_called_once_with(self.user.id, 2025, 9)
+        mock_invalidate.assert_called_once_with(self.user.id)
+        self.assertEqual(find_rollup_mismatches(self.user), [])
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def create_operations(count):
+            return [
+                {
+                    "model": "transaction",
+                    "action": "create",
+                    "data": {
+                        "type": "NEED",
+                        "category": "Groceries",
+                        "amount": "10.00",
+                        "date_of_expense": "2025-10-12",
+                    },
+                }
+            ] * count
+
+        with CaptureQueriesContext(connection) as small_batch:
+            self.post_batch(create_operations(2))
+        with CaptureQueriesContext(connection) as large_batch:
+            self.post_batch(create_operations(20))
+
+        self.assertEqual(len(small_batch), len(large_batch))
+        self.assertEqual(
+            Transaction.objects.filter(user=self.user, category="Groceries").count(),
+            23,
+        )
@@ -2,9 +2,11 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from django.contrib.auth.models import User
 import json
+from decimal import Decimal
 
 from finance.models import Budget
 from finance.enums.transaction_enums import TransactionType
+from finance.utils.month_snapshot import MonthSnapshot
 
 
 class BudgetCRUDTests(TestCase):
@@ -387,3 +389,169 @@ class BudgetCategoriesTests(TestCase):
         self.assertTrue(response_data["success"])
         self.assertEqual(len(response_data["categories"]), 1)
         self.assertEqual(response_data["categories"][0], "My Salary")
+
+
+class BudgetCopyViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=150000,
+            budget_year=2025,
+            budget_month=10,
+        )
+
+    def test_copy_budgets_requires_authentication(self):
+        self.client.logout()
+        response = self.client.post(reverse("copy_budgets"), {})
+        self.assertEqual(response.status_code, 302)
+
+    def test_copies_budgets_to_month_range(self):
+        response = self.client.post(
+            reverse("copy_budgets"),
+            {
+                "source_year": 2025,
+                "source_month": 10,
+                "start_year": 2025,
+                "start_month": 11,
+                "end_year": 2026,
+                "end_month": 1,
+            },
+        )
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual((data["copied"], data["months"]), (3, 3))
+        self.assertEqual(
+            list(
+                Budget.objects.filter(user=self.user, category="Rent")
+                .order_by("budget_year", "budget_month")
+                .values_list("budget_year", "budget_month")
+            ),
+            [(2025, 10), (2025, 11), (2025, 12), (2026, 1)],
+        )
+
+    def test_invalid_range_is_rejected(self):
+        response = self.client.post(
+            reverse("copy_budgets"),
+            {"source_year": 2025, "source_month": 10, "start_year": 2025},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+class BudgetRangeViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+    def create_budget(self, year, month, **kwargs):
+        return Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=10000,
+            budget_year=year,
+            budget_month=month,
+            allow_carry_over=True,
+            **kwargs,
+        )
+
+    def get_range(self, **params):
+        return self.client.get(reverse("get_budget_range"), params)
+
+    def test_budget_range_requires_authentication(self):
+        self.client.logout()
+        response = self.get_range()
+        self.assertEqual(response.status_code, 302)
+
+    def test_walks_carry_over_chain_across_range(self):
+        self.create_budget(2024, 11, carried_over_amount_in_cents=1000)
+        december = self.create_budget(2024, 12)
+        january = self.create_budget(2025, 1)
+
+        response = self.get_range(
+            start_year=2024, start_month=12, end_year=2025, end_month=2
+        )
+
+        self.assertEqual(response.status_code, 200)
+        months = json.loads(response.content)["months"]
+        self.assertEqual(
+            [(month["year"], month["month"]) for month in months],
+            [(2024, 12), (2025, 1), (2025, 2)],
+        )
+        self.assertEqual(
+            months[0]["budgets"],
+            [
+                {
+                    "id": december.id,
+                    "category": "Emergency Fund",
+                    "type": TransactionType.SAVINGS.name,
+                    "carried_over": "110.00",
+                    "available": "210.00",
+                }
+            ],
+        )
+        self.assertEqual(months[1]["budgets"][0]["id"], january.id)
+        self.assertEqual(months[1]["budgets"][0]["carried_over"], "210.00")
+        self.assertEqual(months[2]["budgets"], [])
+
+    def test_invalid_range_is_rejected(self):
+        for params in [
+            {"start_year": 2025, "start_month": 3, "end_year": 2025, "end_month": 1},
+            {"start_year": 2023, "start_month": 1, "end_year": 2025, "end_month": 1},
+            {"start_year": 2025, "start_month": 13, "end_year": 2025, "end_month": 1},
+        ]:
+            response = self.get_range(**params)
+            self.assertEqual(response.status_code, 400)
+
+
+class BudgetListViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+    def test_available_uses_stored_carry_over_like_dashboard(self):
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=50000,
+            budget_year=2025,
+            budget_month=9,
+            allow_carry_over=True,
+        )
+        budget = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency Fund",
+            amount_in_cents=10000,
+            budget_year=2025,
+            budget_month=10,
+            carried_over_amount_in_cents=2500,
+        )
+
+        response = self.client.get(reverse("get_all_budgets", args=[2025, 10]))
+        snapshot = MonthSnapshot(self.user, 2025, 10)
+
+        self.assertEqual(response.status_code, 200)
+        budgets = json.loads(response.content)["budgets"]
+        self.assertEqual(budgets[0]["available"], "125.00")
+        self.assertEqual(
+            snapshot.line_item_for_budget(snapshot.budgets[0]).available,
+            Decimal(budgets[0]["available"]),
+        )
+        self.assertEqual(budgets[0]["id"], budget.id)
@@ -0,0 +1,179 @@
+from datetime import date
+from io import StringIO
+from unittest.mock import patch
+
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+
+from finance.models import Budget, Transaction, InternalTransfer
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.dashboard_cache import (
+    get_cached_dashboard_context,
+    get_dashboard_cache_stats,
+    get_dashboard_version,
+)
+
+
+class DashboardCacheTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+    def get_home(self):
+        return self.client.get(reverse("home_with_date", args=[2025, 3]))
+
+    def create_transaction(self, amount_cents=1000):
+        return Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.WANT.name,
+            category="Dining",
+            amount_in_cents=amount_cents,
+            date_of_expense=date(2025, 3, 10),
+        )
+
+
+class CachedDashboardContextTests(DashboardCacheTestCase):
+    def test_builds_once_per_version(self):
+        build_calls = []
+
+        def build():
+            build_calls.append(1)
+            return {"value": len(build_calls)}
+
+        first = get_cached_dashboard_context(self.user.id, "home", (2025, 3), build)
+        second = get_cached_dashboard_context(self.user.id, "home", (2025, 3), build)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(build_calls), 1)
+        self.assertEqual(get_dashboard_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_periods_and_users_are_cached_separately(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+
+        get_cached_dashboard_context(self.user.id, "home", (2025, 3), dict)
+        get_cached_dashboard_context(self.user.id, "home", (2025, 4), dict)
+        get_cached_dashboard_context(other_user.id, "home", (2025, 3), dict)
+
+        self.assertEqual(get_dashboard_cache_stats(), {"hits": 0, "misses": 3})
+
+    def test_new_user_gets_fresh_version(self):
+        version = get_dashboard_version(self.user.id)
+        user_id = self.user.id
+        self.user.delete()
+
+        User.objects.create_user(id=user_id, username="reused", password="pass")
+
+        self.assertNotEqual(get_dashboard_version(user_id), version)
+
+
+class DashboardCacheInvalidationTests(DashboardCacheTestCase):
+    def test_repeat_visit_is_served_from_cache(self):
+        self.get_home()
+
+        with patch("finance.views.home_view.build_home_context") as mock_build:
+            response = self.get_home()
+
+        mock_build.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(get_dashboard_cache_stats(), {"hits": 1, "misses": 1})
+
+    def test_transaction_write_invalidates_dashboard(self):
+        self.get_home()
+
+        self.client.post(
+            reverse("create_transaction"),
+            {
+                "type": TransactionType.WANT.name,
+                "category": "Dining",
+                "amount": "12.50",
+                "date_of_expense": "2025-03-10",
+            },
+        )
+        response = self.get_home()
+
+        self.assertEqual(response.context["total_spent"], 12.5)
+        self.assertEqual(get_dashboard_cache_stats()["misses"], 2)
+
+    def test_transaction_delete_invalidates_dashboard(self):
+        transaction = self.create_transaction()
+        self.get_home()
+
+        self.client.post(reverse("delete_transaction", args=[transaction.id]))
+        response = self.get_home()
+
+        self.assertEqual(response.context["total_spent"], 0)
+
+    def test_budget_write_invalidates_year_review(self):
+        url = reverse("year_review_with_year", args=[2025])
+        self.assertFalse(self.client.get(url).context["has_data"])
+
+        Budget.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Rent",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=3,
+        )
+
+        self.assertTrue(self.client.get(url).context["has_data"])
+
+    @patch("finance.signals.carry_over_signals.process_carry_over_for_user.delay")
+    def test_transfer_write_bumps_version(self, mock_delay):
+        budget = Budget.objects.create(
+            user=self.user,
+            type=TransactionType.SAVINGS.name,
+            category="Emergency",
+            amount_in_cents=100000,
+            budget_year=2025,
+            budget_month=3,
+        )
+        version = get_dashboard_version(self.user.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            InternalTransfer.objects.create(
+                user=self.user,
+                source_budget=budget,
+                amount_in_cents=1000,
+                transfer_date=date(2025, 3, 5),
+            )
+
+        self.assertEqual(get_dashboard_version(self.user.id), version + 2)
+
+    def test_other_users_writes_do_not_invalidate(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.get_home()
+
+        Transaction.objects.create(
+            user=other_user,
+            type=TransactionType.WANT.name,
+            category="Dining",
+            amount_in_cents=1000,
+            date_of_expense=date(2025, 3, 10),
+        )
+        self.get_home()
+
+        self.assertEqual(get_dashboard_cache_stats(), {"hits": 1, "misses": 1})
+
+
+class DashboardCacheStatsCommandTests(DashboardCacheTestCase):
+    def test_prints_and_resets_counters(self):
+        self.get_home()
+        self.get_home()
+        out = StringIO()
+
+        call_command("dashboard_cache_stats", reset=True, stdout=out)
+
+        self.assertIn("1 hits, 1 misses (50.0% hit rate)", out.getvalue())
+        self.assertEqual(get_dashboard_cache_stats(), {"hits": 0, "misses": 0})
@@ -0,0 +1,78 @@
+import gzip
+from datetime import date
+
+from django.http import StreamingHttpResponse
+from django.test import TestCase, Client
+from django.urls import reverse
+from django.contrib.auth.models import User
+
+from finance.models import Transaction
+from finance.enums import TransactionType
+
+
+class ExportTransactionsViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+        Transaction.objects.create(
+            user=self.user,
+            type=TransactionType.NEED.name,
+            category="Groceries",
+            amount_in_cents=5000,
+            date_of_expense=date(2025, 10, 5),
+        )
+
+    def test_export_requires_authentication(self):
+        self.client.logout()
+        response = self.client.get(reverse("export_transactions"))
+        self.assertEqual(response.status_code, 302)
+
+    def test_streams_csv_attachment(self):
+        response = self.client.get(
+            reverse("export_transactions"), {"start": "2025-10-01"}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response, StreamingHttpResponse)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(
+            response["Content-Disposition"],
+            'attachment; filename="transactions_2025-10-01.csv"',
+        )
+        content = b"".join(response.streaming_content).decode()
+        self.assertIn("transactions,", content)
+        self.assertIn("Groceries,50.00", content)
+
+    def test_streams_gzipped_ndjson(self):
+        response = self.client.get(
+            reverse("export_transactions"),
+            {
+                "file_format": "NDJSON",
+                "include": ["BUDGETS", "TRANSFERS"],
+                "compress": "on",
+            },
+        )
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        content = gzip.decompress(b"".join(response.streaming_content)).decode()
+        self.assertIn('"category": "Groceries"', content)
+
+    def test_invalid_range_is_rejected(self):
+        response = self.client.get(
+            reverse("export_transactions"),
+            {"start": "2025-10-02", "end": "2025-10-01"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_extra_streams_are_rejected_for_csv(self):
+        for file_format in ["", "CSV"]:
+            response = self.client.get(
+                reverse("export_transactions"),
+                {"file_format": file_format, "include": ["BUDGETS"]},
+            )
+
+            self.assertEqual(response.status_code, 400)
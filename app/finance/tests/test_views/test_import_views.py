@@ -0,0 +1,116 @@
+import json
+import shutil
+import tempfile
+
+from unittest.mock import patch
+
+from django.test import TestCase, Client, override_settings
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from finance.models import Transaction, TransactionImport
+from finance.enums import ImportStatus
+from finance.tasks.import_tasks import import_transactions_file
+
+CSV_CONTENT = b"""date,type,category,amount
+2025-10-01,INCOME,Salary,5000.00
+2025-10-03,NEED,Groceries,120.50
+2025-10-04,NEED,Groceries,not-a-number
+"""
+
+
+class TransactionImportViewTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+    def upload(self, content=CSV_CONTENT, name="history.csv"):
+        return self.client.post(
+            reverse("import_transactions"),
+            {"file": SimpleUploadedFile(name, content, content_type="text/csv")},
+        )
+
+    def test_import_requires_authentication(self):
+        self.client.logout()
+        response = self.upload()
+        self.assertEqual(response.status_code, 302)
+
+    def test_small_file_is_imported_immediately(self):
+        response = self.upload()
+
+        self.assertEqual(response.status_code, 200)
+        data = json.loads(response.content)
+        self.assertEqual(data["status"], ImportStatus.COMPLETED.name)
+        self.assertEqual((data["imported"], data["failed"]), (2, 1))
+        self.assertEqual(data["errors"][0]["row"], 4)
+        self.assertEqual(Transaction.objects.filter(user=self.user).count(), 2)
+
+    def test_missing_file_is_rejected(self):
+        response = self.client.post(reverse("import_transactions"), {})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("file", json.loads(response.content)["errors"])
+
+    @override_settings(TRANSACTION_IMPORT_ASYNC_BYTES=10)
+    @patch("finance.views.import_views.import_transactions_file.delay")
+    def test_large_file_is_handed_to_celery(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.upload()
+
+        self.assertEqual(response.status_code, 202)
+        data = json.loads(response.content)
+        self.assertEqual(data["status"], ImportStatus.PENDING.name)
+        mock_delay.assert_called_once_with(data["import_id"], "WANT")
+        self.assertEqual(Transaction.objects.count(), 0)
+
+        import_transactions_file(data["import_id"])
+
+        status = json.loads(self.client.get(data["status_url"]).content)
+        self.assertEqual(status["status"], ImportStatus.COMPLETED.name)
+        self.assertEqual((status["processed"], status["imported"]), (3, 2))
+        self.assertFalse(TransactionImport.objects.get().source)
+
+    @override_settings(TRANSACTION_IMPORT_ASYNC_BYTES=10)
+    @patch("finance.views.import_views.import_transactions_file.delay")
+    def test_failed_import_still_deletes_uploaded_file(self, mock_delay):
+        with self.captureOnCommitCallbacks(execute=True):
+            data = json.loads(self.upload().content)
+        source = TransactionImport.objects.get().source
+        self.assertTrue(source.storage.exists(source.name))
+
+        with patch(
+            "finance.tasks.import_tasks.run_transaction_import",
+            side_effect=RuntimeError("boom"),
+        ):
+            with self.assertRaises(RuntimeError):
+                import_transactions_file(data["import_id"])
+
+        self.assertFalse(source.storage.exists(source.name))
+        self.assertFalse(TransactionImport.objects.get().source)
+
+    def test_status_is_private_to_owner(self):
+        other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        transaction_import = TransactionImport.objects.create(
+            user=other_user, file_format="CSV"
+        )
+
+        response = self.client.get(
+            reverse(
+                "get_transaction_import",
+                kwargs={"import_id": transaction_import.import_id},
+            )
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -1,4 +1,6 @@
-from django.test import TestCase, Client
+from django.db import connection
+from django.test import TestCase, Client, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.contrib.auth.models import User
 import json
@@ -192,3 +194,128 @@ class TransactionCRUDTests(TestCase):
         self.assertEqual(response.status_code, 404)
 
         self.assertTrue(Transaction.objects.filter(id=transaction.id).exists())
+
+
+class TransactionListingTests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username="testuser", password="testpass123"
+        )
+        self.other_user = User.objects.create_user(
+            username="otheruser", password="testpass123"
+        )
+        self.client.login(username="testuser", password="testpass123")
+
+        Transaction.objects.bulk_create(
+            [
+                Transaction(
+                    user=self.user,
+                    type=TransactionType.NEED.name,
+                    category=f"Category {day}-{index}",
+                    amount_in_cents=1000 * day + index,
+                    date_of_expense=f"2025-10-{day:02d}",
+                )
+                for day in (3, 10, 10, 10, 21)
+                for index in range(2)
+            ]
+            + [
+                Transaction(
+                    user=self.user,
+                    type=TransactionType.NEED.name,
+                    category="Next month",
+                    amount_in_cents=100,
+                    date_of_expense="2025-11-01",
+                ),
+                Transaction(
+                    user=self.other_user,
+                    type=TransactionType.NEED.name,
+                    category="Other user",
+                    amount_in_cents=100,
+                    date_of_expense="2025-10-15",
+                ),
+            ]
+        )
+        self.url = reverse("list_transactions", kwargs={"year": 2025, "month": 10})
+
+    def fetch_all(self, limit):
+        rows, cursor, pages = [], None, 0
+        while True:
+            params = {"limit": limit}
+            if cursor:
+                params["cursor"] = cursor
+            data = json.loads(self.client.get(self.url, params).content)
+            rows.extend(data["transactions"])
+            pages += 1
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return rows, pages
+
+    def test_list_transactions_requires_authentication(self):
+        self.client.logout()
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 302)
+
+    def test_pages_through_month_newest_first_without_gaps(self):
+        rows, pages = self.fetch_all(limit=3)
+
+        expected_ids = list(
+            Transaction.objects.filter(user=self.user, date_of_expense__month=10)
+            .order_by("-date_of_expense", "-id")
+            .values_list("id", flat=True)
+        )
+        self.assertEqual([row["id"] for row in rows], expected_ids)
+        self.assertEqual(pages, 4)
+
+    def test_returns_projected_fields(self):
+        data = json.loads(self.client.get(self.url, {"limit": 1}).content)
+
+        row = data["transactions"][0]
+        self.assertEqual(
+            set(row), {"id", "type", "category", "amount", "date_of_expense"}
+        )
+        self.assertEqual(row["date_of_expense"], "2025-10-21")
+        self.assertEqual(row["amount"], 210.01)
+
+    def test_invalid_cursor_is_rejected(self):
+        response = self.client.get(self.url, {"cursor": "not-a-cursor"})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(json.loads(response.content)["success"])
+
+    def test_out_of_range_month_or_year_is_rejected(self):
+        for year, month in [(2025, 0), (2025, 13), (0, 10), (9999, 12)]:
+            response = self.client.get(
+                reverse("list_transactions", kwargs={"year": year, "month": month})
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                json.loads(response.content)["errors"],
+                {"month": ["Invalid year or month."]},
+            )
+
+    @override_settings(TRANSACTION_PAGE_SIZE=4)
+    def test_home_view_renders_only_first_page(self):
+        response = self.client.get(
+            reverse("home_with_date", kwargs={"year": 2025, "month": 10})
+        )
+
+        self.assertEqual(len(response.context["transactions"]), 4)
+        self.assertIsNotNone(response.context["transactions_next_cursor"])
+        self.assertContains(response, "btn-load-more-transactions")
+
+    @override_settings(TRANSACTION_PAGE_SIZE=4)
+    def test_home_view_query_count_does_not_grow_with_transactions(self):
+        home_url = reverse("home_with_date", kwargs={"year": 2025, "month": 10})
+        self.client.login(username="otheruser", password="testpass123")
+        with CaptureQueriesContext(connection) as light_user_queries:
+            self.client.get(home_url)
+
+        self.client.login(username="testuser", password="testpass123")
+        with CaptureQueriesContext(connection) as heavy_user_queries:
+            self.client.get(home_url)
+
+        self.assertEqual(
+            len(heavy_user_queries.captured_queries),
+            len(light_user_queries.captured_queries),
+        )
@@ -9,15 +9,22 @@ from finance.views import (
     year_review_view,
     settings_view,
     create_budget,
+    copy_budgets,
     update_budget,
     get_budget,
     delete_budget,
     get_budget_categories,
     get_all_budgets,
+    get_budget_range,
     create_transaction,
     update_transaction,
     get_transaction,
+    list_transactions,
     delete_transaction,
+    import_transactions,
+    get_transaction_import,
+    batch_mutations,
+    export_transactions,
 )
 from finance.views.internal_transfer_views import (
     create_internal_transfer,
@@ -35,6 +42,8 @@ urlpatterns = [
     path("review/<int:year>/", year_review_view, name="year_review_with_year"),
     path("settings/", settings_view, name="settings"),
     path("budgets/create/", create_budget, name="create_budget"),
+    path("budgets/copy/", copy_budgets, name="copy_budgets"),
+    path("budgets/range/", get_budget_range, name="get_budget_range"),
     path("budgets/<int:budget_id>/", get_budget, name="get_budget"),
     path("budgets/<int:budget_id>/update/", update_budget, name="update_budget"),
     path("budgets/<int:budget_id>/delete/", delete_budget, name="delete_budget"),
@@ -58,7 +67,19 @@ urlpatterns = [
         name="delete_internal_transfer",
     ),
     path("transactions/create/", create_transaction, name="create_transaction"),
+    path("transactions/export/", export_transactions, name="export_transactions"),
+    path("transactions/import/", import_transactions, name="import_transactions"),
+    path(
+        "transactions/import/<uuid:import_id>/",
+        get_transaction_import,
+        name="get_transaction_import",
+    ),
     path("transactions/<int:transaction_id>/", get_transaction, name="get_transaction"),
+    path(
+        "transactions/<int:year>/<int:month>/",
+        list_transactions,
+        name="list_transactions",
+    ),
     path(
         "transactions/<int:transaction_id>/update/",
         update_transaction,
@@ -69,5 +90,6 @@ urlpatterns = [
         delete_transaction,
         name="delete_transaction",
     ),
+    path("batch/", batch_mutations, name="batch_mutations"),
     path("", RedirectView.as_view(pattern_name="home"), name="root"),
 ]
@@ -0,0 +1,81 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+from finance.enums.email_enums import EmailType
+from finance.utils.email_rate_limit import acquire_email_send_slot
+from finance.utils.email_service import send_message_with_reconnect
+
+
+def open_email_connection() -> BaseEmailBackend:
+    return get_connection(fail_silently=False)
+
+
+async def send_messages_async(
+    email_type: EmailType,
+    messages: list[EmailMessage],
+    concurrency: int,
+    pool_size: int,
+    connection_factory: Callable[[], BaseEmailBackend],
+) -> list[Optional[Exception]]:
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.BoundedSemaphore(concurrency)
+    sessions: asyncio.Queue[BaseEmailBackend] = asyncio.Queue()
+    connections = [
+        connection_factory() for _ in range(min(pool_size, concurrency, len(messages)))
+    ]
+    for connection in connections:
+        sessions.put_nowait(connection)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+
+        async def send(message: EmailMessage) -> Optional[Exception]:
+            async with semaphore:
+                await loop.run_in_executor(
+                    executor, acquire_email_send_slot, email_type
+                )
+                connection = await sessions.get()
+                try:
+                    await loop.run_in_executor(
+                        executor, send_message_with_reconnect, connection, message
+                    )
+                except Exception as e:
+                    return e
+                finally:
+                    sessions.put_nowait(connection)
+            return None
+
+        try:
+            return await asyncio.gather(*(send(message) for message in messages))
+        finally:
+            await asyncio.gather(
+                *(
+                    loop.run_in_executor(executor, connection.close)
+                    for connection in connections
+                )
+            )
+
+
+def send_messages_concurrently(
+    email_type: EmailType,
+    messages: list[EmailMessage],
+    concurrency: Optional[int] = None,
+    pool_size: Optional[int] = None,
+    connection_factory: Callable[[], BaseEmailBackend] = open_email_connection,
+) -> list[Optional[Exception]]:
+    if not messages:
+        return []
+
+    return asyncio.run(
+        send_messages_async(
+            email_type,
+            messages,
+            concurrency or settings.EMAIL_SEND_CONCURRENCY,
+            pool_size or settings.EMAIL_SMTP_POOL_SIZE,
+            connection_factory,
+        )
+    )
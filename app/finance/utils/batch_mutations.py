@@ -0,0 +1,444 @@
+import json
+from collections import defaultdict
+from typing import Any, Optional, TypedDict
+
+from django import forms
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction as db_transaction
+from django.db.models import Model, Q
+from django.utils import timezone
+
+from finance.forms import (
+    BudgetItemForm,
+    BudgetPeriodItemForm,
+    InternalTransferForm,
+    TransactionForm,
+)
+from finance.models import Budget, InternalTransfer, Transaction
+from finance.utils.budget_calculator import carry_over_source_key
+from finance.utils.date_utils import to_date
+from finance.utils.deferred_refresh import dependent_refresh_deferred
+from finance.utils.transaction_changes import (
+    TransactionValues,
+    apply_transaction_changes,
+    refresh_dependent_figures,
+    transaction_change_values,
+)
+from finance.utils.user_activity import ActivityKey
+
+BATCH_MODELS: dict[str, type[Model]] = {
+    "transaction": Transaction,
+    "budget": Budget,
+    "transfer": InternalTransfer,
+}
+BATCH_ACTIONS = ["create", "update", "delete"]
+BATCH_UPDATE_FIELDS = {
+    "transaction": [
+        "type",
+        "category",
+        "amount_in_cents",
+        "date_of_expense",
+        "date_updated",
+    ],
+    "budget": [
+        "type",
+        "category",
+        "amount_in_cents",
+        "allow_carry_over",
+        "date_updated",
+    ],
+    "transfer": [
+        "source_budget",
+        "destination_budget",
+        "amount_in_cents",
+        "transfer_date",
+        "description",
+        "date_updated",
+    ],
+}
+DELETE_ORDER = ["transfer", "transaction", "budget"]
+SAVE_ORDER = ["budget", "transaction", "transfer"]
+
+NOT_FOUND_ERRORS = {"id": ["Object not found."]}
+DUPLICATE_ERRORS = {"id": ["Object appears in more than one operation."]}
+BUDGET_EXISTS_ERRORS = {
+    "category": ["A budget for this category and type already exists for this month."]
+}
+BUDGET_DELETED_ERRORS = {"id": ["Transfer budget is deleted in this batch."]}
+
+FormErrors = dict[str, list[str]]
+BudgetKey = tuple[str, str, int, int]
+
+
+class OperationResult(TypedDict, total=False):
+    index: int
+    model: Any
+    action: Any
+    success: bool
+    id: int
+    errors: FormErrors
+
+
+class BatchResult(TypedDict):
+    success: bool
+    results: list[OperationResult]
+
+
+class PlannedOperation(TypedDict):
+    index: int
+    model: str
+    action: str
+    instance: Model
+    original_values: Optional[TransactionValues]
+    original_months: set[ActivityKey]
+
+
+def parse_batch_operations(body: bytes) -> list[dict[str, Any]]:
+    payload = json.loads(body or b"{}")
+    operations = payload.get("operations") if isinstance(payload, dict) else None
+
+    if not isinstance(operations, list) or not all(
+        isinstance(operation, dict) for operation in operations
+    ):
+        raise ValueError("Expected an object with a list of operations.")
+    if not operations:
+        raise ValueError("At least one operation is required.")
+    if len(operations) > settings.BATCH_MUTATION_MAX_OPERATIONS:
+        raise ValueError(
+            "A batch may contain at most "
+            f"{settings.BATCH_MUTATION_MAX_OPERATIONS} operations."
+        )
+
+    return operations
+
+
+def parse_id(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def operation_data(operation: dict[str, Any]) -> dict[str, Any]:
+    data = operation.get("data")
+    return data if isinstance(data, dict) else {}
+
+
+def form_errors(form: forms.Form) -> FormErrors:
+    return {field: list(messages) for field, messages in form.errors.items()}
+
+
+def load_batch_targets(
+    user: User, operations: list[dict[str, Any]]
+) -> dict[str, dict[int, Model]]:
+    ids: dict[str, set[int]] = defaultdict(set)
+
+    for operation in operations:
+        model = operation.get("model")
+        target_id = parse_id(operation.get("id"))
+        if model in BATCH_MODELS and target_id is not None:
+            ids[model].add(target_id)
+        if model == "transfer":
+            data = operation_data(operation)
+            for field in ("source_budget_id", "destination_budget_id"):
+                budget_id = parse_id(data.get(field))
+                if budget_id is not None:
+                    ids["budget"].add(budget_id)
+
+    return {
+        "transaction": Transaction.objects.filter(user=user).in_bulk(
+            ids["transaction"]
+        ),
+        "budget": Budget.objects.filter(user=user).in_bulk(ids["budget"]),
+        "transfer": InternalTransfer.objects.filter(user=user)
+        .select_related("source_budget", "destination_budget")
+        .in_bulk(ids["transfer"]),
+    }
+
+
+def operation_months(model: str, instance: Model) -> set[ActivityKey]:
+    if model == "transaction":
+        expense_date = to_date(instance.date_of_expense)
+        return {(instance.user_id, expense_date.year, expense_date.month)}
+    if model == "budget":
+        return {(instance.user_id, instance.budget_year, instance.budget_month)}
+
+    transfer_date = to_date(instance.transfer_date)
+    return {
+        (instance.user_id, budget.budget_year, budget.budget_month)
+        for budget in (instance.source_budget, instance.destination_budget)
+        if budget is not None
+    } | {(instance.user_id, transfer_date.year, transfer_date.month)}
+
+
+def build_transaction(
+    user: User, data: dict[str, Any], instance: Optional[Transaction]
+) -> tuple[Optional[Transaction], FormErrors]:
+    form = TransactionForm(data, instance=instance)
+    if not form.is_valid():
+        return None, form_errors(form)
+
+    transaction = form.save(commit=False)
+    transaction.user = user
+    return transaction, {}
+
+
+def build_budget(
+    user: User, data: dict[str, Any], instance: Optional[Budget]
+) -> tuple[Optional[Budget], FormErrors]:
+    form = (BudgetItemForm if instance else BudgetPeriodItemForm)(data)
+    if not form.is_valid():
+        return None, form_errors(form)
+
+    budget = instance or Budget(
+        user=user,
+        budget_year=form.cleaned_data["year"],
+        budget_month=form.cleaned_data["month"],
+    )
+    budget.type = form.cleaned_data["type"]
+    budget.category = form.cleaned_data["category"]
+    budget.amount_in_cents = int(float(form.cleaned_data["amount"]) * 100)
+    budget.allow_carry_over = form.cleaned_data.get("allow_carry_over", False)
+    return budget, {}
+
+
+def build_transfer(
+    user: User,
+    data: dict[str, Any],
+    instance: Optional[InternalTransfer],
+    budgets: dict[int, Budget],
+    deleted_budget_ids: set[int],
+) -> tuple[Optional[InternalTransfer], FormErrors]:
+    form = InternalTransferForm(data)
+    if not form.is_valid():
+        return None, form_errors(form)
+
+    errors = {}
+    budget_fields = {}
+    for field in ("source_budget_id", "destination_budget_id"):
+        budget_id = form.cleaned_data.get(field)
+        budget_fields[field] = budgets.get(budget_id) if budget_id else None
+        if budget_id and (
+            budget_fields[field] is None or budget_id in deleted_budget_ids
+        ):
+            errors[field] = ["Budget not found."]
+    if errors:
+        return None, errors
+
+    transfer = instance or InternalTransfer(user=user)
+    transfer.source_budget = budget_fields["source_budget_id"]
+    transfer.destination_budget = budget_fields["destination_budget_id"]
+    transfer.amount_in_cents = int(float(form.cleaned_data["amount"]) * 100)
+    transfer.transfer_date = form.cleaned_data["transfer_date"]
+    transfer.description = form.cleaned_data.get("description", "")
+    return transfer, {}
+
+
+def plan_batch_operation(
+    user: User,
+    index: int,
+    operation: dict[str, Any],
+    targets: dict[str, dict[int, Model]],
+    deleted_budget_ids: set[int],
+) -> tuple[Optional[PlannedOperation], FormErrors]:
+    model = operation.get("model")
+    action = operation.get("action")
+    if model not in BATCH_MODELS:
+        return None, {"model": ["Unknown model."]}
+    if action not in BATCH_ACTIONS:
+        return None, {"action": ["Unknown action."]}
+
+    instance = None
+    if action != "create":
+        instance = targets[model].get(parse_id(operation.get("id")))
+        if instance is None:
+            return None, NOT_FOUND_ERRORS
+        if model == "transfer" and deleted_budget_ids & {
+            instance.source_budget_id,
+            instance.destination_budget_id,
+        }:
+            return None, BUDGET_DELETED_ERRORS
+
+    planned: PlannedOperation = {
+        "index": index,
+        "model": model,
+        "action": action,
+        "instance": instance,
+        "original_values": None,
+        "original_months": set(),
+    }
+    if instance is not None:
+        planned["original_months"] = operation_months(model, instance)
+        if model == "transaction":
+            planned["original_values"] = transaction_change_values(instance)
+    if action == "delete":
+        return planned, {}
+
+    data = operation_data(operation)
+    if model == "transaction":
+        planned["instance"], errors = build_transaction(user, data, instance)
+    elif model == "budget":
+        planned["instance"], errors = build_budget(user, data, instance)
+    else:
+        planned["instance"], errors = build_transfer(
+            user, data, instance, targets["budget"], deleted_budget_ids
+        )
+
+    return (None, errors) if errors else (planned, {})
+
+
+def budget_key(budget: Budget) -> BudgetKey:
+    return (budget.category, budget.type, budget.budget_year, budget.budget_month)
+
+
+def find_budget_conflicts(user: User, planned: list[PlannedOperation]) -> set[int]:
+    saved = [
+        operation
+        for operation in planned
+        if operation["model"] == "budget" and operation["action"] != "delete"
+    ]
+    if not saved:
+        return set()
+
+    released_ids = {
+        operation["instance"].id
+        for operation in planned
+        if operation["model"] == "budget" and operation["action"] != "create"
+    }
+    keys = {budget_key(operation["instance"]) for operation in saved}
+    owners: dict[BudgetKey, tuple[str, int]] = {
+        (category, type_name, year, month): ("budget", budget_id)
+        for budget_id, category, type_name, year, month in Budget.objects.filter(
+            user=user,
+            budget_year__in={key[2] for key in keys},
+            budget_month__in={key[3] for key in keys},
+        ).values_list("id", "category", "type", "budget_year", "budget_month")
+        if budget_id not in released_ids
+    }
+
+    conflicts = set()
+    for operation in saved:
+        owner = ("operation", operation["index"])
+        if owners.setdefault(budget_key(operation["instance"]), owner) != owner:
+            conflicts.add(operation["index"])
+    return conflicts
+
+
+def cascaded_transfer_months(budget_ids: set[int]) -> set[ActivityKey]:
+    if not budget_ids:
+        return set()
+
+    transfers = InternalTransfer.objects.filter(
+        Q(source_budget_id__in=budget_ids) | Q(destination_budget_id__in=budget_ids)
+    ).select_related("source_budget", "destination_budget")
+    return set().union(
+        *(operation_months("transfer", transfer) for transfer in transfers)
+    )
+
+
+@db_transaction.atomic
+def apply_batch_plan(planned: list[PlannedOperation]) -> None:
+    grouped: dict[tuple[str, str], list[Model]] = defaultdict(list)
+    for operation in planned:
+        grouped[operation["model"], operation["action"]].append(operation["instance"])
+
+    months = set().union(*(operation["original_months"] for operation in planned))
+    token = dependent_refresh_deferred.set(True)
+
+    try:
+        months |= cascaded_transfer_months(
+            {budget.id for budget in grouped["budget", "delete"]}
+        )
+        for model in DELETE_ORDER:
+            if grouped[model, "delete"]:
+                BATCH_MODELS[model].objects.filter(
+                    id__in=[instance.id for instance in grouped[model, "delete"]]
+                ).delete()
+
+        updated_at = timezone.now()
+        for model in SAVE_ORDER:
+            if grouped[model, "create"]:
+                BATCH_MODELS[model].objects.bulk_create(grouped[model, "create"])
+            for instance in grouped[model, "update"]:
+                instance.date_updated = updated_at
+            if grouped[model, "update"]:
+                BATCH_MODELS[model].objects.bulk_update(
+                    grouped[model, "update"], BATCH_UPDATE_FIELDS[model]
+                )
+
+        months |= apply_transaction_changes(
+            [
+                (
+                    operation["original_values"],
+                    (
+                        None
+                        if operation["action"] == "delete"
+                        else transaction_change_values(operation["instance"])
+                    ),
+                )
+                for operation in planned
+                if operation["model"] == "transaction"
+            ]
+        )
+        for operation in planned:
+            if operation["action"] != "delete":
+                months |= operation_months(operation["model"], operation["instance"])
+        months |= {
+            carry_over_source_key(budget) for budget in grouped["budget", "create"]
+        }
+    finally:
+        dependent_refresh_deferred.reset(token)
+
+    refresh_dependent_figures(months)
+
+
+def run_batch_mutations(user: User, operations: list[dict[str, Any]]) -> BatchResult:
+    targets = load_batch_targets(user, operations)
+    deleted_budget_ids = {
+        parse_id(operation.get("id"))
+        for operation in operations
+        if operation.get("model") == "budget" and operation.get("action") == "delete"
+    } & targets["budget"].keys()
+
+    results: list[OperationResult] = []
+    planned: list[PlannedOperation] = []
+    seen: set[tuple[str, int]] = set()
+
+    for index, operation in enumerate(operations):
+        result: OperationResult = {
+            "index": index,
+            "model": operation.get("model"),
+            "action": operation.get("action"),
+            "success": False,
+        }
+        results.append(result)
+
+        target = (operation.get("model"), parse_id(operation.get("id")))
+        if operation.get("action") != "create" and target in seen:
+            result["errors"] = DUPLICATE_ERRORS
+            continue
+        seen.add(target)
+
+        planned_operation, errors = plan_batch_operation(
+            user, index, operation, targets, deleted_budget_ids
+        )
+        if errors:
+            result["errors"] = errors
+        else:
+            planned.append(planned_operation)
+
+    for index in find_budget_conflicts(user, planned):
+        results[index]["errors"] = BUDGET_EXISTS_ERRORS
+
+    if any("errors" in result for result in results):
+        return {"success": False, "results": results}
+
+    apply_batch_plan(planned)
+    for operation in planned:
+        results[operation["index"]]["success"] = True
+        results[operation["index"]]["id"] = operation["instance"].id
+
+    return {"success": True, "results": results}
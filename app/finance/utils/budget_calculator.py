@@ -1,11 +1,21 @@
+from contextvars import ContextVar
 from decimal import Decimal
 from typing import Optional
 
-from django.db.models import Sum, QuerySet
+from django.db import transaction as db_transaction
+from django.db.models import Q, Sum
 from django.contrib.auth.models import User
 
-from finance.models import Budget, Transaction, InternalTransfer
+from finance.models import Budget, InternalTransfer, MonthlyCategoryRollup
 from finance.enums.transaction_enums import TransactionType
+from finance.utils.category_rollup import get_spent_by_category_for_month
+from finance.utils.date_utils import shift_month
+
+BudgetPeriodKey = tuple[int, int, str, str]
+
+carry_over_chain_active: ContextVar[bool] = ContextVar(
+    "carry_over_chain_active", default=False
+)
 
 
 class BudgetLineItem:
@@ -42,97 +52,182 @@ class BudgetLineItem:
         }
 
 
-def calculate_actual_spent_for_budget(
-    budget: Budget, transactions: QuerySet[Transaction]
+def calculate_carry_over_amount(
+    budget: Budget, actual_spent_cents: int, net_transfer_cents: int
 ) -> int:
-    result = transactions.filter(type=budget.type, category=budget.category).aggregate(
-        total=Sum("amount_in_cents")
-    )["total"]
-    return result or 0
+    carry_over_amount = (
+        budget.amount_in_cents
+        + budget.carried_over_amount_in_cents
+        + net_transfer_cents
+        - actual_spent_cents
+    )
+
+    return max(0, carry_over_amount)
 
 
-def calculate_carry_over_for_budget(
-    user: User, category: str, transaction_type: str, year: int, month: int
-) -> int:
-    if month == 1:
-        prev_year = year - 1
-        prev_month = 12
-    else:
-        prev_year = year
-        prev_month = month - 1
+def calculate_net_transfers_for_budgets(budget_ids: list[int]) -> dict[int, int]:
+    net_transfer_cents = {}
 
-    try:
-        previous_budget = Budget.objects.get(
-            user=user,
-            category=category,
-            type=transaction_type,
-            budget_year=prev_year,
-            budget_month=prev_month,
+    if not budget_ids:
+        return net_transfer_cents
+
+    grouped_transfers = (
+        InternalTransfer.objects.filter(
+            Q(source_budget_id__in=budget_ids) | Q(destination_budget_id__in=budget_ids)
         )
-    except Budget.DoesNotExist:
-        return 0
+        .values("source_budget_id", "destination_budget_id")
+        .annotate(total_cents=Sum("amount_in_cents"))
+        .order_by()
+    )
+
+    for row in grouped_transfers:
+        source_id = row["source_budget_id"]
+        destination_id = row["destination_budget_id"]
+        net_transfer_cents[source_id] = (
+            net_transfer_cents.get(source_id, 0) - row["total_cents"]
+        )
+        if destination_id is not None:
+            net_transfer_cents[destination_id] = (
+                net_transfer_cents.get(destination_id, 0) + row["total_cents"]
+            )
+
+    return net_transfer_cents
+
+
+def budget_period_key(budget: Budget) -> BudgetPeriodKey:
+    return (budget.budget_year, budget.budget_month, budget.type, budget.category)
+
 
-    if not previous_budget.allow_carry_over:
-        return 0
+def carry_over_source_key(budget: Budget) -> tuple[int, int, int]:
+    return (budget.user_id, *shift_month(budget.budget_year, budget.budget_month, -1))
 
-    previous_transactions = Transaction.objects.filter(
-        user=user,
-        date_of_expense__year=prev_year,
-        date_of_expense__month=prev_month,
+
+def load_spent_by_period(
+    user: User, budgets: list[Budget]
+) -> dict[BudgetPeriodKey, int]:
+    if not budgets:
+        return {}
+
+    years = [budget.budget_year for budget in budgets]
+    rollups = (
+        MonthlyCategoryRollup.objects.filter(
+            user=user,
+            year__range=(min(years), max(years)),
+            type__in={budget.type for budget in budgets},
+            category__in={budget.category for budget in budgets},
+        )
+        .order_by()
+        .values("year", "month", "type", "category", "total_cents")
     )
 
-    previous_actual_spent = calculate_actual_spent_for_budget(
-        previous_budget, previous_transactions
+    return {
+        (rollup["year"], rollup["month"], rollup["type"], rollup["category"]): rollup[
+            "total_cents"
+        ]
+        for rollup in rollups
+    }
+
+
+def calculate_outgoing_carry_overs(
+    user: User, source_budgets: list[Budget]
+) -> dict[BudgetPeriodKey, int]:
+    spent_by_period = load_spent_by_period(user, source_budgets)
+    net_transfer_cents = calculate_net_transfers_for_budgets(
+        [budget.id for budget in source_budgets]
     )
 
-    previous_net_transfers = calculate_net_transfers_for_budget(previous_budget)
+    outgoing_carry_overs = {}
+    for budget in source_budgets:
+        next_year, next_month = shift_month(budget.budget_year, budget.budget_month, 1)
+        outgoing_carry_overs[(next_year, next_month, budget.type, budget.category)] = (
+            calculate_carry_over_amount(
+                budget,
+                spent_by_period.get(budget_period_key(budget), 0),
+                net_transfer_cents.get(budget.id, 0),
+            )
+        )
+
+    return outgoing_carry_overs
 
-    carry_over_amount = (
-        previous_budget.amount_in_cents
-        + previous_budget.carried_over_amount_in_cents
-        + previous_net_transfers
-        - previous_actual_spent
+
+def resolve_carry_overs(user: User, budgets: list[Budget]) -> dict[int, int]:
+    if not budgets:
+        return {}
+
+    previous_periods = Q(pk__in=[])
+    for year, month in {
+        shift_month(budget.budget_year, budget.budget_month, -1) for budget in budgets
+    }:
+        previous_periods |= Q(budget_year=year, budget_month=month)
+
+    previous_budgets = list(
+        Budget.objects.filter(
+            previous_periods,
+            user=user,
+            type__in={budget.type for budget in budgets},
+            category__in={budget.category for budget in budgets},
+            allow_carry_over=True,
+        )
     )
+    if not previous_budgets:
+        return {budget.id: 0 for budget in budgets}
 
-    return max(0, carry_over_amount)
+    outgoing_carry_overs = calculate_outgoing_carry_overs(user, previous_budgets)
 
+    return {
+        budget.id: outgoing_carry_overs.get(budget_period_key(budget), 0)
+        for budget in budgets
+    }
 
-def calculate_net_transfers_for_budget(budget: Budget) -> int:
-    incoming = InternalTransfer.objects.filter(destination_budget=budget).aggregate(
-        total=Sum("amount_in_cents")
-    )["total"]
 
-    outgoing = InternalTransfer.objects.filter(source_budget=budget).aggregate(
-        total=Sum("amount_in_cents")
-    )["total"]
+def resolve_carry_over_chain(
+    user: User, year: int, month: int, through_year: int, through_month: int
+) -> dict[int, int]:
+    start_period = (year, month)
+    through_period = (through_year, through_month)
 
-    return (incoming or 0) - (outgoing or 0)
+    budgets = [
+        budget
+        for budget in Budget.objects.filter(
+            user=user, budget_year__range=(year, through_year)
+        ).order_by("budget_year", "budget_month")
+        if start_period <= (budget.budget_year, budget.budget_month) <= through_period
+    ]
+    resolved_carry_overs = resolve_carry_overs(
+        user,
+        [
+            budget
+            for budget in budgets
+            if (budget.budget_year, budget.budget_month) == start_period
+        ],
+    )
+    spent_by_period = load_spent_by_period(user, budgets)
+    net_transfer_cents = calculate_net_transfers_for_budgets(
+        [budget.id for budget in budgets]
+    )
 
+    outgoing_carry_overs = {}
 
-def create_budget_line_items_for_type(
-    transaction_type: TransactionType,
-    budgets: QuerySet[Budget],
-    transactions: QuerySet[Transaction],
-    user: User,
-    year: int,
-    month: int,
-) -> list[dict]:
-    type_budgets = budgets.filter(type=transaction_type.name)
-    budget_items = []
+    for budget in budgets:
+        if budget.id not in resolved_carry_overs:
+            resolved_carry_overs[budget.id] = outgoing_carry_overs.get(
+                budget_period_key(budget), 0
+            )
+        budget.carried_over_amount_in_cents = resolved_carry_overs[budget.id]
 
-    for budget in type_budgets:
-        actual_spent_cents = calculate_actual_spent_for_budget(budget, transactions)
-        carried_over_cents = calculate_carry_over_for_budget(
-            user, budget.category, budget.type, year, month
-        )
-        net_transfer_cents = calculate_net_transfers_for_budget(budget)
+        if not budget.allow_carry_over:
+            continue
 
-        line_item = BudgetLineItem(
-            budget, actual_spent_cents, carried_over_cents, net_transfer_cents
+        next_year, next_month = shift_month(budget.budget_year, budget.budget_month, 1)
+        outgoing_carry_overs[(next_year, next_month, budget.type, budget.category)] = (
+            calculate_carry_over_amount(
+                budget,
+                spent_by_period.get(budget_period_key(budget), 0),
+                net_transfer_cents.get(budget.id, 0),
+            )
         )
-        budget_items.append(line_item.to_dict())
 
-    return budget_items
+    return resolved_carry_overs
 
 
 def calculate_totals_for_budget_items(budget_items: list[dict]) -> dict:
@@ -155,36 +250,11 @@ def calculate_totals_for_budget_items(budget_items: list[dict]) -> dict:
     }
 
 
-def group_budgets_with_actuals(
-    budgets: QuerySet[Budget],
-    transactions: QuerySet[Transaction],
-    user: User,
-    year: int,
-    month: int,
-) -> dict[str, list[dict]]:
-    budget_groups = {}
-
-    for transaction_type in TransactionType:
-        budget_groups[transaction_type.value] = create_budget_line_items_for_type(
-            transaction_type, budgets, transactions, user, year, month
-        )
-
-    return budget_groups
-
-
-def calculate_unallocated_income(budgets: QuerySet[Budget]) -> dict:
-    total_income_cents = budgets.filter(type=TransactionType.INCOME.name).aggregate(
-        total=Sum("amount_in_cents")
-    )["total"]
-
-    total_income = Decimal(total_income_cents or 0) / 100
-
-    budget_types_to_exclude = [TransactionType.INCOME.name]
-    total_allocated_cents = budgets.exclude(type__in=budget_types_to_exclude).aggregate(
-        total=Sum("amount_in_cents")
-    )["total"]
-
-    total_allocated = Decimal(total_allocated_cents or 0) / 100
+def build_unallocated_income(
+    total_income_cents: int, total_allocated_cents: int
+) -> dict:
+    total_income = Decimal(total_income_cents) / 100
+    total_allocated = Decimal(total_allocated_cents) / 100
     unallocated = total_income - total_allocated
 
     percent_allocated = (
@@ -199,23 +269,20 @@ def calculate_unallocated_income(budgets: QuerySet[Budget]) -> dict:
     }
 
 
-def calculate_budget_distribution(budgets: QuerySet[Budget]) -> dict:
-    distribution = {}
+DISTRIBUTION_BUDGET_TYPES = [
+    TransactionType.NEED,
+    TransactionType.WANT,
+    TransactionType.DEBTS,
+    TransactionType.SAVINGS,
+    TransactionType.INVESTING,
+]
 
-    budget_types = [
-        TransactionType.NEED,
-        TransactionType.WANT,
-        TransactionType.DEBTS,
-        TransactionType.SAVINGS,
-        TransactionType.INVESTING,
-    ]
 
-    for budget_type in budget_types:
-        total = budgets.filter(type=budget_type.name).aggregate(
-            total=Sum("amount_in_cents")
-        )["total"]
+def build_budget_distribution(type_totals_cents: dict[str, int]) -> dict:
+    distribution = {}
 
-        total_dollars = Decimal(total or 0) / 100
+    for budget_type in DISTRIBUTION_BUDGET_TYPES:
+        total_dollars = Decimal(type_totals_cents.get(budget_type.name, 0)) / 100
 
         if total_dollars > 0:
             distribution[budget_type.value] = total_dollars
@@ -224,8 +291,10 @@ def calculate_budget_distribution(budgets: QuerySet[Budget]) -> dict:
 
 
 def process_month_end_carry_over(user: User, year: int, month: int) -> dict:
-    budgets = Budget.objects.filter(
-        user=user, budget_year=year, budget_month=month, allow_carry_over=True
+    budgets = list(
+        Budget.objects.filter(
+            user=user, budget_year=year, budget_month=month, allow_carry_over=True
+        )
     )
 
     if month == 12:
@@ -239,24 +308,22 @@ def process_month_end_carry_over(user: User, year: int, month: int) -> dict:
         "processed": 0,
         "created": 0,
         "updated": 0,
+        "reset": 0,
         "skipped": 0,
         "budgets_processed": [],
     }
 
-    for budget in budgets:
-        transactions = Transaction.objects.filter(
-            user=user, date_of_expense__year=year, date_of_expense__month=month
-        )
+    spent_by_category = get_spent_by_category_for_month(user, year, month)
+    net_transfer_cents = calculate_net_transfers_for_budgets(
+        [budget.id for budget in budgets]
+    )
 
-        actual_spent = calculate_actual_spent_for_budget(budget, transactions)
-        net_transfers = calculate_net_transfers_for_budget(budget)
+    for budget in budgets:
+        actual_spent = spent_by_category.get((budget.type, budget.category), 0)
+        net_transfers = net_transfer_cents.get(budget.id, 0)
 
-        carry_over_amount = max(
-            0,
-            budget.amount_in_cents
-            + budget.carried_over_amount_in_cents
-            + net_transfers
-            - actual_spent,
+        carry_over_amount = calculate_carry_over_amount(
+            budget, actual_spent, net_transfers
         )
 
         try:
@@ -270,7 +337,9 @@ def process_month_end_carry_over(user: User, year: int, month: int) -> dict:
 
             if next_budget.carried_over_amount_in_cents != carry_over_amount:
                 next_budget.carried_over_amount_in_cents = carry_over_amount
-                next_budget.save()
+                next_budget.save(
+                    update_fields=["carried_over_amount_in_cents", "date_updated"]
+                )
                 results["updated"] += 1
                 results["budgets_processed"].append(
                     {
@@ -306,4 +375,45 @@ def process_month_end_carry_over(user: User, year: int, month: int) -> dict:
 
         results["processed"] += 1
 
+    source_keys = {(budget.type, budget.category) for budget in budgets}
+    carried_budgets = Budget.objects.filter(
+        user=user, budget_year=next_year, budget_month=next_month
+    ).exclude(carried_over_amount_in_cents=0)
+
+    for next_budget in carried_budgets:
+        if (next_budget.type, next_budget.category) in source_keys:
+            continue
+
+        next_budget.carried_over_amount_in_cents = 0
+        next_budget.save(update_fields=["carried_over_amount_in_cents", "date_updated"])
+        results["reset"] += 1
+        results["budgets_processed"].append(
+            {
+                "category": next_budget.category,
+                "type": next_budget.type,
+                "carry_over": 0,
+                "action": "reset",
+            }
+        )
+
     return results
+
+
+def process_carry_over_chain(
+    user: User, year: int, month: int, through_year: int, through_month: int
+) -> list[dict]:
+    chain_results = []
+    token = carry_over_chain_active.set(True)
+
+    try:
+        while (year, month) < (through_year, through_month):
+            with db_transaction.atomic():
+                chain_results.append(process_month_end_carry_over(user, year, month))
+            if month == 12:
+                year, month = year + 1, 1
+            else:
+                month += 1
+    finally:
+        carry_over_chain_active.reset(token)
+
+    return chain_results
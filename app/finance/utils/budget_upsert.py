@@ -0,0 +1,60 @@
+from typing import Iterable
+
+from django.contrib.auth.models import User
+from django.db import transaction as db_transaction
+
+from finance.models import Budget
+from finance.utils.budget_calculator import carry_over_source_key
+from finance.utils.transaction_changes import refresh_dependent_figures
+
+BUDGET_UNIQUE_FIELDS = ["user", "category", "type", "budget_year", "budget_month"]
+BUDGET_UPSERT_FIELDS = ["amount_in_cents", "date_updated"]
+BUDGET_COPY_FIELDS = ["amount_in_cents", "allow_carry_over", "date_updated"]
+
+
+@db_transaction.atomic
+def upsert_budgets(
+    budgets: list[Budget], update_fields: list[str] = BUDGET_UPSERT_FIELDS
+) -> list[Budget]:
+    if not budgets:
+        return []
+
+    Budget.objects.bulk_create(
+        budgets,
+        update_conflicts=True,
+        unique_fields=BUDGET_UNIQUE_FIELDS,
+        update_fields=update_fields,
+    )
+    refresh_dependent_figures({carry_over_source_key(budget) for budget in budgets})
+    return budgets
+
+
+def copy_month_budgets(
+    user: User,
+    source_year: int,
+    source_month: int,
+    target_months: Iterable[tuple[int, int]],
+) -> list[Budget]:
+    source_budgets = list(
+        Budget.objects.filter(
+            user=user, budget_year=source_year, budget_month=source_month
+        ).order_by("type", "category")
+    )
+
+    return upsert_budgets(
+        [
+            Budget(
+                user=user,
+                type=budget.type,
+                category=budget.category,
+                amount_in_cents=budget.amount_in_cents,
+                allow_carry_over=budget.allow_carry_over,
+                budget_year=year,
+                budget_month=month,
+            )
+            for year, month in target_months
+            if (year, month) != (source_year, source_month)
+            for budget in source_budgets
+        ],
+        BUDGET_COPY_FIELDS,
+    )
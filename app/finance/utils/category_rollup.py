@@ -0,0 +1,192 @@
+from typing import Any, Optional
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction as db_transaction
+from django.db.models import Count, F, QuerySet, Sum
+from django.db.models.functions import ExtractMonth, ExtractYear
+from django.utils import timezone
+
+from finance.models import MonthlyCategoryRollup, Transaction
+from finance.utils.date_utils import to_date
+
+RollupKey = tuple[int, int, int, str, str]
+
+
+def rollup_key_for_values(values: dict[str, Any]) -> RollupKey:
+    expense_date = to_date(values["date_of_expense"])
+    return (
+        values["user_id"],
+        expense_date.year,
+        expense_date.month,
+        values["type"],
+        values["category"],
+    )
+
+
+def apply_rollup_delta(key: RollupKey, cents_delta: int, count_delta: int) -> None:
+    user_id, year, month, type_name, category = key
+    rollups = MonthlyCategoryRollup.objects.filter(
+        user_id=user_id, year=year, month=month, type=type_name, category=category
+    )
+    changes = {
+        "total_cents": F("total_cents") + cents_delta,
+        "txn_count": F("txn_count") + count_delta,
+        "date_updated": timezone.now(),
+    }
+
+    if rollups.update(**changes):
+        if count_delta < 0:
+            rollups.filter(txn_count=0).delete()
+        return
+
+    if count_delta <= 0:
+        return
+
+    try:
+        with db_transaction.atomic():
+            MonthlyCategoryRollup.objects.create(
+                user_id=user_id,
+                year=year,
+                month=month,
+                type=type_name,
+                category=category,
+                total_cents=cents_delta,
+                txn_count=count_delta,
+            )
+    except IntegrityError:
+        rollups.update(**changes)
+
+
+def apply_transaction_change(
+    original_values: dict[str, Any] | None, current_values: dict[str, Any] | None
+) -> None:
+    original_key = rollup_key_for_values(original_values) if original_values else None
+    current_key = rollup_key_for_values(current_values) if current_values else None
+
+    if original_key is not None and original_key == current_key:
+        cents_delta = (
+            current_values["amount_in_cents"] - original_values["amount_in_cents"]
+        )
+        if cents_delta:
+            apply_rollup_delta(current_key, cents_delta, 0)
+        return
+
+    if original_key is not None:
+        apply_rollup_delta(original_key, -original_values["amount_in_cents"], -1)
+    if current_key is not None:
+        apply_rollup_delta(current_key, current_values["amount_in_cents"], 1)
+
+
+def get_rollups_for_month(user: User, year: int, month: int) -> QuerySet:
+    return MonthlyCategoryRollup.objects.filter(user=user, year=year, month=month)
+
+
+def get_rollups_for_year(user: User, year: int) -> QuerySet:
+    return MonthlyCategoryRollup.objects.filter(user=user, year=year)
+
+
+def get_rollups_for_users(
+    user_ids: list[int], year: int, month: Optional[int] = None
+) -> QuerySet:
+    rollups = MonthlyCategoryRollup.objects.filter(user_id__in=user_ids, year=year)
+    if month is not None:
+        rollups = rollups.filter(month=month)
+    return rollups
+
+
+def get_spent_by_category_for_month(
+    user: User, year: int, month: int
+) -> dict[tuple[str, str], int]:
+    return {
+        (rollup["type"], rollup["category"]): rollup["total_cents"]
+        for rollup in get_rollups_for_month(user, year, month)
+        .order_by()
+        .values("type", "category", "total_cents")
+    }
+
+
+def calculate_rollups_from_transactions(
+    transactions: QuerySet[Transaction],
+) -> dict[RollupKey, tuple[int, int]]:
+    grouped_totals = (
+        transactions.annotate(
+            expense_year=ExtractYear("date_of_expense"),
+            expense_month=ExtractMonth("date_of_expense"),
+        )
+        .values("user_id", "expense_year", "expense_month", "type", "category")
+        .annotate(total_cents=Sum("amount_in_cents"), txn_count=Count("id"))
+        .order_by()
+    )
+
+    return {
+        (
+            row["user_id"],
+            row["expense_year"],
+            row["expense_month"],
+            row["type"],
+            row["category"],
+        ): (row["total_cents"], row["txn_count"])
+        for row in grouped_totals
+    }
+
+
+def load_stored_rollups(
+    rollups: QuerySet[MonthlyCategoryRollup],
+) -> dict[RollupKey, tuple[int, int]]:
+    return {
+        (
+            row["user_id"],
+            row["year"],
+            row["month"],
+            row["type"],
+            row["category"],
+        ): (row["total_cents"], row["txn_count"])
+        for row in rollups.order_by().values(
+            "user_id", "year", "month", "type", "category", "total_cents", "txn_count"
+        )
+    }
+
+
+def find_rollup_mismatches(user: User) -> list[dict[str, Any]]:
+    expected = calculate_rollups_from_transactions(
+        Transaction.objects.filter(user=user)
+    )
+    stored = load_stored_rollups(MonthlyCategoryRollup.objects.filter(user=user))
+
+    mismatches = []
+    for key in sorted(expected.keys() | stored.keys()):
+        if expected.get(key) != stored.get(key):
+            mismatches.append(
+                {"key": key, "expected": expected.get(key), "stored": stored.get(key)}
+            )
+
+    return mismatches
+
+
+@db_transaction.atomic
+def rebuild_rollups_for_user(user: User) -> dict[str, int]:
+    expected = calculate_rollups_from_transactions(
+        Transaction.objects.filter(user=user)
+    )
+    deleted_count, _ = MonthlyCategoryRollup.objects.filter(user=user).delete()
+
+    MonthlyCategoryRollup.objects.bulk_create(
+        [
+            MonthlyCategoryRollup(
+                user_id=user_id,
+                year=year,
+                month=month,
+                type=type_name,
+                category=category,
+                total_cents=total_cents,
+                txn_count=txn_count,
+            )
+            for (user_id, year, month, type_name, category), (
+                total_cents,
+                txn_count,
+            ) in expected.items()
+        ],
+        batch_size=1000,
+    )
+
+    return {"deleted": deleted_count, "created": len(expected)}
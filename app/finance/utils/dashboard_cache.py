@@ -0,0 +1,78 @@
+import time
+from typing import Callable
+
+from django.conf import settings
+from django.core.cache import cache
+
+DASHBOARD_CACHE_PREFIX = "dashboard"
+DASHBOARD_CACHE_EVENTS = ["hits", "misses"]
+
+
+def dashboard_version_key(user_id: int) -> str:
+    return f"{DASHBOARD_CACHE_PREFIX}:version:{user_id}"
+
+
+def dashboard_stats_key(event: str) -> str:
+    return f"{DASHBOARD_CACHE_PREFIX}:stats:{event}"
+
+
+def reset_dashboard_version(user_id: int) -> int:
+    version = time.time_ns()
+    cache.set(dashboard_version_key(user_id), version, timeout=None)
+    return version
+
+
+def get_dashboard_version(user_id: int) -> int:
+    version = cache.get(dashboard_version_key(user_id))
+    if version is None:
+        version = reset_dashboard_version(user_id)
+    return version
+
+
+def bump_dashboard_version(user_id: int) -> int:
+    try:
+        return cache.incr(dashboard_version_key(user_id))
+    except ValueError:
+        return reset_dashboard_version(user_id)
+
+
+def record_dashboard_cache_event(event: str) -> None:
+    try:
+        cache.incr(dashboard_stats_key(event))
+    except ValueError:
+        cache.add(dashboard_stats_key(event), 0, timeout=None)
+        cache.incr(dashboard_stats_key(event))
+
+
+def get_dashboard_cache_stats() -> dict[str, int]:
+    counts = cache.get_many(
+        [dashboard_stats_key(event) for event in DASHBOARD_CACHE_EVENTS]
+    )
+    return {
+        event: counts.get(dashboard_stats_key(event), 0)
+        for event in DASHBOARD_CACHE_EVENTS
+    }
+
+
+def reset_dashboard_cache_stats() -> None:
+    cache.delete_many([dashboard_stats_key(event) for event in DASHBOARD_CACHE_EVENTS])
+
+
+def get_cached_dashboard_context(
+    user_id: int, name: str, period: tuple[int, ...], build: Callable[[], dict]
+) -> dict:
+    period_key = "-".join(str(part) for part in period)
+    key = (
+        f"{DASHBOARD_CACHE_PREFIX}:{name}:{user_id}:"
+        f"{get_dashboard_version(user_id)}:{period_key}"
+    )
+
+    context = cache.get(key)
+    if context is not None:
+        record_dashboard_cache_event("hits")
+        return context
+
+    record_dashboard_cache_event("misses")
+    context = build()
+    cache.set(key, context, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+    return context
@@ -0,0 +1,30 @@
+from datetime import date
+
+from django.db import models
+
+DATE_FIELD = models.DateField()
+
+
+def to_date(value: date | str) -> date:
+    return DATE_FIELD.to_python(value)
+
+
+def shift_month(year: int, month: int, offset: int) -> tuple[int, int]:
+    shifted_year, month_index = divmod(year * 12 + month - 1 + offset, 12)
+    return shifted_year, month_index + 1
+
+
+def month_date_range(year: int, month: int) -> tuple[date, date]:
+    next_year, next_month = divmod(year * 12 + month, 12)
+    return date(year, month, 1), date(next_year, next_month + 1, 1)
+
+
+def year_date_range(year: int) -> tuple[date, date]:
+    return date(year, 1, 1), date(year + 1, 1, 1)
+
+
+def month_span(
+    start_year: int, start_month: int, end_year: int, end_month: int
+) -> list[tuple[int, int]]:
+    count = (end_year * 12 + end_month) - (start_year * 12 + start_month) + 1
+    return [shift_month(start_year, start_month, offset) for offset in range(count)]
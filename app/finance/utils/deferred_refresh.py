@@ -0,0 +1,5 @@
+from contextvars import ContextVar
+
+dependent_refresh_deferred: ContextVar[bool] = ContextVar(
+    "dependent_refresh_deferred", default=False
+)
@@ -0,0 +1,56 @@
+from typing import Optional
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from finance.models import EmailDeadLetter, EmailRun
+from finance.enums import EmailType
+from finance.utils.email_service import schedule_email_retry
+
+
+def record_dead_letter(
+    user_id: int,
+    email_type: EmailType,
+    email_data: dict,
+    period_key: str,
+    run: Optional[EmailRun],
+    attempts: int,
+    error: str,
+) -> EmailDeadLetter:
+    return EmailDeadLetter.objects.create(
+        user_id=user_id,
+        email_type=email_type.name,
+        period_key=period_key,
+        run=run,
+        email_data=email_data,
+        attempts=attempts,
+        last_error=error,
+    )
+
+
+def get_pending_dead_letters(
+    email_type: Optional[EmailType] = None,
+) -> QuerySet[EmailDeadLetter]:
+    dead_letters = EmailDeadLetter.objects.filter(replayed_at__isnull=True)
+    if email_type is not None:
+        dead_letters = dead_letters.filter(email_type=email_type.name)
+    return dead_letters
+
+
+def replay_dead_letters(dead_letters: QuerySet[EmailDeadLetter]) -> int:
+    replayed_ids = []
+
+    for dead_letter in dead_letters.select_related("run").iterator(chunk_size=500):
+        schedule_email_retry(
+            dead_letter.user_id,
+            EmailType[dead_letter.email_type],
+            dead_letter.email_data,
+            dead_letter.period_key,
+            str(dead_letter.run.run_id) if dead_letter.run else None,
+        )
+        replayed_ids.append(dead_letter.id)
+
+    EmailDeadLetter.objects.filter(id__in=replayed_ids).update(
+        replayed_at=timezone.now()
+    )
+    return len(replayed_ids)
@@ -0,0 +1,46 @@
+from typing import Optional
+
+from celery import current_app
+from kombu.exceptions import ChannelError
+
+from finance.models import EmailRun
+from finance.enums import EmailRunStatus
+
+
+def count_worker_tasks(tasks_by_worker: Optional[dict[str, list]]) -> int:
+    return sum(len(tasks) for tasks in (tasks_by_worker or {}).values())
+
+
+def get_broker_queue_depths(queue_names: Optional[list[str]] = None) -> dict[str, int]:
+    queue_names = queue_names or [current_app.conf.task_default_queue]
+    depths = {}
+
+    with current_app.connection_for_read() as connection:
+        connection.ensure_connection(max_retries=1)
+        channel = connection.default_channel
+        for queue_name in queue_names:
+            try:
+                depths[queue_name] = channel.queue_declare(
+                    queue=queue_name, passive=True
+                ).message_count
+            except ChannelError:
+                depths[queue_name] = 0
+
+    return depths
+
+
+def get_worker_task_counts(timeout: float = 1.0) -> dict[str, int]:
+    inspect = current_app.control.inspect(timeout=timeout)
+    return {
+        "active": count_worker_tasks(inspect.active()),
+        "reserved": count_worker_tasks(inspect.reserved()),
+        "scheduled": count_worker_tasks(inspect.scheduled()),
+    }
+
+
+def get_running_email_runs() -> list[EmailRun]:
+    return list(
+        EmailRun.objects.filter(status=EmailRunStatus.RUNNING.name).order_by(
+            "started_at"
+        )
+    )
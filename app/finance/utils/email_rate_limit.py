@@ -0,0 +1,151 @@
+import threading
+import time
+from functools import lru_cache
+from typing import Callable, Optional
+
+import redis
+from django.conf import settings
+from django.core.cache import cache
+
+from finance.enums.email_enums import EmailType
+
+RATE_LIMIT_PREFIX = "email_rate_limit"
+RATE_LIMIT_EVENTS = ["acquired", "throttled", "wait_ms"]
+DEFAULT_BUCKET = "default"
+
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call("TIME")
+local now = tonumber(clock[1]) + tonumber(clock[2]) / 1000000
+
+local tokens = tonumber(redis.call("HGET", KEYS[1], "tokens"))
+local updated = tonumber(redis.call("HGET", KEYS[1], "updated"))
+if tokens == nil then
+    tokens = burst
+    updated = now
+end
+
+tokens = math.min(burst, tokens + (now - updated) * rate) - 1
+redis.call("HSET", KEYS[1], "tokens", tokens, "updated", now)
+redis.call("EXPIRE", KEYS[1], math.ceil((burst - tokens) / rate) + 1)
+
+if tokens >= 0 then
+    return "0"
+end
+return tostring(-tokens / rate)
+"""
+
+
+class LocalTokenBucket:
+    def __init__(self):
+        self.buckets: dict[str, tuple[float, float]] = {}
+        self.lock = threading.Lock()
+
+    def reserve(self, name: str, rate: float, burst: int) -> float:
+        with self.lock:
+            now = time.monotonic()
+            tokens, updated = self.buckets.get(name, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate) - 1
+            self.buckets[name] = (tokens, now)
+
+        return max(0.0, -tokens / rate)
+
+
+class RedisTokenBucket:
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url)
+        self.script = self.client.register_script(TOKEN_BUCKET_SCRIPT)
+
+    def reserve(self, name: str, rate: float, burst: int) -> float:
+        return float(
+            self.script(keys=[f"{RATE_LIMIT_PREFIX}:bucket:{name}"], args=[rate, burst])
+        )
+
+
+@lru_cache(maxsize=None)
+def build_token_bucket(url: str) -> LocalTokenBucket | RedisTokenBucket:
+    if url:
+        return RedisTokenBucket(url)
+    return LocalTokenBucket()
+
+
+def get_token_bucket() -> LocalTokenBucket | RedisTokenBucket:
+    return build_token_bucket(settings.EMAIL_RATE_LIMIT_REDIS_URL)
+
+
+def get_rate_limit(email_type: EmailType) -> Optional[tuple[str, float, int]]:
+    limits = settings.EMAIL_RATE_LIMITS
+    name = email_type.name if email_type.name in limits else DEFAULT_BUCKET
+    limit = limits.get(name)
+
+    if not limit or limit["rate"] <= 0:
+        return None
+    return name, limit["rate"], limit["burst"]
+
+
+def rate_limit_stats_key(name: str, event: str) -> str:
+    return f"{RATE_LIMIT_PREFIX}:stats:{name}:{event}"
+
+
+def record_rate_limit_event(name: str, event: str, amount: int = 1) -> None:
+    key = rate_limit_stats_key(name, event)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, amount)
+
+
+def acquire_email_send_slot(
+    email_type: EmailType, sleep: Callable[[float], None] = time.sleep
+) -> float:
+    rate_limit = get_rate_limit(email_type)
+    if rate_limit is None:
+        return 0.0
+
+    name, rate, burst = rate_limit
+    try:
+        wait = get_token_bucket().reserve(name, rate, burst)
+    except redis.RedisError:
+        wait = build_token_bucket("").reserve(name, rate, burst)
+
+    record_rate_limit_event(name, "acquired")
+    if wait > 0:
+        record_rate_limit_event(name, "throttled")
+        record_rate_limit_event(name, "wait_ms", round(wait * 1000))
+        sleep(wait)
+
+    return wait
+
+
+def get_rate_limit_bucket_names() -> list[str]:
+    return sorted(settings.EMAIL_RATE_LIMITS)
+
+
+def get_rate_limit_stats() -> dict[str, dict[str, int]]:
+    names = get_rate_limit_bucket_names()
+    counts = cache.get_many(
+        [
+            rate_limit_stats_key(name, event)
+            for name in names
+            for event in RATE_LIMIT_EVENTS
+        ]
+    )
+    return {
+        name: {
+            event: counts.get(rate_limit_stats_key(name, event), 0)
+            for event in RATE_LIMIT_EVENTS
+        }
+        for name in names
+    }
+
+
+def reset_rate_limit_stats() -> None:
+    cache.delete_many(
+        [
+            rate_limit_stats_key(name, event)
+            for name in get_rate_limit_bucket_names()
+            for event in RATE_LIMIT_EVENTS
+        ]
+    )
@@ -0,0 +1,98 @@
+from datetime import date
+from typing import Optional
+
+from django.contrib.auth.models import User
+from django.db.models import Exists, F, OuterRef, QuerySet
+from django.utils import timezone
+
+from finance.models import EmailLog, EmailRun
+from finance.enums import EmailRunStatus, EmailType
+
+WEEKLY_EMAIL_TYPES = (EmailType.WEEKLY_REMINDER, EmailType.WEEKLY_SUMMARY)
+
+
+def email_period_key(email_type: EmailType, when: Optional[date] = None) -> str:
+    when = when or timezone.now().date()
+
+    if email_type in WEEKLY_EMAIL_TYPES:
+        year, week, _ = when.isocalendar()
+        return f"{year}-W{week:02d}"
+    if email_type == EmailType.MONTHLY_SUMMARY:
+        return f"{when.year}-{when.month:02d}"
+    return str(when.year)
+
+
+def start_email_run(email_type: EmailType, period_key: str) -> EmailRun:
+    run, _ = EmailRun.objects.get_or_create(
+        email_type=email_type.name, period_key=period_key
+    )
+    return run
+
+
+def delivered_logs(email_type: EmailType, period_key: str) -> QuerySet[EmailLog]:
+    return EmailLog.objects.filter(
+        email_type=email_type.name, period_key=period_key, success=True
+    )
+
+
+def exclude_delivered_users(
+    users: QuerySet[User], email_type: EmailType, period_key: str
+) -> QuerySet[User]:
+    return users.filter(
+        ~Exists(delivered_logs(email_type, period_key).filter(user_id=OuterRef("pk")))
+    )
+
+
+def get_delivered_user_ids(
+    email_type: EmailType, period_key: str, user_ids: list[int]
+) -> set[int]:
+    return set(
+        delivered_logs(email_type, period_key)
+        .filter(user_id__in=user_ids)
+        .order_by()
+        .values_list("user_id", flat=True)
+    )
+
+
+def begin_run_dispatch(run: EmailRun) -> int:
+    EmailRun.objects.filter(pk=run.pk).update(
+        dispatch_generation=F("dispatch_generation") + 1
+    )
+    run.refresh_from_db(fields=["dispatch_generation"])
+    return run.dispatch_generation
+
+
+def is_current_dispatch(run: EmailRun, generation: Optional[int]) -> bool:
+    return generation is None or run.dispatch_generation == generation
+
+
+def record_run_dispatch(
+    run: EmailRun, generation: int, user_count: int, batch_count: int
+) -> None:
+    EmailRun.objects.filter(pk=run.pk, dispatch_generation=generation).update(
+        user_count=F("sent_count") + user_count,
+        batch_count=F("completed_batches") + batch_count,
+    )
+    if not batch_count:
+        complete_email_run(run.run_id, generation)
+
+
+def checkpoint_email_run(
+    run: EmailRun, batch_totals: dict[str, int], generation: Optional[int] = None
+) -> None:
+    runs = EmailRun.objects.filter(pk=run.pk)
+    if generation is not None:
+        runs = runs.filter(dispatch_generation=generation)
+    runs.update(
+        completed_batches=F("completed_batches") + 1,
+        sent_count=F("sent_count") + batch_totals["sent"],
+        failed_count=F("failed_count") + batch_totals["failed"],
+        checkpointed_at=timezone.now(),
+    )
+
+
+def complete_email_run(run_id: str, generation: Optional[int] = None) -> None:
+    runs = EmailRun.objects.filter(run_id=run_id)
+    if generation is not None:
+        runs = runs.filter(dispatch_generation=generation)
+    runs.update(status=EmailRunStatus.COMPLETED.name, completed_at=timezone.now())
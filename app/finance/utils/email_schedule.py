@@ -0,0 +1,26 @@
+from datetime import date, datetime, timedelta
+from typing import Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+
+def is_last_day_of_month(day: date) -> bool:
+    return (day + timedelta(days=1)).day == 1
+
+
+def build_delivery_etas(
+    batch_count: int,
+    window_minutes: Optional[int] = None,
+    start: Optional[datetime] = None,
+) -> list[Optional[datetime]]:
+    if window_minutes is None:
+        window_minutes = settings.EMAIL_DELIVERY_WINDOW_MINUTES
+
+    if not window_minutes or batch_count <= 1:
+        return [None] * batch_count
+
+    start = start or timezone.now()
+    spacing = timedelta(minutes=window_minutes) / batch_count
+
+    return [None] + [start + spacing * index for index in range(1, batch_count)]
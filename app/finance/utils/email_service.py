@@ -1,40 +1,253 @@
-from django.core.mail import send_mail
+import hashlib
+from smtplib import SMTPServerDisconnected
+from typing import Optional, TypedDict
+
+from celery import current_app
+from django.core.mail import EmailMessage, EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
 from django.contrib.auth.models import User
 from django.conf import settings
+from django.db import transaction
 from finance.models.email_log import EmailLog
+from finance.models.email_run import EmailRun
 from finance.enums.email_enums import EmailType
+from finance.utils.email_rate_limit import acquire_email_send_slot
 
+RECONNECT_ERRORS = (SMTPServerDisconnected, ConnectionError, TimeoutError)
 
-def send_email_with_logging(
-    user: User, email_type: EmailType, subject: str, content: str
-) -> bool:
-    email_data = {"subject": subject, "content": content, "recipient": user.email}
+EMAIL_RECIPIENT_FIELDS = ("id", "username", "first_name", "email")
+
+RETRY_FAILED_EMAIL_TASK = "finance.tasks.email_retry_tasks.retry_failed_email"
+
+
+class PreparedEmail(TypedDict):
+    user: User
+    message: EmailMessage
+    template_params: dict
+
+
+def email_retry_countdown(attempt: int) -> int:
+    return min(
+        settings.EMAIL_RETRY_BACKOFF_SECONDS * 2 ** (attempt - 1),
+        settings.EMAIL_RETRY_BACKOFF_MAX_SECONDS,
+    )
+
+
+def schedule_email_retry(
+    user_id: int,
+    email_type: EmailType,
+    email_data: dict,
+    period_key: str = "",
+    run_id: Optional[str] = None,
+    attempt: int = 1,
+) -> None:
+    signature = current_app.signature(
+        RETRY_FAILED_EMAIL_TASK,
+        args=(email_type.name, user_id, email_data),
+        kwargs={"period_key": period_key, "run_id": run_id, "attempt": attempt},
+    )
+    transaction.on_commit(
+        lambda: signature.apply_async(countdown=email_retry_countdown(attempt))
+    )
+
+
+def build_email_message(
+    user: User, subject: str, content: str, html_content: Optional[str] = None
+) -> EmailMessage:
+    message = EmailMultiAlternatives(
+        subject=subject,
+        body=content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+    )
+    if html_content:
+        message.attach_alternative(html_content, "text/html")
+    return message
 
+
+def send_message_with_reconnect(
+    connection: BaseEmailBackend, message: EmailMessage
+) -> None:
     try:
-        send_mail(
-            subject=subject,
-            message=content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            fail_silently=False,
+        connection.open()
+        connection.send_messages([message])
+    except RECONNECT_ERRORS:
+        connection.close()
+        connection.open()
+        connection.send_messages([message])
+
+
+def get_html_alternative(message: EmailMessage) -> Optional[str]:
+    for content, mimetype in getattr(message, "alternatives", []):
+        if mimetype == "text/html":
+            return content
+    return None
+
+
+def send_stored_email(
+    user: User,
+    email_type: EmailType,
+    email_data: dict,
+    period_key: str = "",
+    run: Optional[EmailRun] = None,
+) -> None:
+    message = build_email_message(
+        user,
+        email_data["subject"],
+        email_data["content"],
+        email_data.get("html_content"),
+    )
+    acquire_email_send_slot(email_type)
+    message.send(fail_silently=False)
+
+    EmailLog.objects.create(
+        user=user,
+        email_type=email_type.name,
+        period_key=period_key,
+        run=run,
+        success=True,
+        email_data=build_email_log_data(
+            user, message, {}, settings.EMAIL_LOG_STORE_CONTENT
+        ),
+    )
+
+
+def build_email_log_data(
+    user: User, message: EmailMessage, template_params: dict, store_content: bool
+) -> dict:
+    email_data = {"subject": message.subject, "recipient": user.email}
+
+    if store_content:
+        email_data["content"] = message.body
+        html_content = get_html_alternative(message)
+        if html_content:
+            email_data["html_content"] = html_content
+    else:
+        email_data["content_hash"] = hashlib.sha256(
+            message.body.encode("utf-8")
+        ).hexdigest()
+        email_data["template_params"] = template_params
+
+    return email_data
+
+
+class EmailLogBuffer:
+    def __init__(self, batch_size: Optional[int] = None):
+        self.batch_size = batch_size or settings.EMAIL_LOG_BATCH_SIZE
+        self.entries: list[EmailLog] = []
+
+    def add(self, entry: EmailLog) -> None:
+        self.entries.append(entry)
+        if len(self.entries) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        if self.entries:
+            EmailLog.objects.bulk_create(self.entries, batch_size=self.batch_size)
+            self.entries = []
+
+
+def log_email_result(
+    log_buffer: EmailLogBuffer,
+    email_type: EmailType,
+    email: PreparedEmail,
+    error: Optional[Exception],
+    period_key: str = "",
+    run: Optional[EmailRun] = None,
+) -> bool:
+    user = email["user"]
+    message = email["message"]
+
+    if error is not None:
+        email_data = build_email_log_data(user, message, email["template_params"], True)
+        log_buffer.add(
+            EmailLog(
+                user=user,
+                email_type=email_type.name,
+                period_key=period_key,
+                run=run,
+                success=False,
+                error_message=str(error),
+                email_data=email_data,
+            )
+        )
+        schedule_email_retry(
+            user.id,
+            email_type,
+            email_data,
+            period_key,
+            str(run.run_id) if run else None,
         )
+        return False
 
-        EmailLog.objects.create(
+    log_buffer.add(
+        EmailLog(
             user=user,
             email_type=email_type.name,
+            period_key=period_key,
+            run=run,
             success=True,
-            email_data=email_data,
+            email_data=build_email_log_data(
+                user,
+                message,
+                email["template_params"],
+                settings.EMAIL_LOG_STORE_CONTENT,
+            ),
         )
+    )
+    return True
 
-        return True
 
-    except Exception as e:
-        EmailLog.objects.create(
-            user=user,
-            email_type=email_type.name,
-            success=False,
-            error_message=str(e),
-            email_data=email_data,
-        )
+def log_email_results(
+    email_type: EmailType,
+    emails: list[PreparedEmail],
+    errors: list[Optional[Exception]],
+    period_key: str = "",
+    run: Optional[EmailRun] = None,
+) -> dict[str, int]:
+    totals = {"sent": 0, "failed": 0}
+    log_buffer = EmailLogBuffer()
 
-        return False
+    for email, error in zip(emails, errors):
+        if log_email_result(log_buffer, email_type, email, error, period_key, run):
+            totals["sent"] += 1
+        else:
+            totals["failed"] += 1
+
+    log_buffer.flush()
+    return totals
+
+
+def send_emails_with_logging(
+    email_type: EmailType,
+    emails: list[PreparedEmail],
+    period_key: str = "",
+    run: Optional[EmailRun] = None,
+) -> dict[str, int]:
+    totals = {"sent": 0, "failed": 0}
+
+    if not emails:
+        return totals
+
+    connection = get_connection(fail_silently=False)
+    log_buffer = EmailLogBuffer()
+
+    try:
+        for email in emails:
+            try:
+                acquire_email_send_slot(email_type)
+                send_message_with_reconnect(connection, email["message"])
+            except Exception as e:
+                error = e
+            else:
+                error = None
+
+            if log_email_result(log_buffer, email_type, email, error, period_key, run):
+                totals["sent"] += 1
+            else:
+                totals["failed"] += 1
+    finally:
+        connection.close()
+        log_buffer.flush()
+
+    return totals
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+from typing import Optional
+
+from django.core.mail import get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+
+SMTP_REPLIES = {
+    b"EHLO": b"250 fake.smtp\r\n",
+    b"HELO": b"250 fake.smtp\r\n",
+    b"MAIL": b"250 OK\r\n",
+    b"RCPT": b"250 OK\r\n",
+    b"RSET": b"250 OK\r\n",
+    b"NOOP": b"250 OK\r\n",
+}
+
+
+class FakeSMTPServer:
+    def __init__(self, latency: float = 0.0, host: str = "127.0.0.1"):
+        self.latency = latency
+        self.host = host
+        self.port = 0
+        self.messages: list[bytes] = []
+        self.sessions = 0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.thread: Optional[threading.Thread] = None
+        self.ready = threading.Event()
+
+    def __enter__(self) -> "FakeSMTPServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        self.ready.wait()
+
+    def stop(self) -> None:
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.loop.stop)
+        if self.thread is not None:
+            self.thread.join()
+
+    def run(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        server = self.loop.run_until_complete(
+            asyncio.start_server(self.handle_session, self.host, 0)
+        )
+        self.port = server.sockets[0].getsockname()[1]
+        self.ready.set()
+
+        try:
+            self.loop.run_forever()
+        finally:
+            server.close()
+            self.loop.run_until_complete(server.wait_closed())
+            self.loop.close()
+
+    async def reply(self, writer: asyncio.StreamWriter, line: bytes) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        writer.write(line)
+        await writer.drain()
+
+    async def handle_session(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.sessions += 1
+        await self.reply(writer, b"220 fake.smtp ESMTP\r\n")
+
+        while line := await reader.readline():
+            command = line[:4].upper()
+
+            if command == b"QUIT":
+                await self.reply(writer, b"221 Bye\r\n")
+                break
+
+            if command == b"DATA":
+                await self.reply(writer, b"354 End data with <CR><LF>.<CR><LF>\r\n")
+                lines = []
+                while (data_line := await reader.readline()) not in (b".\r\n", b""):
+                    lines.append(data_line)
+                self.messages.append(b"".join(lines))
+                await self.reply(writer, b"250 OK queued\r\n")
+                continue
+
+            await self.reply(writer, SMTP_REPLIES.get(command, b"502 Unsupported\r\n"))
+
+        writer.close()
+
+    def get_connection(self) -> BaseEmailBackend:
+        return get_connection(
+            "django.core.mail.backends.smtp.EmailBackend",
+            host=self.host,
+            port=self.port,
+            username="",
+            password="",
+            use_tls=False,
+            use_ssl=False,
+            fail_silently=False,
+        )
@@ -0,0 +1,106 @@
+from decimal import Decimal
+
+from django.contrib.auth.models import User
+
+from finance.models import Budget
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.budget_calculator import (
+    BudgetLineItem,
+    calculate_net_transfers_for_budgets,
+    calculate_totals_for_budget_items,
+    build_unallocated_income,
+    build_budget_distribution,
+)
+from finance.utils.category_rollup import get_spent_by_category_for_month
+
+
+class MonthSnapshot:
+    def __init__(self, user: User, year: int, month: int):
+        self.user = user
+        self.year = year
+        self.month = month
+
+        self.budgets: list[Budget] = []
+        self.spent_cents: dict[tuple[str, str], int] = {}
+        self.net_transfer_cents: dict[int, int] = {}
+
+        self._load_budgets()
+        self._load_spending()
+        self._load_transfers()
+
+    def _load_budgets(self) -> None:
+        self.budgets = list(
+            Budget.objects.filter(
+                user=self.user, budget_year=self.year, budget_month=self.month
+            )
+        )
+
+    def _load_spending(self) -> None:
+        self.spent_cents = get_spent_by_category_for_month(
+            self.user, self.year, self.month
+        )
+
+    def _load_transfers(self) -> None:
+        self.net_transfer_cents = calculate_net_transfers_for_budgets(
+            [budget.id for budget in self.budgets]
+        )
+
+    def line_item_for_budget(self, budget: Budget) -> BudgetLineItem:
+        return BudgetLineItem(
+            budget,
+            self.spent_cents.get((budget.type, budget.category), 0),
+            budget.carried_over_amount_in_cents,
+            self.net_transfer_cents.get(budget.id, 0),
+        )
+
+    def budget_data(self) -> dict[str, list[dict]]:
+        budget_groups = {
+            transaction_type.value: [] for transaction_type in TransactionType
+        }
+
+        for budget in self.budgets:
+            budget_groups[TransactionType[budget.type].value].append(
+                self.line_item_for_budget(budget).to_dict()
+            )
+
+        return budget_groups
+
+    def budget_totals(self, budget_data: dict[str, list[dict]]) -> dict[str, dict]:
+        return {
+            budget_type: calculate_totals_for_budget_items(items)
+            for budget_type, items in budget_data.items()
+        }
+
+    def budgeted_cents_by_type(self) -> dict[str, int]:
+        totals = {}
+        for budget in self.budgets:
+            totals[budget.type] = totals.get(budget.type, 0) + budget.amount_in_cents
+        return totals
+
+    def unallocated_income(self) -> dict:
+        type_totals = self.budgeted_cents_by_type()
+        total_income_cents = type_totals.pop(TransactionType.INCOME.name, 0)
+        return build_unallocated_income(total_income_cents, sum(type_totals.values()))
+
+    def budget_distribution(self) -> dict:
+        return build_budget_distribution(self.budgeted_cents_by_type())
+
+    def total_by_types(self, types: list[TransactionType]) -> Decimal:
+        type_names = {t.name for t in types}
+        total_cents = sum(
+            total
+            for (type_name, _category), total in self.spent_cents.items()
+            if type_name in type_names
+        )
+        return Decimal(total_cents) / 100
+
+    def total_income(self) -> Decimal:
+        return self.total_by_types([TransactionType.INCOME])
+
+    def total_spent(self) -> Decimal:
+        return self.total_by_types(
+            [TransactionType.NEED, TransactionType.WANT, TransactionType.DEBTS]
+        )
+
+    def total_saved(self) -> Decimal:
+        return self.total_by_types([TransactionType.SAVINGS, TransactionType.INVESTING])
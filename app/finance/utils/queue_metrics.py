@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import Optional
+
+from django.core.cache import cache
+
+QUEUE_METRICS_PREFIX = "task_queue"
+QUEUE_LATENCY_EVENTS = ["started", "wait_ms", "max_wait_ms"]
+PUBLISHED_AT_HEADER = "published_at"
+
+
+def queue_metrics_key(queue_name: str, event: str) -> str:
+    return f"{QUEUE_METRICS_PREFIX}:{queue_name}:{event}"
+
+
+def get_task_wait(published_at: float, eta: Optional[str], now: float) -> float:
+    ready_at = published_at
+    if eta:
+        ready_at = max(ready_at, datetime.fromisoformat(eta).timestamp())
+    return max(0.0, now - ready_at)
+
+
+def increment_queue_metric(queue_name: str, event: str, amount: int = 1) -> None:
+    key = queue_metrics_key(queue_name, event)
+    try:
+        cache.incr(key, amount)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key, amount)
+
+
+def record_queue_latency(queue_name: str, wait: float) -> None:
+    wait_ms = round(wait * 1000)
+    increment_queue_metric(queue_name, "started")
+    increment_queue_metric(queue_name, "wait_ms", wait_ms)
+
+    max_key = queue_metrics_key(queue_name, "max_wait_ms")
+    if wait_ms > cache.get(max_key, 0):
+        cache.set(max_key, wait_ms, timeout=None)
+
+
+def get_queue_latency_stats(queue_names: list[str]) -> dict[str, dict[str, int]]:
+    counts = cache.get_many(
+        [
+            queue_metrics_key(queue_name, event)
+            for queue_name in queue_names
+            for event in QUEUE_LATENCY_EVENTS
+        ]
+    )
+    return {
+        queue_name: {
+            event: counts.get(queue_metrics_key(queue_name, event), 0)
+            for event in QUEUE_LATENCY_EVENTS
+        }
+        for queue_name in queue_names
+    }
+
+
+def reset_queue_latency_stats(queue_names: list[str]) -> None:
+    cache.delete_many(
+        [
+            queue_metrics_key(queue_name, event)
+            for queue_name in queue_names
+            for event in QUEUE_LATENCY_EVENTS
+        ]
+    )
@@ -0,0 +1,81 @@
+from collections import defaultdict
+from typing import Any, Iterable, Optional
+
+from finance.signals import carry_over_signals, dashboard_cache_signals
+from finance.utils.category_rollup import (
+    RollupKey,
+    apply_rollup_delta,
+    rollup_key_for_values,
+)
+from finance.utils.date_utils import to_date
+from finance.utils.user_activity import (
+    ActivityKey,
+    activity_key,
+    refresh_monthly_activity,
+)
+
+TransactionValues = dict[str, Any]
+TransactionChange = tuple[Optional[TransactionValues], Optional[TransactionValues]]
+
+TRANSACTION_CHANGE_FIELDS = [
+    "user_id",
+    "type",
+    "category",
+    "amount_in_cents",
+    "date_of_expense",
+]
+
+
+def transaction_change_values(instance: Any) -> TransactionValues:
+    return {field: getattr(instance, field) for field in TRANSACTION_CHANGE_FIELDS}
+
+
+def collect_rollup_deltas(
+    changes: Iterable[TransactionChange],
+) -> dict[RollupKey, list[int]]:
+    deltas: dict[RollupKey, list[int]] = defaultdict(lambda: [0, 0])
+
+    for original_values, current_values in changes:
+        if original_values is not None:
+            delta = deltas[rollup_key_for_values(original_values)]
+            delta[0] -= original_values["amount_in_cents"]
+            delta[1] -= 1
+        if current_values is not None:
+            delta = deltas[rollup_key_for_values(current_values)]
+            delta[0] += current_values["amount_in_cents"]
+            delta[1] += 1
+
+    return deltas
+
+
+def collect_activity_keys(changes: Iterable[TransactionChange]) -> set[ActivityKey]:
+    return {
+        activity_key(values["user_id"], to_date(values["date_of_expense"]))
+        for change in changes
+        for values in change
+        if values is not None
+    }
+
+
+def apply_transaction_changes(changes: list[TransactionChange]) -> set[ActivityKey]:
+    for key, (cents_delta, count_delta) in collect_rollup_deltas(changes).items():
+        if cents_delta or count_delta:
+            apply_rollup_delta(key, cents_delta, count_delta)
+
+    activity_keys = collect_activity_keys(changes)
+    for key in sorted(activity_keys):
+        refresh_monthly_activity(key)
+
+    return activity_keys
+
+
+def refresh_dependent_figures(months: Iterable[ActivityKey]) -> None:
+    earliest_months: dict[int, tuple[int, int]] = {}
+    for user_id, year, month in months:
+        earliest_months[user_id] = min(
+            earliest_months.get(user_id, (year, month)), (year, month)
+        )
+
+    for user_id, (year, month) in earliest_months.items():
+        dashboard_cache_signals.invalidate_dashboard_cache(user_id)
+        carry_over_signals.schedule_carry_over_refresh(user_id, year, month)
@@ -0,0 +1,213 @@
+import csv
+import json
+import zlib
+from datetime import date
+from typing import Any, Iterable, Iterator, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Q, QuerySet
+
+from finance.enums import ExportFormat, ExportStream
+from finance.models import Budget, InternalTransfer, Transaction
+
+EXPORT_FIELDS = {
+    ExportStream.TRANSACTIONS: [
+        "id",
+        "date_of_expense",
+        "type",
+        "category",
+        "amount_in_cents",
+    ],
+    ExportStream.BUDGETS: [
+        "id",
+        "budget_year",
+        "budget_month",
+        "type",
+        "category",
+        "amount_in_cents",
+        "carried_over_amount_in_cents",
+        "allow_carry_over",
+    ],
+    ExportStream.TRANSFERS: [
+        "id",
+        "transfer_date",
+        "source_budget_id",
+        "destination_budget_id",
+        "amount_in_cents",
+        "description",
+    ],
+}
+EXPORT_CONTENT_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+GZIP_CONTENT_TYPE = "application/gzip"
+CENTS_SUFFIX = "_in_cents"
+GZIP_WBITS = zlib.MAX_WBITS | 16
+CSV_EXTRA_STREAMS_ERROR = "Extra streams can only be exported as NDJSON."
+
+
+class EchoBuffer:
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_columns(stream: ExportStream) -> list[str]:
+    return ["record"] + [
+        field.removesuffix(CENTS_SUFFIX) for field in EXPORT_FIELDS[stream]
+    ]
+
+
+def csv_supports_streams(streams: Iterable[ExportStream]) -> bool:
+    return all(stream == ExportStream.TRANSACTIONS for stream in streams)
+
+
+def month_range_filter(start: Optional[date], end: Optional[date]) -> Q:
+    condition = Q()
+    if start:
+        condition &= Q(budget_year__gt=start.year) | Q(
+            budget_year=start.year, budget_month__gte=start.month
+        )
+    if end:
+        condition &= Q(budget_year__lt=end.year) | Q(
+            budget_year=end.year, budget_month__lte=end.month
+        )
+    return condition
+
+
+def date_range_filter(field: str, start: Optional[date], end: Optional[date]) -> Q:
+    condition = Q()
+    if start:
+        condition &= Q(**{f"{field}__gte": start})
+    if end:
+        condition &= Q(**{f"{field}__lte": end})
+    return condition
+
+
+def export_queryset(
+    user: User, stream: ExportStream, start: Optional[date], end: Optional[date]
+) -> QuerySet:
+    if stream == ExportStream.TRANSACTIONS:
+        return Transaction.objects.filter(
+            date_range_filter("date_of_expense", start, end), user=user
+        ).order_by("date_of_expense", "id")
+    if stream == ExportStream.BUDGETS:
+        return Budget.objects.filter(
+            month_range_filter(start, end), user=user
+        ).order_by("budget_year", "budget_month", "id")
+    return InternalTransfer.objects.filter(
+        date_range_filter("transfer_date", start, end), user=user
+    ).order_by("transfer_date", "id")
+
+
+def iter_export_rows(
+    user: User, stream: ExportStream, start: Optional[date], end: Optional[date]
+) -> Iterator[tuple]:
+    return (
+        export_queryset(user, stream, start, end)
+        .values_list(*EXPORT_FIELDS[stream])
+        .iterator(chunk_size=settings.TRANSACTION_EXPORT_CHUNK_SIZE)
+    )
+
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    return f"{sign}{abs(cents) // 100}.{abs(cents) % 100:02d}"
+
+
+def export_value(field: str, value: Any) -> Any:
+    if value is None:
+        return None
+    if field.endswith(CENTS_SUFFIX):
+        return format_cents(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def iter_export_lines(
+    user: User,
+    export_format: ExportFormat,
+    streams: Iterable[ExportStream],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+) -> Iterator[str]:
+    writer = csv.writer(EchoBuffer())
+
+    for stream in streams:
+        columns = export_columns(stream)
+        record = stream.name.lower()
+        if export_format == ExportFormat.CSV:
+            yield writer.writerow(columns)
+
+        for row in iter_export_rows(user, stream, start, end):
+            values = [record] + [
+                export_value(field, value)
+                for field, value in zip(EXPORT_FIELDS[stream], row)
+            ]
+            if export_format == ExportFormat.CSV:
+                yield writer.writerow(values)
+            else:
+                yield json.dumps(dict(zip(columns, values))) + "\n"
+
+
+def iter_export_blocks(lines: Iterable[str], block_bytes: int) -> Iterator[bytes]:
+    block: list[bytes] = []
+    size = 0
+
+    for line in lines:
+        encoded = line.encode("utf-8")
+        block.append(encoded)
+        size += len(encoded)
+        if size >= block_bytes:
+            yield b"".join(block)
+            block, size = [], 0
+
+    if block:
+        yield b"".join(block)
+
+
+def iter_gzip(blocks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=GZIP_WBITS)
+
+    for block in blocks:
+        compressed = compressor.compress(block)
+        if compressed:
+            yield compressed
+
+    yield compressor.flush()
+
+
+def stream_export(
+    user: User,
+    export_format: ExportFormat,
+    streams: Iterable[ExportStream],
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    compress: bool = False,
+) -> Iterator[bytes]:
+    streams = list(streams)
+    if export_format == ExportFormat.CSV and not csv_supports_streams(streams):
+        raise ValueError(CSV_EXTRA_STREAMS_ERROR)
+
+    blocks = iter_export_blocks(
+        iter_export_lines(user, export_format, streams, start, end),
+        settings.TRANSACTION_EXPORT_BLOCK_BYTES,
+    )
+    return iter_gzip(blocks) if compress else blocks
+
+
+def export_content_type(export_format: ExportFormat, compress: bool) -> str:
+    return GZIP_CONTENT_TYPE if compress else EXPORT_CONTENT_TYPES[export_format]
+
+
+def export_file_name(
+    export_format: ExportFormat,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    compress: bool = False,
+) -> str:
+    period = "".join(f"_{day.isoformat()}" for day in (start, end) if day)
+    extension = export_format.name.lower() + (".gz" if compress else "")
+    return f"transactions{period}.{extension}"
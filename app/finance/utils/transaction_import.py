@@ -0,0 +1,248 @@
+import csv
+import io
+import re
+from itertools import batched
+from typing import Any, Callable, Iterator, Optional, TextIO, TypedDict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import transaction as db_transaction
+from django.utils import timezone
+
+from finance.enums import ImportFormat, ImportStatus, TransactionType
+from finance.forms import TransactionForm
+from finance.models import Transaction, TransactionImport
+from finance.utils.transaction_changes import (
+    apply_transaction_changes,
+    refresh_dependent_figures,
+    transaction_change_values,
+)
+from finance.utils.user_activity import ActivityKey
+
+CSV_COLUMN_ALIASES = {"date": "date_of_expense"}
+OFX_TRANSACTION_PATTERN = re.compile(
+    r"<STMTTRN>(.*?)</STMTTRN>", re.IGNORECASE | re.DOTALL
+)
+OFX_READ_SIZE = 64 * 1024
+
+ImportRow = tuple[int, dict[str, str]]
+
+
+class RowError(TypedDict):
+    row: int
+    errors: dict[str, list[str]]
+
+
+class ImportResult(TypedDict):
+    processed: int
+    imported: int
+    failed: int
+    errors: list[RowError]
+
+
+def detect_import_format(file_name: str) -> ImportFormat:
+    if file_name.lower().endswith((".ofx", ".qfx")):
+        return ImportFormat.OFX
+    return ImportFormat.CSV
+
+
+def normalize_transaction_type(value: str) -> str:
+    normalized = value.strip().upper()
+    for transaction_type in TransactionType:
+        if normalized in (transaction_type.name, transaction_type.value.upper()):
+            return transaction_type.name
+    return value
+
+
+def iter_csv_rows(stream: TextIO) -> Iterator[ImportRow]:
+    reader = csv.DictReader(stream)
+    reader.fieldnames = [
+        CSV_COLUMN_ALIASES.get(name.strip().lower(), name.strip().lower())
+        for name in reader.fieldnames or []
+    ]
+
+    for row in reader:
+        data = {key: (value or "").strip() for key, value in row.items() if key}
+        data["type"] = normalize_transaction_type(data.get("type", ""))
+        yield reader.line_num, data
+
+
+def read_ofx_field(block: str, tag: str) -> str:
+    match = re.search(rf"<{tag}>([^<\r\n]*)", block, re.IGNORECASE)
+    return match.group(1).strip() if match else ""
+
+
+def parse_ofx_transaction(block: str, expense_type: TransactionType) -> dict[str, str]:
+    amount = read_ofx_field(block, "TRNAMT")
+    posted = read_ofx_field(block, "DTPOSTED")
+    category = read_ofx_field(block, "NAME") or read_ofx_field(block, "MEMO")
+
+    return {
+        "type": (
+            expense_type.name if amount.startswith("-") else TransactionType.INCOME.name
+        ),
+        "category": category[:100],
+        "amount": amount.lstrip("+-"),
+        "date_of_expense": (
+            f"{posted[:4]}-{posted[4:6]}-{posted[6:8]}" if len(posted) >= 8 else ""
+        ),
+    }
+
+
+def iter_ofx_rows(
+    stream: TextIO, expense_type: TransactionType = TransactionType.WANT
+) -> Iterator[ImportRow]:
+    buffer = ""
+    row_number = 0
+
+    for chunk in iter(lambda: stream.read(OFX_READ_SIZE), ""):
+        buffer += chunk
+        position = 0
+        for match in OFX_TRANSACTION_PATTERN.finditer(buffer):
+            row_number += 1
+            yield row_number, parse_ofx_transaction(match.group(1), expense_type)
+            position = match.end()
+        buffer = buffer[position:]
+
+
+def iter_import_rows(
+    stream: TextIO,
+    file_format: ImportFormat,
+    ofx_expense_type: TransactionType = TransactionType.WANT,
+) -> Iterator[ImportRow]:
+    if file_format == ImportFormat.OFX:
+        return iter_ofx_rows(stream, ofx_expense_type)
+    return iter_csv_rows(stream)
+
+
+def validate_import_rows(
+    user: User, rows: tuple[ImportRow, ...]
+) -> tuple[list[Transaction], list[RowError]]:
+    transactions = []
+    errors = []
+
+    for row_number, data in rows:
+        form = TransactionForm(data)
+        if form.is_valid():
+            transaction = form.save(commit=False)
+            transaction.user = user
+            transactions.append(transaction)
+        else:
+            errors.append(
+                {
+                    "row": row_number,
+                    "errors": {
+                        field: list(messages) for field, messages in form.errors.items()
+                    },
+                }
+            )
+
+    return transactions, errors
+
+
+@db_transaction.atomic
+def save_import_chunk(transactions: list[Transaction]) -> set[ActivityKey]:
+    Transaction.objects.bulk_create(transactions, batch_size=len(transactions) or 1)
+    return apply_transaction_changes(
+        [(None, transaction_change_values(transaction)) for transaction in transactions]
+    )
+
+
+def import_transactions(
+    user: User,
+    stream: TextIO,
+    file_format: ImportFormat,
+    chunk_size: Optional[int] = None,
+    on_progress: Optional[Callable[[ImportResult], None]] = None,
+    ofx_expense_type: TransactionType = TransactionType.WANT,
+) -> ImportResult:
+    result: ImportResult = {"processed": 0, "imported": 0, "failed": 0, "errors": []}
+    chunk_size = chunk_size or settings.TRANSACTION_IMPORT_CHUNK_SIZE
+    touched_months: set[ActivityKey] = set()
+
+    rows = iter_import_rows(stream, file_format, ofx_expense_type)
+    for chunk in batched(rows, chunk_size):
+        transactions, errors = validate_import_rows(user, chunk)
+        if transactions:
+            touched_months |= save_import_chunk(transactions)
+
+        result["processed"] += len(chunk)
+        result["imported"] += len(transactions)
+        result["failed"] += len(errors)
+        remaining_errors = settings.TRANSACTION_IMPORT_MAX_ERRORS - len(
+            result["errors"]
+        )
+        result["errors"].extend(errors[: max(remaining_errors, 0)])
+
+        if on_progress is not None:
+            on_progress(result)
+
+    refresh_dependent_figures(touched_months)
+    return result
+
+
+def open_import_stream(source: Any) -> TextIO:
+    return io.TextIOWrapper(
+        getattr(source, "file", source),
+        encoding="utf-8-sig",
+        errors="replace",
+        newline="",
+    )
+
+
+def record_import_progress(
+    transaction_import: TransactionImport, result: ImportResult
+) -> None:
+    TransactionImport.objects.filter(pk=transaction_import.pk).update(
+        processed_rows=result["processed"],
+        imported_rows=result["imported"],
+        failed_rows=result["failed"],
+        errors=result["errors"],
+    )
+
+
+def finish_transaction_import(
+    transaction_import: TransactionImport, status: ImportStatus
+) -> None:
+    TransactionImport.objects.filter(pk=transaction_import.pk).update(
+        status=status.name, completed_at=timezone.now()
+    )
+
+
+def run_transaction_import(
+    transaction_import: TransactionImport,
+    stream: TextIO,
+    chunk_size: Optional[int] = None,
+    ofx_expense_type: TransactionType = TransactionType.WANT,
+) -> ImportResult:
+    TransactionImport.objects.filter(pk=transaction_import.pk).update(
+        status=ImportStatus.RUNNING.name
+    )
+
+    try:
+        result = import_transactions(
+            transaction_import.user,
+            stream,
+            ImportFormat[transaction_import.file_format],
+            chunk_size,
+            lambda progress: record_import_progress(transaction_import, progress),
+            ofx_expense_type,
+        )
+    except Exception:
+        finish_transaction_import(transaction_import, ImportStatus.FAILED)
+        raise
+
+    finish_transaction_import(transaction_import, ImportStatus.COMPLETED)
+    return result
+
+
+def serialize_transaction_import(transaction_import: TransactionImport) -> dict:
+    return {
+        "import_id": str(transaction_import.import_id),
+        "status": transaction_import.status,
+        "file_name": transaction_import.file_name,
+        "processed": transaction_import.processed_rows,
+        "imported": transaction_import.imported_rows,
+        "failed": transaction_import.failed_rows,
+        "errors": transaction_import.errors,
+    }
@@ -0,0 +1,88 @@
+from datetime import date
+from typing import Optional, TypedDict
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db.models import Q, QuerySet
+
+from finance.models import Transaction
+from finance.utils.date_utils import month_date_range
+
+TRANSACTION_LIST_FIELDS = (
+    "id",
+    "type",
+    "category",
+    "amount_in_cents",
+    "date_of_expense",
+)
+MAX_TRANSACTION_PAGE_SIZE = 200
+
+TransactionCursor = tuple[date, int]
+
+
+class TransactionPage(TypedDict):
+    transactions: list[dict]
+    next_cursor: Optional[str]
+
+
+def encode_transaction_cursor(row: dict) -> str:
+    return f"{row['date_of_expense'].isoformat()}_{row['id']}"
+
+
+def decode_transaction_cursor(cursor: str) -> TransactionCursor:
+    cursor_date, _, cursor_id = cursor.partition("_")
+    return date.fromisoformat(cursor_date), int(cursor_id)
+
+
+def get_transaction_page_queryset(
+    user: User,
+    year: int,
+    month: int,
+    cursor: Optional[TransactionCursor] = None,
+) -> QuerySet:
+    start_date, end_date = month_date_range(year, month)
+    transactions = Transaction.objects.filter(
+        user=user, date_of_expense__gte=start_date, date_of_expense__lt=end_date
+    )
+
+    if cursor is not None:
+        cursor_date, cursor_id = cursor
+        transactions = transactions.filter(
+            Q(date_of_expense__lt=cursor_date)
+            | Q(date_of_expense=cursor_date, id__lt=cursor_id)
+        )
+
+    return transactions.order_by("-date_of_expense", "-id").values(
+        *TRANSACTION_LIST_FIELDS
+    )
+
+
+def get_transaction_page(
+    user: User,
+    year: int,
+    month: int,
+    cursor: Optional[TransactionCursor] = None,
+    limit: Optional[int] = None,
+) -> TransactionPage:
+    limit = min(limit or settings.TRANSACTION_PAGE_SIZE, MAX_TRANSACTION_PAGE_SIZE)
+    rows = list(get_transaction_page_queryset(user, year, month, cursor)[: limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    for row in rows:
+        row["amount"] = row.pop("amount_in_cents") / 100
+
+    return {
+        "transactions": rows,
+        "next_cursor": encode_transaction_cursor(rows[-1]) if has_more else None,
+    }
+
+
+def serialize_transaction_row(row: dict) -> dict:
+    return {
+        "id": row["id"],
+        "type": row["type"],
+        "category": row["category"],
+        "amount": row["amount"],
+        "date_of_expense": row["date_of_expense"].strftime("%Y-%m-%d"),
+    }
@@ -0,0 +1,159 @@
+from datetime import date
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.db import IntegrityError, transaction as db_transaction
+from django.db.models import Count, F, Max, Min, QuerySet
+from django.db.models.functions import ExtractMonth, ExtractYear, Greatest, Least
+from django.utils import timezone
+
+from finance.models import MonthlyUserActivity, Transaction
+from finance.utils.date_utils import month_date_range, to_date
+
+ActivityKey = tuple[int, int, int]
+ActivityValues = tuple[date, date, int]
+
+
+def activity_key(user_id: int, expense_date: date) -> ActivityKey:
+    return (user_id, expense_date.year, expense_date.month)
+
+
+def calculate_activity_from_transactions(
+    transactions: QuerySet[Transaction],
+) -> dict[ActivityKey, ActivityValues]:
+    grouped_activity = (
+        transactions.annotate(
+            expense_year=ExtractYear("date_of_expense"),
+            expense_month=ExtractMonth("date_of_expense"),
+        )
+        .values("user_id", "expense_year", "expense_month")
+        .annotate(
+            first_date=Min("date_of_expense"),
+            last_date=Max("date_of_expense"),
+            txn_count=Count("id"),
+        )
+        .order_by()
+    )
+
+    return {
+        (row["user_id"], row["expense_year"], row["expense_month"]): (
+            row["first_date"],
+            row["last_date"],
+            row["txn_count"],
+        )
+        for row in grouped_activity
+    }
+
+
+def record_transaction_activity(user_id: int, expense_date: date) -> None:
+    _, year, month = activity_key(user_id, expense_date)
+    activity = MonthlyUserActivity.objects.filter(
+        user_id=user_id, year=year, month=month
+    )
+    changes = {
+        "first_transaction_date": Least("first_transaction_date", expense_date),
+        "last_transaction_date": Greatest("last_transaction_date", expense_date),
+        "txn_count": F("txn_count") + 1,
+        "date_updated": timezone.now(),
+    }
+
+    if activity.update(**changes):
+        return
+
+    try:
+        with db_transaction.atomic():
+            MonthlyUserActivity.objects.create(
+                user_id=user_id,
+                year=year,
+                month=month,
+                first_transaction_date=expense_date,
+                last_transaction_date=expense_date,
+                txn_count=1,
+            )
+    except IntegrityError:
+        activity.update(**changes)
+
+
+def refresh_monthly_activity(key: ActivityKey) -> None:
+    user_id, year, month = key
+    start_date, end_date = month_date_range(year, month)
+    activity = calculate_activity_from_transactions(
+        Transaction.objects.filter(
+            user_id=user_id,
+            date_of_expense__gte=start_date,
+            date_of_expense__lt=end_date,
+        )
+    ).get(key)
+
+    if activity is None:
+        MonthlyUserActivity.objects.filter(
+            user_id=user_id, year=year, month=month
+        ).delete()
+        return
+
+    first_date, last_date, txn_count = activity
+    MonthlyUserActivity.objects.update_or_create(
+        user_id=user_id,
+        year=year,
+        month=month,
+        defaults={
+            "first_transaction_date": first_date,
+            "last_transaction_date": last_date,
+            "txn_count": txn_count,
+        },
+    )
+
+
+def apply_transaction_activity_change(
+    original_values: dict[str, Any] | None, current_values: dict[str, Any] | None
+) -> None:
+    original = (
+        (original_values["user_id"], to_date(original_values["date_of_expense"]))
+        if original_values
+        else None
+    )
+    current = (
+        (current_values["user_id"], to_date(current_values["date_of_expense"]))
+        if current_values
+        else None
+    )
+
+    if original == current:
+        return
+
+    if original is not None:
+        refresh_monthly_activity(activity_key(*original))
+        if current is not None and activity_key(*original) == activity_key(*current):
+            return
+
+    if current is not None:
+        record_transaction_activity(*current)
+
+
+@db_transaction.atomic
+def rebuild_activity_for_user(user: User) -> dict[str, int]:
+    expected = calculate_activity_from_transactions(
+        Transaction.objects.filter(user=user)
+    )
+    deleted_count, _ = MonthlyUserActivity.objects.filter(user=user).delete()
+
+    MonthlyUserActivity.objects.bulk_create(
+        [
+            MonthlyUserActivity(
+                user_id=user_id,
+                year=year,
+                month=month,
+                first_transaction_date=first_date,
+                last_transaction_date=last_date,
+                txn_count=txn_count,
+            )
+            for (user_id, year, month), (
+                first_date,
+                last_date,
+                txn_count,
+            ) in expected.items()
+        ],
+        batch_size=1000,
+    )
+
+    return {"deleted": deleted_count, "created": len(expected)}
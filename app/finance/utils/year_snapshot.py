@@ -0,0 +1,92 @@
+from decimal import Decimal
+from typing import Any
+
+from django.contrib.auth.models import User
+
+from finance.models import Budget
+from finance.enums.transaction_enums import TransactionType
+from finance.utils.year_aggregation import add_totals_and_average
+from finance.utils.category_rollup import get_rollups_for_year
+
+
+def cents_to_dollars(monthly_cents: list[int]) -> list[Decimal]:
+    return [Decimal(cents) / 100 for cents in monthly_cents]
+
+
+def sum_monthly_cents(rows: list[list[int]]) -> list[int]:
+    return [sum(month_values) for month_values in zip(*rows)] if rows else [0] * 12
+
+
+class YearSnapshot:
+    def __init__(self, user: User, year: int):
+        self.user = user
+        self.year = year
+
+        self.category_cents: dict[str, dict[str, list[int]]] = {
+            transaction_type.name: {} for transaction_type in TransactionType
+        }
+        self.has_transactions = False
+        self.has_budgets = False
+
+        self._load_transactions()
+        self._load_budget_categories()
+
+    @property
+    def has_data(self) -> bool:
+        return self.has_transactions or self.has_budgets
+
+    def _load_transactions(self) -> None:
+        rollups = (
+            get_rollups_for_year(self.user, self.year)
+            .order_by()
+            .values("type", "category", "month", "total_cents")
+        )
+
+        for rollup in rollups:
+            monthly_cents = self.category_cents[rollup["type"]].setdefault(
+                rollup["category"], [0] * 12
+            )
+            monthly_cents[rollup["month"] - 1] += rollup["total_cents"]
+            self.has_transactions = True
+
+    def _load_budget_categories(self) -> None:
+        budget_categories = (
+            Budget.objects.filter(user=self.user, budget_year=self.year)
+            .order_by()
+            .values_list("type", "category")
+            .distinct()
+        )
+
+        for type_name, category in budget_categories:
+            self.category_cents[type_name].setdefault(category, [0] * 12)
+            self.has_budgets = True
+
+    def monthly_cents_for_type(self, transaction_type: TransactionType) -> list[int]:
+        return sum_monthly_cents(
+            list(self.category_cents[transaction_type.name].values())
+        )
+
+    def type_breakdown(self) -> dict[str, list[Decimal]]:
+        return {
+            transaction_type.value: add_totals_and_average(
+                cents_to_dollars(self.monthly_cents_for_type(transaction_type))
+            )
+            for transaction_type in TransactionType
+        }
+
+    def category_breakdown(
+        self, transaction_type: TransactionType
+    ) -> dict[str, dict[str, Any]]:
+        result = {}
+
+        for category, monthly_cents in sorted(
+            self.category_cents[transaction_type.name].items()
+        ):
+            row = add_totals_and_average(cents_to_dollars(monthly_cents))
+            result[category] = {
+                "months": row[:12],
+                "total": row[12],
+                "average": row[13],
+            }
+
+        return result
@@ -4,18 +4,24 @@ from finance.views.year_review_view import year_review_view
 from finance.views.settings_views import settings_view
 from finance.views.budget_views import (
     create_budget,
+    copy_budgets,
     update_budget,
     get_budget,
     delete_budget,
     get_budget_categories,
     get_all_budgets,
+    get_budget_range,
 )
 from finance.views.transaction_views import (
     create_transaction,
     update_transaction,
     get_transaction,
+    list_transactions,
     delete_transaction,
 )
+from finance.views.import_views import import_transactions, get_transaction_import
+from finance.views.batch_views import batch_mutations
+from finance.views.export_views import export_transactions
 
 __all__ = [
     "login_view",
@@ -25,13 +31,20 @@ __all__ = [
     "year_review_view",
     "settings_view",
     "create_budget",
+    "copy_budgets",
     "update_budget",
     "get_budget",
     "delete_budget",
     "get_budget_categories",
     "get_all_budgets",
+    "get_budget_range",
     "create_transaction",
     "update_transaction",
     "get_transaction",
+    "list_transactions",
     "delete_transaction",
+    "import_transactions",
+    "get_transaction_import",
+    "batch_mutations",
+    "export_transactions",
 ]
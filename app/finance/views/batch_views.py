@@ -0,0 +1,19 @@
+from django.contrib.auth.decorators import login_required
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.views.decorators.http import require_http_methods
+
+from finance.utils.batch_mutations import parse_batch_operations, run_batch_mutations
+
+
+@login_required
+@require_http_methods(["POST"])
+def batch_mutations(request: HttpRequest) -> HttpResponse:
+    try:
+        operations = parse_batch_operations(request.body)
+    except ValueError as error:
+        return JsonResponse(
+            {"success": False, "errors": {"operations": [str(error)]}}, status=400
+        )
+
+    result = run_batch_mutations(request.user, operations)
+    return JsonResponse(result, status=200 if result["success"] else 400)
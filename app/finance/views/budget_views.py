@@ -4,12 +4,13 @@ from django.http import HttpRequest, HttpResponse, JsonResponse
 from django.views.decorators.http import require_http_methods
 
 from finance.models import Budget, Transaction
-from finance.forms import BudgetItemForm
+from finance.forms import BudgetCopyForm, BudgetItemForm, BudgetRangeForm
 from finance.enums.transaction_enums import TransactionType
 from finance.utils.budget_calculator import (
-    calculate_carry_over_for_budget,
-    calculate_net_transfers_for_budget,
+    calculate_net_transfers_for_budgets,
+    resolve_carry_over_chain,
 )
+from finance.utils.budget_upsert import copy_month_budgets
 
 
 @login_required
@@ -45,6 +46,27 @@ def create_budget(request: HttpRequest) -> HttpResponse:
     return JsonResponse({"success": False, "errors": form.errors}, status=400)
 
 
+@login_required
+@require_http_methods(["POST"])
+def copy_budgets(request: HttpRequest) -> HttpResponse:
+    form = BudgetCopyForm(request.POST)
+
+    if form.is_valid():
+        target_months = form.cleaned_data["target_months"]
+        budgets = copy_month_budgets(
+            request.user,
+            form.cleaned_data["source_year"],
+            form.cleaned_data["source_month"],
+            target_months,
+        )
+
+        return JsonResponse(
+            {"success": True, "copied": len(budgets), "months": len(target_months)}
+        )
+
+    return JsonResponse({"success": False, "errors": form.errors}, status=400)
+
+
 @login_required
 @require_http_methods(["POST"])
 def update_budget(request: HttpRequest, budget_id: int) -> HttpResponse:
@@ -114,16 +136,19 @@ def get_budget_categories(
 @login_required
 @require_http_methods(["GET"])
 def get_all_budgets(request: HttpRequest, year: int, month: int) -> HttpResponse:
-    budgets = Budget.objects.filter(
-        user=request.user, budget_year=year, budget_month=month
-    ).order_by("category")
+    budgets = list(
+        Budget.objects.filter(
+            user=request.user, budget_year=year, budget_month=month
+        ).order_by("category")
+    )
+    net_transfers = calculate_net_transfers_for_budgets(
+        [budget.id for budget in budgets]
+    )
 
     budget_list = []
     for budget in budgets:
-        carried_over_cents = calculate_carry_over_for_budget(
-            request.user, budget.category, budget.type, year, month
-        )
-        net_transfer_cents = calculate_net_transfers_for_budget(budget)
+        carried_over_cents = budget.carried_over_amount_in_cents
+        net_transfer_cents = net_transfers.get(budget.id, 0)
 
         available_cents = (
             budget.amount_in_cents + carried_over_cents + net_transfer_cents
@@ -140,3 +165,47 @@ def get_all_budgets(request: HttpRequest, year: int, month: int) -> HttpResponse
         )
 
     return JsonResponse({"success": True, "budgets": budget_list})
+
+
+@login_required
+@require_http_methods(["GET"])
+def get_budget_range(request: HttpRequest) -> HttpResponse:
+    form = BudgetRangeForm(request.GET)
+    if not form.is_valid():
+        return JsonResponse({"success": False, "errors": form.errors}, status=400)
+
+    months = form.cleaned_data["months"]
+    carry_overs = resolve_carry_over_chain(request.user, *months[0], *months[-1])
+    budgets = Budget.objects.filter(id__in=carry_overs).order_by(
+        "budget_year", "budget_month", "category"
+    )
+    net_transfers = calculate_net_transfers_for_budgets(list(carry_overs))
+
+    budgets_by_month = {month: [] for month in months}
+    for budget in budgets:
+        carried_over_cents = carry_overs[budget.id]
+        available_cents = (
+            budget.amount_in_cents
+            + carried_over_cents
+            + net_transfers.get(budget.id, 0)
+        )
+
+        budgets_by_month[(budget.budget_year, budget.budget_month)].append(
+            {
+                "id": budget.id,
+                "category": budget.category,
+                "type": budget.type,
+                "carried_over": f"{float(carried_over_cents) / 100:.2f}",
+                "available": f"{float(available_cents) / 100:.2f}",
+            }
+        )
+
+    return JsonResponse(
+        {
+            "success": True,
+            "months": [
+                {"year": year, "month": month, "budgets": month_budgets}
+                for (year, month), month_budgets in budgets_by_month.items()
+            ],
+        }
+    )
@@ -0,0 +1,37 @@
+from django.contrib.auth.decorators import login_required
+from django.http import HttpRequest, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_http_methods
+
+from finance.forms import TransactionExportForm
+from finance.enums import ExportFormat, ExportStream
+from finance.utils.transaction_export import (
+    export_content_type,
+    export_file_name,
+    stream_export,
+)
+
+
+@login_required
+@require_http_methods(["GET"])
+def export_transactions(request: HttpRequest) -> HttpResponse:
+    form = TransactionExportForm(request.GET)
+
+    if not form.is_valid():
+        return JsonResponse({"success": False, "errors": form.errors}, status=400)
+
+    export_format = ExportFormat[form.cleaned_data["file_format"] or "CSV"]
+    streams = [ExportStream.TRANSACTIONS] + [
+        ExportStream[name] for name in form.cleaned_data["include"]
+    ]
+    start = form.cleaned_data["start"]
+    end = form.cleaned_data["end"]
+    compress = form.cleaned_data["compress"]
+
+    response = StreamingHttpResponse(
+        stream_export(request.user, export_format, streams, start, end, compress),
+        content_type=export_content_type(export_format, compress),
+    )
+    response["Content-Disposition"] = (
+        f'attachment; filename="{export_file_name(export_format, start, end, compress)}"'
+    )
+    return response
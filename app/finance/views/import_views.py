@@ -0,0 +1,82 @@
+from django.conf import settings
+from django.shortcuts import get_object_or_404
+from django.contrib.auth.decorators import login_required
+from django.db import transaction as db_transaction
+from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.urls import reverse
+from django.views.decorators.http import require_http_methods
+
+from finance.models import TransactionImport
+from finance.forms import TransactionImportForm
+from finance.enums import ImportFormat, TransactionType
+from finance.tasks.import_tasks import import_transactions_file
+from finance.utils.transaction_import import (
+    detect_import_format,
+    open_import_stream,
+    run_transaction_import,
+    serialize_transaction_import,
+)
+
+
+@login_required
+@require_http_methods(["POST"])
+def import_transactions(request: HttpRequest) -> HttpResponse:
+    form = TransactionImportForm(request.POST, request.FILES)
+
+    if not form.is_valid():
+        return JsonResponse({"success": False, "errors": form.errors}, status=400)
+
+    upload = form.cleaned_data["file"]
+    file_format = form.cleaned_data["file_format"]
+    file_format = (
+        ImportFormat[file_format] if file_format else detect_import_format(upload.name)
+    )
+    ofx_expense_type = (
+        form.cleaned_data["ofx_expense_type"] or TransactionType.WANT.name
+    )
+
+    if upload.size > settings.TRANSACTION_IMPORT_ASYNC_BYTES:
+        transaction_import = TransactionImport.objects.create(
+            user=request.user,
+            file_format=file_format.name,
+            file_name=upload.name,
+            source=upload,
+        )
+        import_id = str(transaction_import.import_id)
+        db_transaction.on_commit(
+            lambda: import_transactions_file.delay(import_id, ofx_expense_type)
+        )
+
+        return JsonResponse(
+            {
+                "success": True,
+                **serialize_transaction_import(transaction_import),
+                "status_url": reverse(
+                    "get_transaction_import", kwargs={"import_id": import_id}
+                ),
+            },
+            status=202,
+        )
+
+    transaction_import = TransactionImport.objects.create(
+        user=request.user, file_format=file_format.name, file_name=upload.name
+    )
+    run_transaction_import(
+        transaction_import,
+        open_import_stream(upload),
+        ofx_expense_type=TransactionType[ofx_expense_type],
+    )
+    transaction_import.refresh_from_db()
+
+    return JsonResponse(
+        {"success": True, **serialize_transaction_import(transaction_import)}
+    )
+
+
+@login_required
+@require_http_methods(["GET"])
+def get_transaction_import(request: HttpRequest, import_id: str) -> HttpResponse:
+    transaction_import = get_object_or_404(
+        TransactionImport, import_id=import_id, user=request.user
+    )
+    return JsonResponse(serialize_transaction_import(transaction_import))
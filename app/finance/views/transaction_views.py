@@ -1,3 +1,5 @@
+from datetime import MAXYEAR, MINYEAR
+
 from django.shortcuts import get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse, JsonResponse
@@ -5,6 +7,11 @@ from django.views.decorators.http import require_http_methods
 
 from finance.models import Transaction
 from finance.forms import TransactionForm
+from finance.utils.transaction_listing import (
+    decode_transaction_cursor,
+    get_transaction_page,
+    serialize_transaction_row,
+)
 
 
 @login_required
@@ -50,6 +57,36 @@ def get_transaction(request: HttpRequest, transaction_id: int) -> HttpResponse:
     )
 
 
+@login_required
+@require_http_methods(["GET"])
+def list_transactions(request: HttpRequest, year: int, month: int) -> HttpResponse:
+    if not (1 <= month <= 12 and MINYEAR <= year < MAXYEAR):
+        return JsonResponse(
+            {"success": False, "errors": {"month": ["Invalid year or month."]}},
+            status=400,
+        )
+
+    try:
+        cursor = request.GET.get("cursor")
+        cursor = decode_transaction_cursor(cursor) if cursor else None
+        limit = int(request.GET.get("limit", 0))
+    except ValueError:
+        return JsonResponse(
+            {"success": False, "errors": {"cursor": ["Invalid cursor or limit."]}},
+            status=400,
+        )
+
+    page = get_transaction_page(request.user, year, month, cursor, max(limit, 0))
+    return JsonResponse(
+        {
+            "transactions": [
+                serialize_transaction_row(row) for row in page["transactions"]
+            ],
+            "next_cursor": page["next_cursor"],
+        }
+    )
+
+
 @login_required
 @require_http_methods(["POST", "DELETE"])
 def delete_transaction(request: HttpRequest, transaction_id: int) -> HttpResponse:
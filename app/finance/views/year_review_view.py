@@ -5,12 +5,8 @@ from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 from django.http import HttpRequest, HttpResponse
 
-from finance.utils.year_aggregation import (
-    get_budgets_for_year,
-    get_transactions_for_year,
-    aggregate_by_month_and_type,
-    aggregate_by_category_and_month,
-)
+from finance.utils.dashboard_cache import get_cached_dashboard_context
+from finance.utils.year_snapshot import YearSnapshot
 from finance.enums.transaction_enums import TransactionType
 
 
@@ -62,16 +58,13 @@ def get_type_rows() -> list:
 
 
 def build_year_review_context(user, year: int) -> dict:
-    budgets = get_budgets_for_year(user, year)
-    transactions = get_transactions_for_year(user, year)
-
-    type_breakdown = aggregate_by_month_and_type(budgets, transactions)
+    snapshot = YearSnapshot(user, year)
 
     category_breakdowns = {}
     for transaction_type in TransactionType:
         if transaction_type != TransactionType.INCOME:
-            category_breakdowns[transaction_type.value] = (
-                aggregate_by_category_and_month(budgets, transactions, transaction_type)
+            category_breakdowns[transaction_type.value] = snapshot.category_breakdown(
+                transaction_type
             )
 
     prev_year = get_previous_year(year)
@@ -81,11 +74,11 @@ def build_year_review_context(user, year: int) -> dict:
         "year": year,
         "prev_year": prev_year,
         "next_year": next_year,
-        "type_breakdown": type_breakdown,
+        "type_breakdown": snapshot.type_breakdown(),
         "category_breakdowns": category_breakdowns,
         "month_columns": get_month_columns(),
         "type_rows": get_type_rows(),
-        "has_data": budgets.exists() or transactions.exists(),
+        "has_data": snapshot.has_data,
     }
 
 
@@ -94,5 +87,10 @@ def year_review_view(request: HttpRequest, year: Optional[int] = None) -> HttpRe
     if year is None:
         year = get_current_year()
 
-    context = build_year_review_context(request.user, year)
+    context = get_cached_dashboard_context(
+        request.user.id,
+        "year_review",
+        (year,),
+        lambda: build_year_review_context(request.user, year),
+    )
     return render(request, "year_review.html", context)